@@ -20,7 +20,7 @@ Technologie-Stack:
 - market_engine für Exchange-Connection und Pattern-Detection
 """
 import dash
-from dash import dcc, html, Input, Output, callback, dash_table
+from dash import dcc, html, Input, Output, State, callback, dash_table
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import pandas as pd
@@ -32,7 +32,7 @@ from flask import request
 
 # Import your existing engine and settings
 from core.market_engine import market_engine
-from config.settings import UI_CONFIG, PATTERN_CONFIG, CHART_CONFIG
+from config.settings import UI_CONFIG, PATTERN_CONFIG, CHART_CONFIG, CACHE_CONFIG
 
 # Initialize Dash app
 app = dash.Dash(__name__)
@@ -104,6 +104,9 @@ def get_layout():
         if info.get('status') == 'loading':
             status_class = "loading"
             status_icon = "⏳"
+        elif info.get('status') == 'idle':
+            status_class = "idle"
+            status_icon = "💤"
         elif info.get('status') == 'online':
             status_class = "online"
             status_icon = "✅"
@@ -136,6 +139,14 @@ def get_layout():
     # Speicherort für Exchange-Status - ermöglicht Aktualisierungen ohne Page-Reload
     exchange_status_store = dcc.Store(id='exchange-status-store', data={})
 
+    # Re-Render nach Stale-While-Revalidate: pollt nur, solange der Chart stale ist
+    revalidate_interval = dcc.Interval(
+        id='revalidate-interval',
+        interval=UI_CONFIG['clock_interval'],
+        n_intervals=0,
+        disabled=True
+    )
+
     # Interval für Background-Thread-Kommunikation
     exchange_interval = dcc.Interval(
         id='exchange-update-interval',
@@ -341,6 +352,7 @@ def get_layout():
         interval,
         exchange_interval,  # Background-Thread Monitoring
         exchange_status_store,  # Zentraler Status-Speicher
+        revalidate_interval,  # Re-Render wenn frische Daten da sind
         html.Div([trading_panel, news_sidebar], className="main-container"),
         status_bar
     ])
@@ -428,21 +440,28 @@ app.layout = get_layout()
 @app.callback(
     [Output("main-chart", "figure"),
      Output("pattern-summary", "children"),
-     Output("pattern-count-badge", "children")],  # Filter-Input
-    Input("analyze-btn", "n_clicks"),
+     Output("pattern-count-badge", "children"),
+     Output("revalidate-interval", "disabled"),
+     Output("revalidate-interval", "max_intervals")],  # Filter-Input
+    [Input("analyze-btn", "n_clicks"),
+     Input("revalidate-interval", "n_intervals")],
     [Input("symbol-dropdown", "value"),
      Input("timeframe-dropdown", "value"),
      Input("limit-input", "value"),
      Input("exchange-dropdown", "value")],
     [Input("pattern-type-filter", "value"),  # Filter-Input
      Input("direction-filter", "value"),  # Filter-Input
-     Input("strength-filter", "value")]  # Filter-Input
+     Input("strength-filter", "value")],  # Filter-Input
+    [State("revalidate-interval", "max_intervals")]
 )
-def analyze_symbol(n_clicks, symbol, timeframe, limit, exchange, pattern_types, directions, min_strength):
+def analyze_symbol(n_clicks, n_revalidate, symbol, timeframe, limit, exchange, pattern_types, directions, min_strength,
+                   max_revalidate):
     """
        Hauptanalyse-Callback für Trading-Symbole.
 
-       Wird ausgelöst durch den ANALYZE-Button. Holt OHLCV-Daten vom Market Engine,
+       Wird ausgelöst durch den ANALYZE-Button (oder das Revalidate-Interval,
+       solange ein Stale-Chart angezeigt wird – max. ``revalidate_max_polls``
+       Versuche, danach bleibt der Stale-Hinweis stehen). Holt OHLCV-Daten vom Market Engine,
        detektiert Patterns und generiert Chart-Visualisierung mit gefilterten
        Pattern-Overlays basierend auf Benutzereinstellungen.
 
@@ -455,17 +474,20 @@ def analyze_symbol(n_clicks, symbol, timeframe, limit, exchange, pattern_types,
            pattern_types (list/str): Liste der zu zeigenden Pattern-Typen oder "all"
            directions (list): Zu filternde Richtungen (bullish, bearish, etc.)
            min_strength (float): Minimale Signalstärke (0.0-1.0)
+           max_revalidate (int): Aktuelles ``max_intervals`` des Revalidate-Intervals
 
        Returns:
-           tuple: (Chart-Figure, Pattern-Summary, Pattern-Count)
+           tuple: (Chart-Figure, Pattern-Summary, Pattern-Count, Revalidate-Interval disabled,
+           Revalidate-Interval max_intervals)
        """
 
     if not n_clicks:
-        return create_placeholder_chart(), html.Div(), 0  # Nullwert für Counter
+        return create_placeholder_chart(), html.Div(), 0, True, dash.no_update  # Nullwert für Counter
     # Keine Exchanges verfügbar? Early return
-    if not symbol or all(isinstance(ex, dict) for ex in market_engine.exchanges.values()):
+    if not symbol or all(isinstance(ex, dict) and ex.get('status') != 'idle'
+                         for ex in market_engine.exchanges.values()):
         return create_loading_chart(), html.Div("Exchanges werden geladen...",
-                                                style={"color": "#ffaa00", "padding": "16px"}), 0  # Nullwert für Counter
+                                                style={"color": "#ffaa00", "padding": "16px"}), 0, True, dash.no_update  # Nullwert für Counter
 
     try:
         # Use your existing market engine (unchanged!)
@@ -476,10 +498,11 @@ def analyze_symbol(n_clicks, symbol, timeframe, limit, exchange, pattern_types,
             return create_error_chart(f"No data found for {symbol}"), html.Div(
                 f"❌ No data found for {symbol}",
                 style={"color": "#f44336", "padding": "16px"}
-            ), 0  # Nullwert für Counter
+            ), 0, True, dash.no_update  # Nullwert für Counter
 
-        # Detect patterns using your existing engine
-        patterns = market_engine.detect_patterns(df)
+        # Detect patterns using your existing engine (spaltenweise SignalTable,
+        # beim Refresh desselben Charts werden nur neue Candles gescannt)
+        signals = market_engine.detect_signals(df, series_key=(symbol, timeframe, ex, limit))
 
         # •••••••••••••••••••••••••• Filter patterns •••••••••••••••••••••••••• #
         if pattern_types != "all":
@@ -487,12 +510,12 @@ def analyze_symbol(n_clicks, symbol, timeframe, limit, exchange, pattern_types,
         else:
             pattern_filter = None  # Alle Pattern-Typen
 
-        filtered_patterns = market_engine.filter_patterns(
-            patterns,
+        # Vektorisiert filtern, Dicts nur für die angezeigten Signale bauen
+        filtered_patterns = signals.filter(
             min_strength=min_strength,
             directions=directions,
             pattern_types=pattern_filter
-        )
+        ).to_dicts()
 
         # Create chart
         fig = create_professional_chart(df, filtered_patterns, symbol, timeframe)
@@ -500,16 +523,39 @@ def analyze_symbol(n_clicks, symbol, timeframe, limit, exchange, pattern_types,
         # Create pattern summary
         summary = create_pattern_summary(filtered_patterns, len(df))
 
+        # Stale-Daten kennzeichnen, Interval pollt bis der Hintergrund-Refresh fertig ist –
+        # aber nur begrenzt oft (Exchange down → Refresh scheitert bei jedem Versuch)
+        stale = df.attrs.get('stale', False)
+        polled = any(t['prop_id'] == 'revalidate-interval.n_intervals'
+                     for t in dash.callback_context.triggered)
+        n_revalidate = n_revalidate or 0
+        max_polls = dash.no_update
+        gave_up = False
+        if stale and not polled:
+            # Neue Poll-Runde ab dem aktuellen Zählerstand
+            max_polls = n_revalidate + CACHE_CONFIG['revalidate_max_polls']
+        elif stale:
+            gave_up = max_revalidate is not None and 0 <= max_revalidate <= n_revalidate
+
+        if stale:
+            age = df.attrs.get('age_seconds', 0)
+            notice = (f"⚠️ Daten {age:.0f}s alt – Aktualisierung fehlgeschlagen" if gave_up
+                      else f"⏳ Daten {age:.0f}s alt – Aktualisierung läuft...")
+            summary = html.Div([
+                html.Div(notice, style={"color": "#ffaa00", "padding": "8px 16px"}),
+                summary
+            ])
+
         # Total Patterns = all filtered patterns
         total_patterns = sum(len(signals) for signals in filtered_patterns.values())
 
-        return fig, summary, total_patterns
+        return fig, summary, total_patterns, not stale or gave_up, max_polls
 
     except Exception as e:
         return create_error_chart(f"Error: {str(e)}"), html.Div(
             f"❌ Error: {str(e)}",
             style={"color": "#f44336", "padding": "16px"}
-        ), 0  # Nullwert für Counter
+        ), 0, True, dash.no_update  # Nullwert für Counter
 
 
 # Shutdown Callback
@@ -827,7 +873,7 @@ def update_time(n):
 # Exchange-Status in Echtzeit aktualisieren
 @app.callback(
     [Output('exchange-status-store', 'data')] +
-    [Output(f'exchange-status-{name}', 'children') for name in ['binance', 'coinbase', 'kraken', 'bybit', 'okx']],
+    [Output(f'exchange-status-{name}', 'children') for name in market_engine.exchanges],
     Input('exchange-update-interval', 'n_intervals')
 )
 def update_exchange_status(n):
@@ -849,13 +895,19 @@ def update_exchange_status(n):
 
     # Status-Updates für jeden Exchange generieren
     outputs = []
-    for name in ['binance', 'coinbase', 'kraken', 'bybit', 'okx']:
+    for name in market_engine.exchanges:
         info = exchange_info.get(name, {'status': 'offline'})
 
         # Visuelles Feedback basierend auf Status
         if info.get('status') == 'loading':
             status_icon = "⏳"
             status_class = "loading"
+        elif info.get('status') == 'idle':
+            status_icon = "💤"
+            status_class = "idle"
+        elif info.get('status') == 'online' and info.get('health') == 'degraded':
+            status_icon = "⚠️"
+            status_class = "degraded"
         elif info.get('status') == 'online':
             status_icon = "✅"
             status_class = "online"
@@ -863,15 +915,28 @@ def update_exchange_status(n):
             status_icon = "❌"
             status_class = "offline"
 
-        # DOM-Element für jeweiligen Exchange aktualisieren
+        # DOM-Element für jeweiligen Exchange aktualisieren (Health als Tooltip)
         outputs.append(html.Span([
             html.Span(className=f"exchange-dot {status_class}"),
             f"{name.title()}"
-        ]))
+        ], title=format_exchange_health(info)))
 
     # Ersten Output für Store, restliche für Exchange-Indikatoren
     return [exchange_info] + outputs
 
+def format_exchange_health(info):
+    """Tooltip-Text mit Live-Health eines Exchanges (Latenz, Fehler-/Rate-Limit-Quote)"""
+    if info.get('status') != 'online':
+        return info.get('error', info.get('status', 'offline'))
+    if not info.get('requests'):
+        return f"online · {info.get('markets', 0):,} markets · noch keine Requests"
+
+    latency = info.get('latency_ms')
+    latency_text = f"{latency} ms" if latency is not None else "n/a"
+    return (f"{info['health']} · Ø {latency_text} · "
+            f"Fehler {info['error_rate']:.0%} · Rate-Limit {info['rate_limited_rate']:.0%} · "
+            f"{info['requests']} Requests")
+
 # Exchange-Dropdown dynamisch aktualisieren, wenn neue Exchanges bereit
 @app.callback(
     Output("exchange-dropdown", "options"),
@@ -881,7 +946,7 @@ def update_exchange_dropdown(exchange_info):
     """
     Aktualisiert die Exchange-Dropdown-Optionen basierend auf Online-Status.
 
-    Zeigt nur Exchanges an, die erfolgreich verbunden und online sind.
+    Zeigt Exchanges an, die online sind oder bei Auswahl geladen werden (idle).
 
     Args:
         exchange_info (dict): Aktueller Status aller Exchanges
@@ -889,9 +954,9 @@ def update_exchange_dropdown(exchange_info):
     Returns:
         list: Liste von Dropdown-Optionen für verfügbare Exchanges
     """
-    # Nur Online-Exchanges anzeigen
+    # Online- und Lazy-Exchanges anzeigen
     online_exchanges = [name for name, info in exchange_info.items()
-                        if info.get('status') == 'online']
+                        if info.get('status') in ('online', 'idle')]
 
     # Dropdown-Optionen generieren
     options = [{"label": "Auto", "value": "auto"}]
@@ -899,6 +964,39 @@ def update_exchange_dropdown(exchange_info):
 
     return options
 
+# Symbol-Typeahead: Optionen serverseitig aus der Markets-Registry suchen
+@app.callback(
+    Output("symbol-dropdown", "options"),
+    Input("symbol-dropdown", "search_value"),
+    [State("symbol-dropdown", "value"),
+     State("exchange-dropdown", "value")]
+)
+def update_symbol_options(search_value, current_symbol, exchange):
+    """
+    Liefert passende Symbole zur Eingabe im Symbol-Dropdown.
+
+    Statt tausende Pairs an den Browser zu schicken, enthält das Dropdown
+    nur die Treffer der aktuellen Eingabe (plus das gewählte Symbol, damit
+    die Auswahl sichtbar bleibt).
+
+    Args:
+        search_value (str): Aktuelle Eingabe im Dropdown
+        current_symbol (str): Aktuell gewähltes Symbol
+        exchange (str): Gewählter Exchange ('auto' = alle)
+
+    Returns:
+        list: Dropdown-Optionen für die Treffer
+    """
+    if not search_value:
+        return dash.no_update
+
+    ex = None if exchange in (None, 'auto') else exchange
+    symbols = market_engine.search_symbols(search_value, exchange=ex)
+    if current_symbol and current_symbol not in symbols:
+        symbols.append(current_symbol)
+
+    return [{"label": symbol, "value": symbol} for symbol in symbols]
+
 # Market Stats Callback - Status Bar aktualisieren
 @app.callback(
     [Output("market-cap-value", "children"),
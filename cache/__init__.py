@@ -2,8 +2,6 @@
 """
 Cache-System für Krypto-OHLCV-Daten
 """
-import self as self
-
 from .cache_manager import CryptoDataCache, cache_instance
 
 # Globale Instanz erstellen
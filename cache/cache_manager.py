@@ -82,6 +82,19 @@ class CryptoDataCache:
                 CREATE INDEX IF NOT EXISTS idx_{tf}_date ON {table_name} (date)
                 ''')
 
+            # Fortschritt von Backfill-Jobs (fertige Seiten → Resume nach Abbruch)
+            conn.execute('''
+            CREATE TABLE IF NOT EXISTS backfill_pages (
+                asset_id TEXT,
+                timeframe TEXT,
+                exchange TEXT,
+                page_start INTEGER,
+                rows INTEGER,
+                completed_at TIMESTAMP,
+                PRIMARY KEY (asset_id, timeframe, exchange, page_start)
+            )
+            ''')
+
             conn.commit()
             print("[Cache] DB-Schema initialisiert")
 
@@ -150,6 +163,77 @@ class CryptoDataCache:
             meta_json
         ))
 
+    def upsert_ohlcv(self, identifier: str, timeframe: str, df: pd.DataFrame) -> int:
+        """
+        Schreibt OHLCV-Zeilen per INSERT OR REPLACE (thread-safe)
+
+        Überlappende Candles (gleiche asset_id + date) werden ersetzt statt
+        doppelt gespeichert, daher dürfen Seiten in beliebiger Reihenfolge kommen.
+
+        Args:
+            identifier: Asset-ID (z.B. "BTC/USDT")
+            timeframe: Timeframe-Tabelle ("1h", "1d", "3d", "1w", "1M")
+            df: DataFrame mit timestamp (ms), open, high, low, close, volume
+
+        Returns:
+            int: Anzahl geschriebener Zeilen
+
+        Raises:
+            sqlite3.Error: Schreibfehler werden weitergereicht, damit ein
+                Backfill die Seite nicht als erledigt vermerkt
+        """
+        if df.empty:
+            return 0
+
+        tf_key = timeframe.replace('M', 'm')
+        dates = pd.to_datetime(df['timestamp'], unit='ms').dt.strftime('%Y-%m-%d %H:%M:%S')
+        rows = list(zip([identifier] * len(df), dates,
+                        df['open'].astype(float), df['high'].astype(float),
+                        df['low'].astype(float), df['close'].astype(float),
+                        df['volume'].astype(float)))
+
+        conn = self._get_connection()
+        try:
+            conn.executemany(f'''
+            INSERT OR REPLACE INTO ohlcv_{tf_key} (asset_id, date, open, high, low, close, volume)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', rows)
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            print(f"[Cache] Upsert-Fehler: {e}")
+            raise
+        return len(rows)
+
+    def mark_backfill_page(self, identifier: str, timeframe: str, exchange: str,
+                           page_start: int, rows: int):
+        """Merkt eine vollständig geladene Backfill-Seite (thread-safe)"""
+        try:
+            conn = self._get_connection()
+            conn.execute('''
+            INSERT OR REPLACE INTO backfill_pages
+                (asset_id, timeframe, exchange, page_start, rows, completed_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ''', (identifier, timeframe, exchange, page_start, rows, datetime.now().isoformat()))
+            conn.commit()
+
+        except Exception as e:
+            print(f"[Cache] Backfill-Fortschritt Fehler: {e}")
+
+    def get_backfilled_pages(self, identifier: str, timeframe: str, exchange: str) -> set:
+        """Startzeitpunkte (ms) bereits geladener Backfill-Seiten (thread-safe)"""
+        try:
+            conn = self._get_connection()
+            cursor = conn.execute('''
+            SELECT page_start FROM backfill_pages
+            WHERE asset_id = ? AND timeframe = ? AND exchange = ?
+            ''', (identifier, timeframe, exchange))
+            return {row[0] for row in cursor.fetchall()}
+
+        except Exception as e:
+            print(f"[Cache] Backfill-Fortschritt Fehler: {e}")
+            return set()
+
     def get_cached_data(self, identifier: str, timeframe: str = "1d") -> Optional[pd.DataFrame]:
         """Lädt gecachte Daten (thread-safe)"""
         tf_key = timeframe.replace('M', 'm')
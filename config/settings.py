@@ -40,6 +40,66 @@ EXCHANGE_CONFIG = {
         'enableRateLimit': True,
     }
 }
+
+def _env_list(name: str, default: str = '') -> List[str]:
+    """Komma-getrennte ENV-Liste (z.B. EXCHANGES=binance,kraken)"""
+    return [item.strip() for item in os.getenv(name, default).split(',') if item.strip()]
+
+# Welche Exchanges dieser Prozess bedient und welche beim Start geladen werden.
+# Alle anderen werden erst beim ersten Zugriff geladen und nach Leerlauf wieder entladen.
+EXCHANGE_LOADING_CONFIG = {
+    'exchanges': _env_list('EXCHANGES') or list(EXCHANGE_CONFIG),  # Bediente Exchanges
+    'eager': _env_list('EAGER_EXCHANGES', 'binance'),  # Sofort laden ('*' = alle)
+    'idle_unload_seconds': 1800,  # Lazy Exchanges nach 30 min ohne Nutzung entladen (0 = nie)
+    'idle_check_seconds': 60,     # Prüfintervall des Idle-Sweepers
+    'unload_eager': False,        # Auch Eager-Exchanges entladen
+}
+
+# Token-Bucket Scheduler der MarketEngine (ersetzt ccxt enableRateLimit)
+RATE_LIMIT_CONFIG = {
+    'enabled': True,
+    'burst': 2,                  # Requests, die ein Exchange am Stück bekommen darf
+    'default_rate_limit': 1000,  # ms pro Request für Exchanges ohne rateLimit
+    'max_workers': 16,           # Threads für get_ohlcv_many
+}
+
+# Hedged Requests: langsamer Primary → gleiche Anfrage parallel an nächsten Exchange
+HEDGE_CONFIG = {
+    'enabled': False,            # Default für get_ohlcv(hedge=None)
+    'latency_percentile': 95,    # Hedge feuert, wenn Primary langsamer als dieses Perzentil ist
+    'default_delay': 1.0,        # Sekunden, solange zu wenig Latenz-Messungen vorliegen
+    'min_delay': 0.2,            # Untergrenze, damit nicht jeder Request doppelt läuft
+    'min_samples': 10,           # Messungen, ab denen das Perzentil genutzt wird
+    'max_workers': 8,            # Threads für parallele Hedge-Requests
+}
+
+# Adaptives Routing: Reihenfolge nach erwarteter Antwortzeit (EWMA-Telemetrie)
+ROUTING_CONFIG = {
+    'ewma_alpha': 0.2,           # Gewicht der neuesten Messung
+    'default_latency': 1.0,      # Angenommene Latenz (s) für Exchanges ohne Messungen
+    'error_penalty': 10.0,       # Strafzuschlag (s) bei Fehlerquote 1.0
+    'rate_limit_penalty': 5.0,   # Strafzuschlag (s) bei Rate-Limit-Quote 1.0
+    'latency_samples': 200,      # Rohwerte pro Exchange für Perzentile (Hedging)
+    'degraded_error_rate': 0.25, # Ab dieser Fehler-/Rate-Limit-Quote gilt ein Exchange als 'degraded'
+    'degraded_latency': 3.0,     # Ab dieser EWMA-Latenz (s) gilt ein Exchange als 'degraded'
+}
+
+# Circuit Breaker pro Exchange + Negative-Cache für tote (Exchange, Symbol, Timeframe)-Routen
+CIRCUIT_BREAKER_CONFIG = {
+    'failure_threshold': 5,          # Aufeinanderfolgende Fehler bis der Breaker öffnet
+    'cooldown_seconds': 60,          # Wartezeit bis zum Half-Open-Probe
+    'negative_ttl_seconds': 3600,    # Wie lange BadSymbol/leere Antworten gemerkt werden
+    'negative_cache_entries': 4096,  # Max. gemerkte tote Routen
+}
+
+# Symbol-Index: Unified Symbol → Exchanges, die es listen
+SYMBOL_INDEX_CONFIG = {
+    'quote_aliases': [
+        ['USDT', 'USD', 'USDC'],     # Gleichwertige Quotes als Ausweichroute
+    ],
+    'use_aliases': True,             # Alias-Routen nutzen, wenn kein Exchange das exakte Pair listet
+    'search_limit': 50,              # Max. Treffer der Symbol-Suche (Dropdown-Typeahead)
+}
 # endregion
 
 # ==============================================================================
@@ -176,6 +236,14 @@ PATTERN_CONFIG = {
         #Chart-Patterns
     }
 }
+
+# Inkrementelle Pattern-Erkennung: beim Chart-Refresh nur neue Candles scannen
+INCREMENTAL_DETECTION_CONFIG = {
+    'enabled': True,
+    'warmup_candles': 200,         # Vorlauf für RSI/MACD (rekursive Glättung) vor dem neu gescannten Teil
+    'max_series': 256,             # Max. Serien mit gemerktem Zustand (LRU)
+    'state_ttl_seconds': 3600,     # Zustand unbenutzter Serien verfällt
+}
 # endregion
 
 # ==============================================================================
@@ -183,10 +251,67 @@ PATTERN_CONFIG = {
 # ==============================================================================
 CACHE_CONFIG = {
     'enabled': True,
-    'ttl_seconds': 300,  # 5 Minuten
+    'ttl_seconds': 300,  # 5 Minuten (Fallback für unbekannte Timeframes)
+    'ttl_grace_seconds': 10,  # Puffer nach Candle-Close, bis die Exchange die Candle liefert
+    'max_entries': 512,  # Max. Einträge im Memory-Cache (LRU-Eviction)
+    'max_bytes': 256 * 1024 * 1024,  # Max. Speicher des Memory-Caches (256 MB)
+    'stale_while_revalidate': False,  # Abgelaufene Charts sofort liefern + im Hintergrund erneuern
+    'max_stale_seconds': 3600,  # Älter abgelaufene Einträge werden nicht mehr "stale" geliefert
+    'revalidate_workers': 4,    # Threads für Hintergrund-Refreshs
+    'revalidate_max_polls': 15, # Max. Re-Renders eines Stale-Charts (UI-Intervall), danach Stale-Hinweis
+    'ohlcv_float32': False,     # Candle-Buffer als float32 (halber Speicher, ~7 Stellen Präzision)
     'type': 'memory',    # 'memory' oder 'redis'
     'redis_url': 'redis://localhost:6379/0'
 }
+
+# Refresh-Ahead Prefetcher: hält Watchlist + häufig genutzte Charts im Cache warm
+PREFETCH_CONFIG = {
+    'enabled': True,
+    'watchlist': _env_list('WATCHLIST') or UI_CONFIG['default_symbols'],
+    'timeframes': [CHART_CONFIG['default_timeframe']],  # Timeframes der Watchlist
+    'limit': CHART_CONFIG['default_candles'],           # Candles pro Watchlist-Eintrag
+    'refresh_ahead_seconds': 15,      # Feste TTLs so früh vor Ablauf erneuern
+    'check_seconds': 30,              # Max. Schlafdauer zwischen zwei Prüfungen
+    'max_per_cycle': 10,              # Max. Refreshes pro Durchlauf (Rate-Limits schonen)
+    'access_half_life_seconds': 3600, # Halbwertszeit der Zugriffshäufigkeit
+    'min_access_score': 0.5,          # Darunter werden Nicht-Watchlist-Charts nicht mehr vorgeladen
+    'max_tracked': 200,               # Max. getrackte Charts (seltenste fliegen raus)
+}
+
+# Gemeinsamer Cache für TA-Lib-Indikatoren (Pattern-Erkennung, Analyzer, Chart-Overlays)
+INDICATOR_CACHE_CONFIG = {
+    'enabled': True,
+    'max_entries': 1024,              # Max. Indikator-Ergebnisse (LRU-Eviction)
+    'max_bytes': 64 * 1024 * 1024,    # Max. Speicher der Ergebnisse (64 MB)
+    'ttl_seconds': 3600,              # Neue Candles ergeben ohnehin einen neuen Key
+}
+
+# Backfill langer Historien in den SQLite-Cache (CryptoDataCache)
+BACKFILL_CONFIG = {
+    'max_workers': 4,            # Parallele Seiten-Requests (Drosselung über Token-Bucket)
+    'default_page_limit': 500,   # Candles pro Request, falls Exchange unbekannt
+    'page_limits': {             # Max. Candles pro fetch_ohlcv je Exchange (auch für inkrementelle Updates)
+        'binance': 1000,
+        'coinbase': 300,
+        'kraken': 720,
+        'bybit': 1000,
+        'okx': 100,
+    },
+}
+
+# Status-Bar Marktstatistiken (Hintergrund-Refresh per fetch_tickers)
+MARKET_STATS_CONFIG = {
+    'refresh_seconds': 60,  # Intervall des Hintergrund-Refreshs
+    'retry_seconds': 5,     # Schnellerer Retry, solange noch keine Daten vorliegen
+}
+
+# Persistenter Markets-Snapshot für schnellen Kaltstart (ohne load_markets abzuwarten)
+MARKETS_SNAPSHOT_CONFIG = {
+    'enabled': True,
+    'path': os.path.join('cache', 'markets_snapshot.json.gz'),
+    'max_age_hours': 168,  # Ältere Snapshots werden ignoriert (1 Woche)
+    'strip_info': True,    # Rohe Exchange-Antwort ('info') nicht speichern → kleinere Datei
+}
 # endregion
 
 # ==============================================================================
@@ -0,0 +1,280 @@
+# core/async_market_engine.py - asyncio-native Market Engine auf ccxt.async_support
+"""
+Async Market Engine - Nicht-blockierende Variante der MarketEngine
+
+Für Scanner-Workloads, die hunderte OHLCV-Requests gleichzeitig offen
+halten wollen, ohne pro Request (oder pro Exchange) einen Thread zu
+belegen. Nutzt ``ccxt.async_support``, dessen Rate-Limiter asyncio-basiert
+arbeitet, und teilt Cache-/Buffer-Logik mit der synchronen Engine.
+
+Funktionale Merkmale:
+- Awaitable ``get_ohlcv``, ``get_market_stats`` und ``get_exchange_info``
+- ``get_ohlcv_many`` als ``asyncio.gather``-Fan-out über Symbole/Exchanges
+- Inkrementelle Candle-Buffer + Candle-Close-TTL wie in der MarketEngine
+- Coalescing paralleler identischer Abrufe über geteilte Tasks
+
+Verwendung:
+    >>> async with AsyncMarketEngine() as engine:
+    ...     df = await engine.get_ohlcv("BTC/USDT", "1h", 500)
+"""
+import asyncio
+from functools import partial
+from typing import Any, Dict, List, Optional, Tuple
+
+import ccxt.async_support as ccxt_async
+import pandas as pd
+
+from config.settings import EXCHANGE_CONFIG, CACHE_CONFIG, MARKET_STATS_CONFIG
+from core.memory_cache import MemoryCache
+from core.timeframes import candle_close_ttl
+from core.market_stats import TOP_SYMBOLS, DEFAULT_MARKET_STATS, summarize_market_stats
+from core.ohlcv_data import (ohlcv_to_series, merge_candles, buffer_covers,
+                              incremental_since, page_limit, build_buffer, tail_view)
+from core.ohlcv_series import OHLCVSeries
+
+
+class AsyncMarketEngine:
+    """
+    ⚡ asyncio-Variante der MarketEngine
+
+    Exchanges werden nicht beim Erzeugen, sondern mit ``await start()``
+    (bzw. ``async with``) geladen. Vor dem Beenden muss ``await close()``
+    aufgerufen werden, damit die aiohttp-Sessions von ccxt geschlossen werden.
+
+    Attribute:
+        exchanges (dict): ccxt async Exchange-Objekte oder Status-Dicts
+        cache (MemoryCache): Begrenzter LRU+TTL-Cache für Candle-Buffer und Stats
+    """
+
+    def __init__(self, exchange_names: Optional[List[str]] = None):
+        self.exchange_names = list(exchange_names or EXCHANGE_CONFIG.keys())
+        self.exchanges = {name: {'status': 'loading'} for name in self.exchange_names}
+        self.cache = MemoryCache(
+            max_entries=CACHE_CONFIG['max_entries'],
+            max_bytes=CACHE_CONFIG['max_bytes'],
+            default_ttl=CACHE_CONFIG['ttl_seconds'],
+        )
+        self._inflight: Dict[Tuple, Tuple[asyncio.Future, int]] = {}  # (Task, limit) pro Serie
+        self._wanted: Dict[Tuple, int] = {}  # Größtes limit, das auf einen zu kleinen Task wartet
+
+    async def __aenter__(self) -> 'AsyncMarketEngine':
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    # •••••••••••••••••••••••••• 🔄 EXCHANGE-MANAGEMENT •••••••••••••••••••••••••• #
+    async def start(self) -> None:
+        """Lädt alle Exchanges parallel (ein Task pro Exchange, keine Threads)"""
+        await asyncio.gather(*(self._load_exchange(name) for name in self.exchange_names))
+        online = sum(not isinstance(ex, dict) for ex in self.exchanges.values())
+        print(f"✅ AsyncMarketEngine: {online}/{len(self.exchange_names)} Exchanges online")
+
+    async def _load_exchange(self, name: str) -> None:
+        """Erzeugt einen ccxt async Exchange und lädt dessen Markets"""
+        exchange = getattr(ccxt_async, name)(EXCHANGE_CONFIG.get(name, {}))
+        try:
+            print(f"📡 {name}: Loading Exchange (async)...")
+            await exchange.load_markets()
+            self.exchanges[name] = exchange
+            print(f"✅ {name}: {len(exchange.markets)} markets")
+        except Exception as e:
+            await exchange.close()
+            self.exchanges[name] = {'status': 'offline', 'error': str(e)}
+            print(f"❌ {name} failed: {e}")
+
+    async def close(self) -> None:
+        """Schließt die HTTP-Sessions aller geladenen Exchanges"""
+        online = [ex for ex in self.exchanges.values() if not isinstance(ex, dict)]
+        await asyncio.gather(*(ex.close() for ex in online), return_exceptions=True)
+
+    def _exchange_order(self, exchange: Optional[str] = None) -> List[str]:
+        """Gewünschter Exchange (falls online) oder alle Online-Exchanges in Prioritätsreihenfolge"""
+        if exchange and not isinstance(self.exchanges.get(exchange, {}), dict):
+            return [exchange]
+        return [name for name in self.exchange_names
+                if not isinstance(self.exchanges.get(name), dict)]
+
+    # ==============================================================================
+    # region               📊 DATEN-ABRUF METHODEN
+    # ==============================================================================
+    async def get_ohlcv(self, symbol: str, timeframe: str = '1d',
+                        limit: int = 500, exchange: str = None) -> pd.DataFrame:
+        """
+        Holt OHLCV vom besten verfügbaren Exchange (async)
+
+        Gleiche Semantik wie ``MarketEngine.get_ohlcv``: eine Serie pro
+        (Exchange, Symbol, Timeframe), Tail-Slices für kleinere Limits,
+        inkrementelle ``since``-Updates und Failover über alle Online-Exchanges.
+
+        Args:
+            symbol: Trading-Pair (z.B. "BTC/USDT")
+            timeframe: Candlestick-Intervall ("1m", "1h", "1d", ...)
+            limit: Anzahl der Candles
+            exchange: Spezifischer Exchange oder None für Auto-Routing
+
+        Returns:
+            pd.DataFrame: timestamp, open, high, low, close, volume, datetime
+            (leer wenn kein Exchange Daten liefert; eigene, beschreibbare Spalten)
+        """
+        exchange_order = self._exchange_order(exchange)
+
+        # Cache check - eine Serie pro Symbol/Timeframe, kleinere Limits als Tail-Slice
+        for ex_name in exchange_order:
+            buffer = self.cache.get(('ohlcv', ex_name, symbol, timeframe))
+            if buffer and buffer_covers(buffer, limit):
+                return tail_view(buffer['data'], limit).to_frame(copy=True)
+
+        # Gleichzeitige Anfragen derselben Serie teilen sich einen Task, sofern dessen
+        # limit reicht; sonst nach dessen Ende mit dem größten wartenden limit neu holen
+        flight_key = (tuple(exchange_order), symbol, timeframe)
+        while True:
+            task, task_limit = self._inflight.get(flight_key, (None, 0))
+            if task is None or (task.done() and task_limit < limit):
+                task_limit = max(limit, self._wanted.pop(flight_key, 0))
+                task = asyncio.ensure_future(
+                    self._fetch_ohlcv_failover(exchange_order, symbol, timeframe, task_limit))
+                self._inflight[flight_key] = (task, task_limit)
+                task.add_done_callback(partial(self._flight_done, flight_key))
+            if task_limit >= limit:
+                break
+            self._wanted[flight_key] = max(self._wanted.get(flight_key, 0), limit)
+            await asyncio.wait([task])
+
+        # shield: Abbruch eines Wartenden bricht den geteilten Abruf nicht ab
+        series = await asyncio.shield(task)
+        return tail_view(series, limit).to_frame(copy=True)
+
+    def _flight_done(self, flight_key: Tuple, task: asyncio.Future):
+        """Entfernt einen fertigen Task (nur wenn er nicht schon ersetzt wurde)"""
+        if self._inflight.get(flight_key, (None,))[0] is task:
+            del self._inflight[flight_key]
+
+    async def _fetch_ohlcv_failover(self, exchange_order: List[str], symbol: str,
+                                    timeframe: str, limit: int) -> OHLCVSeries:
+        """Probiert die Exchanges der Reihe nach, liefert die komplette Serie"""
+        for ex_name in exchange_order:
+            try:
+                series = await self._fetch_ohlcv_incremental(ex_name, symbol, timeframe, limit)
+                if not series.empty:
+                    return series
+            except Exception as e:
+                print(f"❌ {ex_name} error: {e}")
+
+        print(f"❌ No data found for {symbol}")
+        return OHLCVSeries.empty_series()
+
+    async def _fetch_ohlcv_incremental(self, ex_name: str, symbol: str,
+                                       timeframe: str, limit: int) -> OHLCVSeries:
+        """Same wie MarketEngine._fetch_ohlcv_incremental, mit awaitable ccxt-Calls"""
+        buffer_key = ('ohlcv', ex_name, symbol, timeframe)
+        entry = self.cache.peek(buffer_key)
+        buffer = entry.value if entry else None
+        exchange_obj = self.exchanges[ex_name]
+
+        page_size = page_limit(ex_name, limit)
+        since = incremental_since(buffer, limit, timeframe, page_size=page_size)
+        if since is not None:
+            ohlcv = await exchange_obj.fetch_ohlcv(symbol, timeframe, since=since, limit=page_size)
+            series = merge_candles(buffer['data'], ohlcv_to_series(ohlcv))
+            complete = buffer['complete']
+        else:
+            ohlcv = await exchange_obj.fetch_ohlcv(symbol, timeframe, limit=limit)
+            series = ohlcv_to_series(ohlcv)
+            complete = len(series) < limit
+
+        if series.empty:
+            return series
+
+        buffer = build_buffer(series, limit, complete, previous=buffer)
+        self.cache.set(buffer_key, buffer, ttl=candle_close_ttl(timeframe))
+        return buffer['data']
+
+    async def get_ohlcv_many(self, requests: List[Tuple[str, str, int]],
+                             exchange: str = None) -> Dict[Tuple[str, str, int], pd.DataFrame]:
+        """
+        📚 Fan-out über eine ganze Watchlist per ``asyncio.gather``
+
+        Args:
+            requests: Liste von (symbol, timeframe, limit)
+            exchange: Spezifischer Exchange oder None für Auto-Routing
+
+        Returns:
+            Dict[(symbol, timeframe, limit), pd.DataFrame]: Ergebnis pro Anfrage
+        """
+        requests = list(dict.fromkeys(requests))
+        results = await asyncio.gather(
+            *(self.get_ohlcv(*request, exchange) for request in requests),
+            return_exceptions=True,
+        )
+
+        frames = {}
+        for request, result in zip(requests, results):
+            if isinstance(result, Exception):
+                print(f"❌ {request[0]} ({request[1]}) failed: {result}")
+                result = pd.DataFrame()
+            frames[request] = result
+        return frames
+    # endregion
+
+    # ==============================================================================
+    # region               🔧 UTILITY & HELPER METHODEN
+    # ==============================================================================
+    async def get_market_stats(self) -> Dict[str, Any]:
+        """
+        Globale Marktdaten für Status-Bar (async)
+
+        Fragt die Top-Coins pro Exchange parallel ab und nimmt den ersten
+        Exchange, der Daten liefert.
+        """
+        cached_stats = self.cache.get('market_stats')
+        if cached_stats is not None:
+            return cached_stats
+
+        stats = dict(DEFAULT_MARKET_STATS)
+        try:
+            exchange_order = self._exchange_order()
+            active_pairs = None
+            if exchange_order:
+                markets = self.exchanges[exchange_order[0]].markets
+                active_pairs = sum('/USDT' in symbol for symbol in markets)
+
+            quotes = {}
+            for ex_name in exchange_order:
+                frames = await self.get_ohlcv_many([(symbol, '1d', 1) for symbol in TOP_SYMBOLS],
+                                                   exchange=ex_name)
+                quotes = {symbol: (df['close'].iloc[-1], df['volume'].iloc[-1])
+                          for (symbol, _, _), df in frames.items() if not df.empty}
+                if quotes:
+                    break
+
+            stats = summarize_market_stats(quotes, active_pairs)
+            # Gleiches Intervall wie der Hintergrund-Refresh der sync Engine (nicht bis Tages-Close)
+            self.cache.set('market_stats', stats, ttl=MARKET_STATS_CONFIG['refresh_seconds'])
+
+        except Exception as e:
+            print(f"❌ Error getting market stats: {e}")
+
+        return stats
+
+    async def get_exchange_info(self) -> Dict[str, Any]:
+        """Exchange Status und Info (Same wie MarketEngine.get_exchange_info)"""
+        info = {}
+
+        for name, exchange in self.exchanges.items():
+            try:
+                if isinstance(exchange, dict) and 'status' in exchange:
+                    info[name] = exchange
+                else:
+                    info[name] = {
+                        'status': 'online',
+                        'markets': len(exchange.markets),
+                        'rate_limit': exchange.rateLimit,
+                        'has_ohlcv': exchange.has['fetchOHLCV'],
+                    }
+            except Exception as e:
+                info[name] = {'status': 'offline', 'error': str(e)}
+
+        return info
+    # endregion
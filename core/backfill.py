@@ -0,0 +1,156 @@
+# core/backfill.py - Paralleles, seitenweises Nachladen langer Historien
+"""
+Backfill - Jahre an Candles in den SQLite-Cache (CryptoDataCache) laden
+
+``get_ohlcv`` holt höchstens eine ``fetch_ohlcv``-Seite. Ein Backfill-Job
+zerlegt einen Zeitraum in Seiten passend zum Exchange-Limit, lädt sie
+parallel (gedrosselt über den Token-Bucket der MarketEngine), schneidet
+Überlappungen ab und schreibt jede fertige Seite sofort per Upsert in den
+Cache. Fertige Seiten werden vermerkt; ein abgebrochener Job setzt beim
+nächsten Start dort fort.
+
+Seitengrenzen liegen auf einem festen Raster (Vielfache von Seitenlänge
+× Timeframe), damit Resume auch bei verändertem Startdatum greift.
+
+Verwendung:
+    >>> stats = market_engine.backfill("BTC/USDT", "1h", start="2021-01-01")
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+import pandas as pd
+
+from config.settings import BACKFILL_CONFIG
+from core.ohlcv_data import ohlcv_to_frame, page_limit
+from core.timeframes import timeframe_to_seconds
+
+# Timeframes mit eigener Tabelle im CryptoDataCache
+BACKFILL_TIMEFRAMES = ["1h", "1d", "3d", "1w", "1M"]
+
+
+def to_milliseconds(value: Union[int, float, str, pd.Timestamp, None]) -> int:
+    """Datum (ms-Timestamp, ISO-String, datetime) → Unix-Millisekunden (naive = UTC)"""
+    if value is None:
+        return int(time.time() * 1000)
+    if isinstance(value, (int, float)):
+        return int(value)
+    timestamp = pd.Timestamp(value)
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.tz_localize('UTC')
+    return int(timestamp.value // 1_000_000)
+
+
+class BackfillJob:
+    """
+    📥 Backfill eines Symbols/Timeframes über einen Zeitraum
+
+    Attribute:
+        symbol (str): Unified Symbol (Asset-ID im Cache)
+        timeframe (str): Einer von BACKFILL_TIMEFRAMES
+        exchange (str): Exchange, von dem geladen wird
+        market_symbol (str): Symbol auf dem Exchange (kann ein Quote-Alias sein)
+        page_limit (int): Candles pro Request
+    """
+
+    def __init__(self, engine, symbol: str, timeframe: str, start, end=None,
+                 exchange: Optional[str] = None, store=None):
+        if timeframe not in BACKFILL_TIMEFRAMES:
+            raise ValueError(f"Backfill nur für {BACKFILL_TIMEFRAMES}, nicht für {timeframe}")
+        if start is None:
+            # to_milliseconds(None) wäre "jetzt" → Job ohne Seiten
+            raise ValueError("Backfill braucht ein Startdatum (start)")
+
+        routes = engine.resolve_routes(symbol, exchange)
+        if not routes:
+            raise ValueError(f"Kein Exchange listet {symbol}")
+
+        self.engine = engine
+        self.symbol = symbol
+        self.timeframe = timeframe
+        self.exchange, self.market_symbol = routes[0]
+        self.start_ms = to_milliseconds(start)
+        self.end_ms = to_milliseconds(end)
+        self.page_limit = page_limit(self.exchange)
+        self.timeframe_ms = timeframe_to_seconds(timeframe) * 1000
+
+        if store is None:
+            # Lazy Import: cache-Paket zieht SQLite + Logger nach
+            from cache.cache_manager import CryptoDataCache
+            store = CryptoDataCache()
+        self.store = store
+
+    def pages(self) -> List[Tuple[int, int]]:
+        """Seiten [since, until) in ms auf festem Raster, die den Zeitraum abdecken"""
+        span = self.page_limit * self.timeframe_ms
+        first = self.start_ms - self.start_ms % span
+        return [(since, since + span) for since in range(first, self.end_ms, span)]
+
+    def _fetch_page(self, since: int, until: int) -> pd.DataFrame:
+        """Lädt eine Seite und schneidet alles außerhalb [since, until) ab"""
+        ohlcv = self.engine.fetch_ohlcv_page(self.exchange, self.market_symbol, self.timeframe,
+                                             since=since, limit=self.page_limit)
+        df = ohlcv_to_frame(ohlcv)
+        if df.empty:
+            return df
+        df = df[(df['timestamp'] >= since) & (df['timestamp'] < until)]
+        return df.drop_duplicates('timestamp', keep='last')
+
+    def run(self, progress: Callable[[Dict[str, Any]], None] = None) -> Dict[str, Any]:
+        """
+        Führt den Job aus (blockierend)
+
+        Args:
+            progress: Optionaler Callback, erhält nach jeder Seite die Zwischenstände
+
+        Returns:
+            Dict: pages, skipped, fetched, failed, rows, seconds
+        """
+        started = time.time()
+        done = self.store.get_backfilled_pages(self.symbol, self.timeframe, self.exchange)
+        pages = self.pages()
+        todo = [page for page in pages if page[0] not in done]
+        now_ms = int(time.time() * 1000)
+
+        stats = {'symbol': self.symbol, 'timeframe': self.timeframe, 'exchange': self.exchange,
+                 'pages': len(pages), 'skipped': len(pages) - len(todo),
+                 'fetched': 0, 'failed': 0, 'rows': 0}
+        print(f"📥 Backfill {self.symbol} ({self.timeframe}) von {self.exchange}: "
+              f"{len(todo)}/{len(pages)} Seiten offen")
+
+        with ThreadPoolExecutor(max_workers=BACKFILL_CONFIG['max_workers'],
+                                thread_name_prefix='ohlcv-backfill') as executor:
+            futures = {executor.submit(self._fetch_page, since, until): (since, until)
+                       for since, until in todo}
+
+            # Ergebnisse in Fertigstellungsreihenfolge schreiben (ein Writer-Thread für SQLite)
+            for future in as_completed(futures):
+                since, until = futures[future]
+                try:
+                    df = future.result()
+                except Exception as e:
+                    stats['failed'] += 1
+                    print(f"❌ Backfill-Seite {pd.Timestamp(since, unit='ms')} failed: {e}")
+                    continue
+
+                try:
+                    rows = self.store.upsert_ohlcv(self.symbol, self.timeframe, df)
+                except Exception as e:
+                    # Nicht vermerken → wird beim nächsten Lauf erneut geladen
+                    stats['failed'] += 1
+                    print(f"❌ Backfill-Seite {pd.Timestamp(since, unit='ms')} nicht gespeichert: {e}")
+                    continue
+                stats['fetched'] += 1
+                stats['rows'] += rows
+
+                # Nur abgeschlossene Seiten merken (laufende Candles werden beim nächsten Lauf ergänzt)
+                if until + self.timeframe_ms <= now_ms:
+                    self.store.mark_backfill_page(self.symbol, self.timeframe,
+                                                  self.exchange, since, rows)
+                if progress:
+                    progress(dict(stats))
+
+        stats['seconds'] = round(time.time() - started, 1)
+        print(f"✅ Backfill {self.symbol} ({self.timeframe}): {stats['rows']} Candles "
+              f"in {stats['seconds']}s ({stats['failed']} Seiten fehlgeschlagen)")
+        return stats
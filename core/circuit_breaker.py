@@ -0,0 +1,110 @@
+# core/circuit_breaker.py - Circuit Breaker pro Exchange
+"""
+Circuit Breaker - Schutz vor wiederholten Calls an fehlerhafte Exchanges
+
+Zustände pro Exchange:
+- closed:    normaler Betrieb, Fehler werden gezählt
+- open:      nach N aufeinanderfolgenden Fehlern → Calls werden sofort übersprungen
+- half_open: nach Ablauf des Cooldowns darf genau ein Probe-Call durch;
+             Erfolg schließt den Breaker, Fehler öffnet ihn erneut
+"""
+import threading
+import time
+from typing import Any, Dict
+
+from config.settings import CIRCUIT_BREAKER_CONFIG
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class _BreakerState:
+    """Zustand eines einzelnen Exchanges"""
+    __slots__ = ('state', 'failures', 'opened_at', 'probe_running')
+
+    def __init__(self):
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probe_running = False
+
+
+class CircuitBreaker:
+    """
+    ⚡ Circuit Breaker mit einem Zustand pro Exchange
+
+    Attribute:
+        failure_threshold (int): Aufeinanderfolgende Fehler bis zum Öffnen
+        cooldown (float): Sekunden bis zum Half-Open-Probe
+    """
+
+    def __init__(self, failure_threshold: int = None, cooldown: float = None):
+        self.failure_threshold = failure_threshold or CIRCUIT_BREAKER_CONFIG['failure_threshold']
+        self.cooldown = CIRCUIT_BREAKER_CONFIG['cooldown_seconds'] if cooldown is None else cooldown
+        self._states: Dict[str, _BreakerState] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, exchange: str) -> _BreakerState:
+        if exchange not in self._states:
+            self._states[exchange] = _BreakerState()
+        return self._states[exchange]
+
+    def allow(self, exchange: str) -> bool:
+        """
+        Prüft ob ein Call an ``exchange`` erlaubt ist
+
+        Im Half-Open-Zustand wird genau ein Probe-Call zugelassen,
+        bis dessen Ergebnis per ``record_success``/``record_failure`` eintrifft.
+        """
+        with self._lock:
+            breaker = self._get(exchange)
+            if breaker.state == CLOSED:
+                return True
+
+            if breaker.state == OPEN and time.time() - breaker.opened_at >= self.cooldown:
+                breaker.state = HALF_OPEN
+                breaker.probe_running = False
+
+            if breaker.state == HALF_OPEN and not breaker.probe_running:
+                breaker.probe_running = True
+                print(f"🔌 {exchange}: Circuit half-open, Probe-Request")
+                return True
+
+            return False
+
+    def is_open(self, exchange: str) -> bool:
+        """True solange der Breaker offen ist und der Cooldown läuft (ohne Probe zu verbrauchen)"""
+        with self._lock:
+            breaker = self._states.get(exchange)
+            return (breaker is not None and breaker.state == OPEN
+                    and time.time() - breaker.opened_at < self.cooldown)
+
+    def record_success(self, exchange: str) -> None:
+        """Erfolgreicher Call → Fehlerzähler zurücksetzen, Breaker schließen"""
+        with self._lock:
+            breaker = self._get(exchange)
+            if breaker.state != CLOSED:
+                print(f"✅ {exchange}: Circuit closed")
+            breaker.state = CLOSED
+            breaker.failures = 0
+            breaker.probe_running = False
+
+    def record_failure(self, exchange: str) -> None:
+        """Fehlgeschlagener Call → ggf. Breaker öffnen"""
+        with self._lock:
+            breaker = self._get(exchange)
+            breaker.failures += 1
+            breaker.probe_running = False
+
+            if breaker.state == HALF_OPEN or breaker.failures >= self.failure_threshold:
+                if breaker.state != OPEN:
+                    print(f"⛔ {exchange}: Circuit open nach {breaker.failures} Fehlern")
+                breaker.state = OPEN
+                breaker.opened_at = time.time()
+
+    def state(self, exchange: str) -> Dict[str, Any]:
+        """Aktueller Zustand für Status-Anzeigen"""
+        with self._lock:
+            breaker = self._get(exchange)
+            return {'circuit': breaker.state, 'consecutive_failures': breaker.failures}
@@ -0,0 +1,74 @@
+# core/crossings.py - Vektorisierter Crossing-Kernel für Indikator-Patterns
+"""
+Crossings - Vorzeichenwechsel von (a − b) als Index-Arrays
+
+MA-/MACD-Crossover, RSI-Schwellen und Bollinger-Squeeze sind alle
+dieselbe Frage: wo wechselt eine Reihe von einer Seite einer anderen
+Reihe (oder eines festen Werts) auf die andere? Der Kernel beantwortet
+sie für die ganze Serie mit wenigen NumPy-Vergleichen.
+
+- strict:    up = a > b jetzt und a <= b vorher; down = a < b jetzt und a >= b vorher
+- inclusive: up = a >= b jetzt und a < b vorher; down = a <= b jetzt und a > b vorher
+
+NaN an Position i oder i-1 (Warm-up der TA-Lib-Indikatoren) ergibt nie
+ein Signal.
+
+Verwendung:
+    >>> up, down = crossings(ma_fast, ma_slow)
+    >>> up, down = crossings(rsi, 30, inclusive=True)
+"""
+from typing import Tuple, Union
+
+import numpy as np
+
+Level = Union[np.ndarray, float]
+
+
+def crossings(a: np.ndarray, b: Level, inclusive: bool = False,
+              start: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Findet die Kreuzungen von ``a`` über/unter ``b``
+
+    Args:
+        a: Reihe (z.B. schneller MA, RSI)
+        b: Vergleichsreihe gleicher Länge oder fester Schwellwert
+        inclusive: Gleichstand zählt als "erreicht" (RSI-Schwellen) statt als "noch nicht gekreuzt"
+        start: Kleinster Index, ab dem Signale zählen (mind. 1)
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Aufsteigende int64-Indizes (nach oben, nach unten)
+    """
+    a = np.asarray(a, dtype=np.float64)
+    b = np.broadcast_to(np.asarray(b, dtype=np.float64), a.shape)
+    if len(a) < 2:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty
+
+    now_a, now_b = a[1:], b[1:]
+    prev_a, prev_b = a[:-1], b[:-1]
+    valid = ~(np.isnan(now_a) | np.isnan(now_b) | np.isnan(prev_a) | np.isnan(prev_b))
+
+    if inclusive:
+        up = (now_a >= now_b) & (prev_a < prev_b)
+        down = (now_a <= now_b) & (prev_a > prev_b)
+    else:
+        up = (now_a > now_b) & (prev_a <= prev_b)
+        down = (now_a < now_b) & (prev_a >= prev_b)
+
+    offset = max(start, 1)
+    up_rows = np.nonzero((up & valid)[offset - 1:])[0] + offset
+    down_rows = np.nonzero((down & valid)[offset - 1:])[0] + offset
+    return up_rows, down_rows
+
+
+def merge_crossings(up: np.ndarray, down: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Beide Richtungen in Serienreihenfolge
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (Indizes aufsteigend, True wo nach oben gekreuzt)
+    """
+    rows = np.concatenate([up, down])
+    is_up = np.concatenate([np.ones(len(up), dtype=bool), np.zeros(len(down), dtype=bool)])
+    order = np.argsort(rows, kind='stable')
+    return rows[order], is_up[order]
@@ -0,0 +1,155 @@
+# core/exchange_router.py - Adaptives Exchange-Routing anhand Live-Telemetrie
+"""
+Exchange Router - Reihenfolge der Exchanges nach erwarteter Antwortzeit
+
+Ersetzt die an mehreren Stellen hart kodierte Prioritätsliste
+``['binance', 'coinbase', 'kraken', 'bybit', 'okx']``. Jeder ccxt-Call
+der MarketEngine meldet Latenz, Fehler und Rate-Limit-Ablehnungen; der
+Router hält dafür pro Exchange einen EWMA (exponentiell gewichteten
+gleitenden Mittelwert) und sortiert Kandidaten pro Request nach
+erwarteter Antwortzeit inkl. Strafzuschlag für Fehler.
+
+Die statische Reihenfolge aus ``EXCHANGE_CONFIG`` bleibt Tie-Breaker
+und gilt, solange noch keine Messungen vorliegen.
+"""
+import threading
+from collections import deque
+from typing import Any, Dict, Iterable, List, Optional
+
+from config.settings import EXCHANGE_CONFIG, ROUTING_CONFIG
+
+
+class ExchangeStats:
+    """📈 EWMA-Telemetrie eines Exchanges"""
+    __slots__ = ('latency', 'error_rate', 'rate_limited_rate', 'requests', 'errors',
+                 'rate_limited', 'samples')
+
+    def __init__(self, sample_size: int):
+        self.latency: Optional[float] = None  # EWMA in Sekunden
+        self.error_rate = 0.0
+        self.rate_limited_rate = 0.0
+        self.requests = 0
+        self.errors = 0
+        self.rate_limited = 0
+        self.samples = deque(maxlen=sample_size)  # Rohwerte für Perzentile
+
+
+class ExchangeRouter:
+    """
+    🧭 Sammelt Telemetrie pro Exchange und rankt Routing-Kandidaten
+
+    Attribute:
+        priority (List[str]): Statische Basis-Reihenfolge (aus EXCHANGE_CONFIG)
+        alpha (float): EWMA-Glättungsfaktor (höher = reagiert schneller)
+    """
+
+    def __init__(self, priority: Optional[List[str]] = None, alpha: float = None):
+        self.priority = list(priority or EXCHANGE_CONFIG.keys())
+        self.alpha = ROUTING_CONFIG['ewma_alpha'] if alpha is None else alpha
+        self._stats: Dict[str, ExchangeStats] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, exchange: str) -> ExchangeStats:
+        if exchange not in self._stats:
+            self._stats[exchange] = ExchangeStats(ROUTING_CONFIG['latency_samples'])
+        return self._stats[exchange]
+
+    # •••••••••••••••••••••••••• Messwerte erfassen •••••••••••••••••••••••••• #
+    def record(self, exchange: str, latency: float, ok: bool = True,
+               rate_limited: bool = False) -> None:
+        """
+        Erfasst das Ergebnis eines ccxt-Calls
+
+        Args:
+            exchange: Exchange-Name
+            latency: Dauer des Calls in Sekunden
+            ok: False bei Fehler (Timeout, Netzwerk, Exchange-Fehler)
+            rate_limited: True wenn der Exchange den Call per Rate-Limit abgelehnt hat
+        """
+        a = self.alpha
+        with self._lock:
+            stats = self._get(exchange)
+            stats.requests += 1
+            stats.errors += not ok
+            stats.rate_limited += rate_limited
+
+            stats.error_rate = (1 - a) * stats.error_rate + a * (not ok)
+            stats.rate_limited_rate = (1 - a) * stats.rate_limited_rate + a * rate_limited
+
+            # Nur erfolgreiche Calls gehen in die Latenz ein (Fehler kosten Strafzuschlag)
+            if ok:
+                stats.samples.append(latency)
+                stats.latency = latency if stats.latency is None else \
+                    (1 - a) * stats.latency + a * latency
+
+    # •••••••••••••••••••••••••• Routing •••••••••••••••••••••••••• #
+    def expected_cost(self, exchange: str) -> float:
+        """
+        Erwartete Antwortzeit in Sekunden inkl. Strafzuschlag für Fehler
+
+        Ohne Messungen wird ``ROUTING_CONFIG['default_latency']`` angenommen.
+        """
+        with self._lock:
+            stats = self._stats.get(exchange)
+            if stats is None or stats.latency is None:
+                latency = ROUTING_CONFIG['default_latency']
+                error_rate = stats.error_rate if stats else 0.0
+                rate_limited_rate = stats.rate_limited_rate if stats else 0.0
+            else:
+                latency = stats.latency
+                error_rate = stats.error_rate
+                rate_limited_rate = stats.rate_limited_rate
+
+        return (latency
+                + error_rate * ROUTING_CONFIG['error_penalty']
+                + rate_limited_rate * ROUTING_CONFIG['rate_limit_penalty'])
+
+    def rank(self, candidates: Iterable[str]) -> List[str]:
+        """Sortiert Kandidaten nach erwarteter Antwortzeit (Priorität als Tie-Breaker)"""
+        def base_priority(name: str) -> int:
+            return self.priority.index(name) if name in self.priority else len(self.priority)
+
+        return sorted(candidates, key=lambda name: (self.expected_cost(name), base_priority(name)))
+
+    def latency_percentile(self, exchange: str, percentile: float) -> Optional[float]:
+        """Latenz-Perzentil aus den letzten Messungen (None ohne Messungen)"""
+        with self._lock:
+            stats = self._stats.get(exchange)
+            samples = sorted(stats.samples) if stats else []
+
+        if not samples:
+            return None
+        rank = int(len(samples) * percentile / 100)
+        return samples[min(rank, len(samples) - 1)]
+
+    def sample_count(self, exchange: str) -> int:
+        """Anzahl gespeicherter Latenz-Messungen"""
+        with self._lock:
+            stats = self._stats.get(exchange)
+            return len(stats.samples) if stats else 0
+
+    # •••••••••••••••••••••••••• Health •••••••••••••••••••••••••• #
+    def health(self, exchange: str) -> Dict[str, Any]:
+        """
+        Health-Kennzahlen für Status-Anzeigen
+
+        Returns:
+            Dict mit latency_ms, error_rate, rate_limited_rate, requests und
+            health ('unknown', 'healthy' oder 'degraded')
+        """
+        with self._lock:
+            stats = self._stats.get(exchange)
+            if stats is None or not stats.requests:
+                return {'health': 'unknown', 'requests': 0}
+
+            degraded = (stats.error_rate > ROUTING_CONFIG['degraded_error_rate']
+                        or stats.rate_limited_rate > ROUTING_CONFIG['degraded_error_rate']
+                        or (stats.latency or 0) > ROUTING_CONFIG['degraded_latency'])
+
+            return {
+                'health': 'degraded' if degraded else 'healthy',
+                'latency_ms': round(stats.latency * 1000) if stats.latency is not None else None,
+                'error_rate': round(stats.error_rate, 3),
+                'rate_limited_rate': round(stats.rate_limited_rate, 3),
+                'requests': stats.requests,
+            }
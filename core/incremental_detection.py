@@ -0,0 +1,207 @@
+# core/incremental_detection.py - Pattern-Erkennung nur für neue Candles
+"""
+Incremental Detection - Beim Anhängen einer Candle nicht die ganze Serie neu scannen
+
+Jeder Refresh eines Charts liefert dieselbe Serie plus ein bis zwei
+Candles (die laufende wird ersetzt, eine neue kommt hinzu). Ein voller
+``detect_signals``-Lauf rechnet trotzdem alle 21 Candlestick-Funktionen
+und alle Indikatoren über die komplette Historie.
+
+Pro Serie (``series_key``) merkt sich der Detector die zuletzt gesehenen
+Arrays und die SignalTable. Beim nächsten Aufruf:
+
+1. Ausrichten: Position der neuen ersten Candle in der alten Serie
+   (vorne abgeschnittene Candles = Verschiebung der Indizes)
+2. Prüfen: überlappende Timestamps und Werte müssen identisch sein,
+   nur die letzte alte Candle darf sich geändert haben (lief noch)
+3. Zusammensetzen:
+   - Anfang (Index < R) aus der alten Tabelle bzw. – wenn vorne Candles
+     weggefallen sind – aus einem kurzen Lauf über die ersten Candles
+   - Mitte aus der alten Tabelle (verschoben)
+   - Ende ab der ersten geänderten Candle − Lookahead aus einem Lauf über
+     die letzten Candles plus R Candles Vorlauf
+
+R ("Reach") ist der größte Lookback der Detektoren (TA-Lib-Lookbacks der
+Candlestick-Funktionen, BBANDS + SMA, langsamer MA, S/R-Fenster) +
+``warmup_candles``. Fensterbasierte Detektoren sind damit exakt;
+RSI und MACD (rekursive Glättung) hängen theoretisch von der ganzen
+Historie ab – der Vorlauf entspricht TA-Libs "Unstable Period" und
+macht den Unterschied vernachlässigbar. Passt irgendetwas nicht
+(kein Zustand, andere Serie, zu kurz, zu viel geändert), läuft die
+volle Erkennung.
+
+Verwendung:
+    >>> table = market_engine.detect_signals(df, series_key=(symbol, timeframe, exchange, limit))
+"""
+from typing import Callable, Dict, Hashable, Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+import talib.abstract
+
+from config.settings import PATTERN_CONFIG, INCREMENTAL_DETECTION_CONFIG
+from core.memory_cache import MemoryCache
+from core.ohlcv_series import PRICE_COLUMNS
+from core.signal_table import SignalTable
+
+Arrays = Dict[str, np.ndarray]
+
+
+def _lookback(name: str, **parameters) -> int:
+    """TA-Lib-Lookback (Anzahl Candles ohne gültigen Wert) einer Funktion"""
+    function = talib.abstract.Function(name)
+    if parameters:
+        function.set_parameters(**parameters)
+    return function.lookback
+
+
+def detection_reach(candlestick_functions: Iterable[Callable]) -> int:
+    """
+    Größter Rückgriff eines Signals auf frühere Candles (ohne Warm-up)
+
+    Ein Signal an Index i hängt nur von Candles in [i - reach + 1, i + Lookahead] ab.
+    """
+    candlestick = max((_lookback(func.__name__) for func in candlestick_functions), default=0)
+    bollinger = _lookback('BBANDS') + _lookback('SMA', timeperiod=PATTERN_CONFIG['bollinger_periods'])
+    moving_average = _lookback('SMA', timeperiod=max(PATTERN_CONFIG['ma_crossover_fast'],
+                                                     PATTERN_CONFIG['ma_crossover_slow']))
+    # +1: Crossings vergleichen mit der Vorgänger-Candle; 20 = Mindestlänge BB/S-R
+    return max(candlestick, bollinger, moving_average, 20,
+               2 * PATTERN_CONFIG['support_resistance_window']) + 1
+
+
+def detection_config() -> Tuple:
+    """Alle Einstellungen, von denen die erkannten Signale abhängen"""
+    return (PATTERN_CONFIG['bollinger_periods'], PATTERN_CONFIG['rsi_period'],
+            PATTERN_CONFIG['support_resistance_window'], PATTERN_CONFIG['ma_crossover_fast'],
+            PATTERN_CONFIG['ma_crossover_slow'], INCREMENTAL_DETECTION_CONFIG['warmup_candles'])
+
+
+def _window(data: Arrays, start: int, stop: Optional[int] = None) -> Arrays:
+    """Zeilen [start, stop) aller Spalten als Views"""
+    return {name: values[start:stop] for name, values in data.items()}
+
+
+class IncrementalDetector:
+    """
+    ♻️ Wiederverwendet die Signale unveränderter Candles zwischen zwei Aufrufen
+
+    Attribute:
+        detect: Volle Erkennung ``Arrays → SignalTable`` (``MarketEngine._detect_arrays``)
+        detect_window: Erkennung für Teilfenster (Standard: ``detect``)
+        group_order: Kanonische Reihenfolge aller Pattern-Gruppen
+        keep_empty: Gruppen, die auch ohne Signale ausgegeben werden
+        full_runs, incremental_runs, unchanged (int): Zähler für Monitoring
+    """
+
+    def __init__(self, detect: Callable[[Arrays], SignalTable], group_order: Sequence[str],
+                 keep_empty: Iterable[str], candlestick_functions: Iterable[Callable],
+                 detect_window: Optional[Callable[[Arrays], SignalTable]] = None):
+        self.detect = detect
+        self.detect_window = detect_window or detect
+        self.group_order = list(group_order)
+        self.keep_empty = set(keep_empty)
+        self._candlestick_functions = list(candlestick_functions)
+        self._reach_config = None
+        self._reach = 0
+
+        self._state = MemoryCache(
+            max_entries=INCREMENTAL_DETECTION_CONFIG['max_series'],
+            default_ttl=INCREMENTAL_DETECTION_CONFIG['state_ttl_seconds'],
+        )
+        self.full_runs = 0
+        self.incremental_runs = 0
+        self.unchanged = 0
+
+    @property
+    def reach(self) -> int:
+        """Rückgriff inkl. Warm-up; neu berechnet, wenn sich PATTERN_CONFIG ändert"""
+        config = detection_config()
+        if config != self._reach_config:
+            self._reach = detection_reach(self._candlestick_functions)
+            self._reach_config = config
+        return self._reach + INCREMENTAL_DETECTION_CONFIG['warmup_candles']
+
+    # •••••••••••••••••••••••••• Erkennung •••••••••••••••••••••••••• #
+    def run(self, series_key: Hashable, data: Arrays) -> SignalTable:
+        """
+        Signale für ``data``; nutzt den Zustand der letzten Serie unter ``series_key``
+
+        Der Zustand gilt nur für die Einstellungen, mit denen er erkannt wurde –
+        nach einer Änderung (z.B. ``rsi_period``) wird die Serie komplett neu gescannt.
+        """
+        config = detection_config()
+        previous = self._state.get(series_key)
+        table = None
+        if previous is not None and previous[0] == config:
+            table = self._incremental(previous[1:], data)
+        if table is None:
+            self.full_runs += 1
+            table = self.detect(data)
+        self._state.set(series_key, (config, data, table))
+        return table
+
+    def _changed_from(self, old: Arrays, data: Arrays):
+        """
+        (Verschiebung, erste evtl. geänderte Candle) oder None, wenn die Serien nicht zusammenpassen
+
+        Erste geänderte Candle = Länge der neuen Serie → nichts geändert.
+        """
+        old_ts, new_ts = old['timestamp'], data['timestamp']
+        if not len(old_ts) or not len(new_ts):
+            return None
+
+        shift = int(np.searchsorted(old_ts, new_ts[0]))
+        overlap = len(old_ts) - shift
+        if shift >= len(old_ts) or overlap > len(new_ts) or old_ts[shift] != new_ts[0]:
+            return None
+        if not np.array_equal(old_ts[shift:], new_ts[:overlap]):
+            return None
+
+        # Abgeschlossene Candles müssen unverändert sein, die letzte alte darf gelaufen sein
+        closed = overlap - 1
+        for column in PRICE_COLUMNS:
+            if not np.array_equal(old[column][shift:shift + closed], data[column][:closed], equal_nan=True):
+                return None
+        last_equal = all(old[column][-1] == data[column][closed] for column in PRICE_COLUMNS)
+        if last_equal and overlap == len(new_ts):
+            return shift, len(new_ts)
+        return shift, closed
+
+    def _incremental(self, previous, data: Arrays) -> Optional[SignalTable]:
+        old, old_table = previous
+        aligned = self._changed_from(old, data)
+        if aligned is None:
+            return None
+        shift, changed_from = aligned
+
+        if shift == 0 and changed_from == len(data['timestamp']):
+            self.unchanged += 1
+            return old_table
+
+        reach = self.reach
+        lookahead = PATTERN_CONFIG['support_resistance_window']
+        start = changed_from - lookahead  # ab hier können sich Signale geändert haben
+        # Lohnt nur, wenn Anfang + Ende deutlich kürzer sind als die ganze Serie
+        if start - reach < 2 * reach + lookahead:
+            return None
+
+        if shift:
+            # Vorne abgeschnitten → Warm-up der ersten Candles ändert sich
+            head = self.detect_window(_window(data, 0, 2 * reach + lookahead)).slice(0, reach)
+            middle = old_table.slice(reach + shift, start + shift, offset=-shift)
+        else:
+            head, middle = None, old_table.slice(0, start)
+        tail = self.detect_window(_window(data, start - reach)).slice(reach, offset=start - reach)
+
+        self.incremental_runs += 1
+        parts = [part for part in (head, middle, tail) if part is not None]
+        return SignalTable.concat(parts, self.group_order, self.keep_empty)
+
+    # •••••••••••••••••••••••••• Statistik •••••••••••••••••••••••••• #
+    def stats(self) -> Dict[str, int]:
+        return {
+            'detect_full_runs': self.full_runs,
+            'detect_incremental_runs': self.incremental_runs,
+            'detect_unchanged': self.unchanged,
+            'detect_tracked_series': len(self._state),
+        }
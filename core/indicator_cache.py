@@ -0,0 +1,138 @@
+# core/indicator_cache.py - Gemeinsamer Cache für TA-Lib-Indikatoren
+"""
+Indicator Cache - SMA, RSI, MACD, BBANDS & Co. nur einmal pro Serie berechnen
+
+Die Pattern-Erkennung rechnet Indikatoren und wirft sie danach weg; ein
+Chart-Overlay oder Analyzer, der denselben RSI braucht, rechnet ihn erneut.
+Der Cache hält die Ergebnisse unter
+
+    (Serien-Fingerprint, Indikator, Parameter)
+
+in einem ``MemoryCache`` (LRU + Byte-Limit, Hit/Miss-Zähler). Neu gerechnet
+wird nur bei neuen Daten (anderer Fingerprint) oder anderen Parametern,
+z.B. wenn ``PATTERN_CONFIG['rsi_period']`` geändert wurde – die Parameter
+sind Teil des Keys, also immer explizit übergeben.
+
+Der Fingerprint deckt jeden Wert der Eingabespalten ab (Timestamps + die
+Spalten, die der Indikator liest): pro Spalte eine gewichtete Summe der
+Bit-Muster mit zufälligen ungeraden 64-Bit-Gewichten (mod 2^64). Eine
+geänderte Candle mitten in der Serie (revidierte Candle nach
+``merge_candles``, anderer Exchange mit gleichen Endpunkten) ändert den Key
+immer; zufällige Kollisionen mehrerer Änderungen ~2^-64. Kostet ~15 µs pro
+20k Werte – ein kryptographischer Hash (blake2b) wäre ~10× teurer als der
+Indikator selbst.
+
+Ergebnisse sind read-only Arrays und werden von allen Lesern geteilt.
+
+Verwendung:
+    >>> rsi = market_engine.indicators.get(data, 'RSI', timeperiod=14)
+    >>> upper, middle, lower = market_engine.get_indicator(df, 'BBANDS')
+"""
+import threading
+from functools import lru_cache
+from typing import Dict, Hashable, Iterable, Tuple, Union
+
+import numpy as np
+import talib
+import talib.abstract
+
+from config.settings import INDICATOR_CACHE_CONFIG
+from core.memory_cache import MemoryCache
+from core.single_flight import SingleFlight
+
+Arrays = Dict[str, np.ndarray]
+IndicatorResult = Union[np.ndarray, Tuple[np.ndarray, ...]]
+
+# Zufällige ungerade Gewichte für den Spalten-Digest (wachsen mit der längsten Serie)
+_weights = np.empty(0, dtype=np.uint64)
+_weights_lock = threading.Lock()
+_weights_rng = np.random.default_rng(0x5EED)
+
+
+def _digest_weights(length: int) -> np.ndarray:
+    global _weights
+    with _weights_lock:
+        if len(_weights) < length:
+            extra = _weights_rng.integers(0, 2 ** 63, length - len(_weights), dtype=np.uint64)
+            _weights = np.concatenate([_weights, extra * np.uint64(2) + np.uint64(1)])
+        return _weights[:length]
+
+
+def column_digest(values: np.ndarray) -> int:
+    """64-Bit-Digest über alle Werte einer int64/float64-Spalte (Bit-Muster, mod 2^64)"""
+    bits = np.ascontiguousarray(values).view(np.uint64)
+    return int(np.dot(bits, _digest_weights(len(bits))))
+
+
+def series_fingerprint(data: Arrays, columns: Iterable[str] = ('close',)) -> Tuple:
+    """Identität einer Candle-Serie über Timestamps + ``columns`` (Arrays aus ``ohlcv_arrays``)"""
+    timestamps = data['timestamp']
+    return (len(timestamps), column_digest(timestamps),
+            *(column_digest(data[column]) for column in columns))
+
+
+@lru_cache(maxsize=None)
+def _input_columns(name: str) -> Tuple[str, ...]:
+    """OHLCV-Spalten, die eine TA-Lib-Funktion erwartet (z.B. ATR → high, low, close)"""
+    columns = []
+    for value in talib.abstract.Function(name).input_names.values():
+        columns.extend([value] if isinstance(value, str) else value)
+    return tuple(columns)
+
+
+class IndicatorCache:
+    """
+    📈 Geteilte Indikator-Ergebnisse für Erkennung, Analyzer und Chart-Overlays
+
+    Attribute:
+        cache (MemoryCache): LRU-Speicher der Ergebnisse (Statistik über ``stats()``)
+    """
+
+    def __init__(self):
+        self.cache = MemoryCache(
+            max_entries=INDICATOR_CACHE_CONFIG['max_entries'],
+            max_bytes=INDICATOR_CACHE_CONFIG['max_bytes'],
+            default_ttl=INDICATOR_CACHE_CONFIG['ttl_seconds'],
+        )
+        self._inflight = SingleFlight()  # Parallele Misses derselben Serie nur einmal rechnen
+
+    @staticmethod
+    def compute(data: Arrays, name: str, **params) -> IndicatorResult:
+        """Rechnet einen TA-Lib-Indikator ohne Cache (z.B. für Teilfenster)"""
+        function = getattr(talib, name)
+        result = function(*(data[column] for column in _input_columns(name)), **params)
+        return tuple(result) if isinstance(result, (list, tuple)) else result
+
+    def get(self, data: Arrays, name: str, **params) -> IndicatorResult:
+        """
+        Indikator aus dem Cache oder frisch berechnet
+
+        Args:
+            data: Spalten-Arrays der Serie (``ohlcv_arrays``)
+            name: TA-Lib-Funktionsname ('SMA', 'RSI', 'MACD', 'BBANDS', 'ATR', ...)
+            **params: TA-Lib-Parameter (Teil des Cache-Keys)
+
+        Returns:
+            np.ndarray oder Tuple von Arrays (mehrere Outputs, z.B. MACD), read-only
+        """
+        if not INDICATOR_CACHE_CONFIG['enabled']:
+            return self.compute(data, name, **params)
+
+        key = (series_fingerprint(data, _input_columns(name)), name, tuple(sorted(params.items())))
+        result = self.cache.get(key)
+        if result is None:
+            result = self._inflight.do(key, self._compute_and_store, key, data, name, params)
+        return result
+
+    def _compute_and_store(self, key: Hashable, data: Arrays, name: str, params: Dict) -> IndicatorResult:
+        result = self.compute(data, name, **params)
+        for values in (result if isinstance(result, tuple) else (result,)):
+            values.flags.writeable = False
+        self.cache.set(key, result)
+        return result
+
+    def stats(self) -> Dict[str, float]:
+        """Hit/Miss-Zähler und Auslastung (Keys mit Präfix ``indicator_``)"""
+        stats = {f'indicator_{name}': value for name, value in self.cache.stats().items()}
+        stats['indicator_coalesced'] = self._inflight.coalesced
+        return stats
@@ -24,17 +24,77 @@ Autor: Pattern Pilot Team
 Version: 3.0
 """
 import ccxt
+import numpy as np
 import pandas as pd
 import talib
+from numpy.lib.stride_tricks import sliding_window_view
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 import time
 import threading
+from functools import partial
+from contextlib import contextmanager, nullcontext
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from queue import Queue
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Union, Tuple
 import time  # 'time' hinzufügen
 
-from config.settings import  PATTERN_CONFIG, EXCHANGE_CONFIG
+from config.settings import  (PATTERN_CONFIG, EXCHANGE_CONFIG, CACHE_CONFIG, RATE_LIMIT_CONFIG,
+                              HEDGE_CONFIG, CIRCUIT_BREAKER_CONFIG, SYMBOL_INDEX_CONFIG,
+                              MARKETS_SNAPSHOT_CONFIG, EXCHANGE_LOADING_CONFIG,
+                              MARKET_STATS_CONFIG, PREFETCH_CONFIG, INCREMENTAL_DETECTION_CONFIG)
+from core.memory_cache import MemoryCache, CacheEntry
+from core.timeframes import candle_close_ttl
+from core.single_flight import SingleFlight
+from core.rate_limiter import RateLimitScheduler
+from core.exchange_router import ExchangeRouter
+from core.circuit_breaker import CircuitBreaker
+from core.symbol_index import SymbolIndex
+from core.markets_registry import MarketsRegistry
+from core.prefetcher import Prefetcher
+from core.backfill import BackfillJob
+from core.markets_snapshot import load_snapshot, save_snapshot, diff_markets
+from core.market_stats import (TOP_SYMBOLS, DEFAULT_MARKET_STATS, summarize_market_stats,
+                               quotes_from_tickers)
+from core.ohlcv_data import (ohlcv_to_series, ohlcv_arrays, merge_candles, buffer_covers,
+                              incremental_since, page_limit, build_buffer, tail_view)
+from core.ohlcv_series import OHLCVSeries
+from core.signal_table import SignalTable, SignalTableBuilder, DIRECTION_CODES
+from core.crossings import crossings, merge_crossings
+from core.incremental_detection import IncrementalDetector
+from core.indicator_cache import IndicatorCache
+
+# TA-Lib-Candlestick-Patterns (Name → Funktion)
+CANDLESTICK_PATTERNS = {
+    'doji': talib.CDLDOJI,
+    'hammer': talib.CDLHAMMER,
+    'hanging_man': talib.CDLHANGINGMAN,
+    'shooting_star': talib.CDLSHOOTINGSTAR,
+    'engulfing_bullish': talib.CDLENGULFING,
+    'engulfing_bearish': talib.CDLENGULFING,
+    'morning_star': talib.CDLMORNINGSTAR,
+    'evening_star': talib.CDLEVENINGSTAR,
+    'three_white_soldiers': talib.CDL3WHITESOLDIERS,
+    'three_black_crows': talib.CDL3BLACKCROWS,
+    'harami': talib.CDLHARAMI,
+    'piercing': talib.CDLPIERCING,
+    'dark_cloud': talib.CDLDARKCLOUDCOVER,
+    # Zusätzliche einzelne Candlestick-Patterns
+    'inverted_hammer': talib.CDLINVERTEDHAMMER,     # Umgedrehter Hammer
+    'marubozu': talib.CDLMARUBOZU,                  # Volle Kerze ohne Schatten
+    'spinning_top': talib.CDLSPINNINGTOP,           # Spinning Top (Unentschlossenheit)
+    'dragonfly_doji': talib.CDLDRAGONFLYDOJI,       # Dragonfly Doji
+    # Mehr Trend-Confirmation Patterns
+    'kicking': talib.CDLKICKING,                    # Kicking Pattern (starker Trend)
+    'tasuki_gap': talib.CDLTASUKIGAP,               # Tasuki Gap (Trendfortsetzung)
+    'breakaway': talib.CDLBREAKAWAY,                # Breakaway (Trendstart)
+    'doji_star': talib.CDLDOJISTAR,                 # Doji Star (potentielle Umkehr)
+}
+# (die wichtigsten von 61 verfügbaren)
+
+# Eigene Indikator-Patterns, immer im Ergebnis (auch ohne Signale)
+INDICATOR_PATTERNS = ['bollinger_squeeze', 'ma_crossover', 'support_resistance',
+                      'rsi_oversold', 'rsi_overbought', 'macd_crossover']
 
 #==============================================================================
 # region                🔄 MARKET ENGINE HAUPTKLASSE
@@ -56,7 +116,7 @@ class MarketEngine:
 
     Attribute:
         exchanges (dict): Exchange-Objekte oder Status-Informationen
-        cache (dict): In-Memory-Cache für API-Anfragen
+        cache (MemoryCache): Begrenzter LRU+TTL-Cache für API-Daten
 
     🚀 Ersetzt: api/api_manager.py + patterns/__init__.py + cache/
     
@@ -65,25 +125,134 @@ class MarketEngine:
 
     def __init__(self):
         self.exchanges = {}  # Leeres Dict erstmal
-        self.cache = {}  # Cache beibehalten
-
-        # Für jeden Exchange initialen "loading" Status setzen
-        for name in ['binance', 'coinbase', 'kraken', 'bybit', 'okx']:
-            self.exchanges[name] = {'status': 'loading'}
-
-        # Threading starten
-        self._start_exchange_threads()
+        # Begrenzter Cache: eine Candle-Serie pro (exchange, symbol, timeframe) + Stats
+        self.cache = MemoryCache(
+            max_entries=CACHE_CONFIG['max_entries'],
+            max_bytes=CACHE_CONFIG['max_bytes'],
+            default_ttl=CACHE_CONFIG['ttl_seconds'],
+        )
+        self._inflight = SingleFlight()  # Coalescing paralleler OHLCV-Abrufe
+        self.rate_limiter = RateLimitScheduler()  # Token-Bucket pro Exchange
+
+        # Latenz/Fehler-Telemetrie pro Exchange → Routing-Reihenfolge + Hedge-Delay
+        # (nur die Exchanges, die dieser Prozess bedient)
+        self.router = ExchangeRouter(priority=[name for name in EXCHANGE_CONFIG
+                                               if name in EXCHANGE_LOADING_CONFIG['exchanges']])
+
+        # Unified Symbol → Exchanges, die es listen (wird pro geladenem Exchange aktualisiert)
+        self.symbol_index = SymbolIndex(priority=self.router.priority)
+        # Kompakte Markets-Spalten für Symbol-Listen + Typeahead-Suche
+        self.markets_registry = MarketsRegistry(priority=self.router.priority)
+
+        # Fehlerhafte Exchanges und tote Routen sofort überspringen
+        self.circuit_breaker = CircuitBreaker()
+        self.negative_cache = MemoryCache(
+            max_entries=CIRCUIT_BREAKER_CONFIG['negative_cache_entries'],
+            default_ttl=CIRCUIT_BREAKER_CONFIG['negative_ttl_seconds'],
+        )
+        self._hedge_executor = ThreadPoolExecutor(max_workers=HEDGE_CONFIG['max_workers'],
+                                                  thread_name_prefix='ohlcv-hedge')
+
+        # Stale-While-Revalidate: Hintergrund-Refreshs abgelaufener Charts
+        self._revalidate_executor = ThreadPoolExecutor(max_workers=CACHE_CONFIG['revalidate_workers'],
+                                                       thread_name_prefix='ohlcv-revalidate')
+        self._revalidating = set()
+        self._revalidating_lock = threading.Lock()
+
+        # Eager-Exchanges laden sofort, alle anderen erst beim ersten Zugriff ("idle")
+        eager = EXCHANGE_LOADING_CONFIG['eager']
+        self._eager = set(self.router.priority) if '*' in eager else set(eager) & set(self.router.priority)
+        self._last_used: Dict[str, float] = {}
+        self._usage = threading.local()  # background=True → Calls zählen nicht als Nutzung
+        self._lazy_loading = set()
+        self._background_loads = set()  # Lazy-Loads, die das Routing im Hintergrund angestoßen hat
+        self._background_lock = threading.Lock()
+        for name in self.router.priority:
+            self.exchanges[name] = {'status': 'loading' if name in self._eager else 'idle'}
+
+        # Markets aus dem letzten Snapshot → Symbole + Routing sofort verfügbar
+        self._pending_loads = 0
+        self._pending_lock = threading.Lock()
+        self._refreshed = set()  # Exchanges mit frisch geladenen Markets (→ nächster Snapshot)
+        if MARKETS_SNAPSHOT_CONFIG['enabled']:
+            self._restore_markets_snapshot()
+
+        # Status-Bar-Statistiken: Callback liest nur den Snapshot, Refresh im Hintergrund
+        self._market_stats = dict(DEFAULT_MARKET_STATS)
+
+        # Watchlist + häufig genutzte Charts vor Ablauf im Hintergrund erneuern
+        self.prefetcher = Prefetcher(self)
+
+        # SMA/RSI/MACD/BBANDS einmal pro Serie: geteilt von Erkennung, Analyzern, Overlays
+        self.indicators = IndicatorCache()
+
+        # Chart-Refresh: Signale unveränderter Candles wiederverwenden, nur neue scannen
+        # (Teilfenster rechnen ihre Indikatoren ohne Cache, sie werden nie wieder gelesen)
+        self.incremental_detector = IncrementalDetector(
+            self._detect_arrays, group_order=list(CANDLESTICK_PATTERNS) + INDICATOR_PATTERNS,
+            keep_empty=INDICATOR_PATTERNS, candlestick_functions=CANDLESTICK_PATTERNS.values(),
+            detect_window=partial(self._detect_arrays, use_cache=False))
+
+        # Hintergrund-Threads erst starten, wenn alle Attribute existieren
+        # (Stats-Refresh → Candle-Fallback → get_ohlcv_series → self.prefetcher)
+        self._start_exchange_threads()  # lädt frische Markets und tauscht sie ein
+        if EXCHANGE_LOADING_CONFIG['idle_unload_seconds']:
+            threading.Thread(target=self._idle_sweeper, name='exchange-idle-sweeper',
+                             daemon=True).start()
+        threading.Thread(target=self._market_stats_loop, name='market-stats-refresh',
+                         daemon=True).start()
+        if PREFETCH_CONFIG['enabled']:
+            self.prefetcher.start()
 
         print(f"✅ MarketEngine: UI startet sofort, Exchanges laden im Hintergrund")
 
     # •••••••••••••••••••••••••• 🔄 THREAD-MANAGEMENT •••••••••••••••••••••••••• #
-    def _start_exchange_threads(self):
-        """Startet Exchange-Loading parallel im Hintergrund"""
-        # Configs aus settings.py holen statt hardcoded
+    def _exchange_configs(self) -> List[Tuple[str, Any, Dict]]:
+        """(name, ccxt-Klasse, config) pro Exchange aus settings.py"""
         configs = []
         for exchange_name, config in EXCHANGE_CONFIG.items():
+            if exchange_name not in self.router.priority:
+                continue
             exchange_class = getattr(ccxt, exchange_name)
+            if RATE_LIMIT_CONFIG['enabled']:
+                # Drosselung übernimmt der Token-Bucket-Scheduler statt ccxt-Sleeps
+                config = {**config, 'enableRateLimit': False}
             configs.append((exchange_name, exchange_class, config))
+        return configs
+
+    def _restore_markets_snapshot(self):
+        """
+        Erzeugt Exchanges synchron aus dem gespeicherten Markets-Snapshot
+
+        Kein Netzwerk-Call: ``set_markets`` übernimmt die gespeicherten
+        Markets direkt. Fehlt der Snapshot oder ist er zu alt, bleibt
+        alles beim normalen Laden im Hintergrund. Lazy Exchanges werden
+        nicht instanziiert, sondern nur in den Symbol-Index übernommen,
+        damit das Routing sie beim ersten passenden Request laden kann.
+        """
+        snapshot = load_snapshot()
+        if not snapshot:
+            return
+
+        for name, exchange_class, config in self._exchange_configs():
+            data = snapshot.get(name)
+            if not data or not data.get('markets'):
+                continue
+            if name not in self._eager:
+                self._index_markets(name, data['markets'])
+                continue
+            try:
+                exchange = exchange_class(config)
+                exchange.set_markets(data['markets'], data.get('currencies') or None)
+                self.exchanges[name] = exchange
+                self._index_markets(name, exchange.markets)
+            except Exception as e:
+                print(f"⚠️ {name}: Snapshot-Markets nicht übernommen: {e}")
+
+    def _start_exchange_threads(self):
+        """Startet Exchange-Loading parallel im Hintergrund"""
+        # Configs aus settings.py holen statt hardcoded
+        configs = self._exchange_configs()
 
         # configs = [
         #     ('binance', ccxt.binance, {'rateLimit': 1200}),
@@ -93,11 +262,15 @@ class MarketEngine:
         #     ('okx', ccxt.okx, {'rateLimit': 1000}),
         # ]
 
-        # Für jeden Exchange initialen "loading" Status setzen
+        configs = [(name, cls, config) for name, cls, config in configs if name in self._eager]
+
+        # Für jeden Exchange initialen "loading" Status setzen (Snapshot-Exchanges bleiben online)
         for name, _, _ in configs:
-            self.exchanges[name] = {'status': 'loading'}
+            if isinstance(self.exchanges.get(name, {}), dict):
+                self.exchanges[name] = {'status': 'loading'}
 
         # Für jeden Exchange eigenen Thread starten
+        self._pending_loads = len(configs)
         for name, exchange_class, config in configs:
             thread = threading.Thread(
                 target=self._load_exchange_thread,
@@ -107,13 +280,23 @@ class MarketEngine:
             thread.start()
 
     def _load_exchange_thread(self, name, exchange_class, config):
-        """In separatem Thread ausgeführt
+        """Thread-Wrapper um _load_exchange, speichert nach dem letzten Exchange den Snapshot"""
+        try:
+            self._load_exchange(name, exchange_class, config)
+        finally:
+            self._on_exchange_loaded()
+
+    def _load_exchange(self, name, exchange_class, config):
+        """
         Lädt einen Exchange in einem separaten Thread.
 
-        Wird durch _start_exchange_threads für jede Börse aufgerufen.
+        Wird durch _start_exchange_threads für jede Eager-Börse und durch
+        _ensure_exchange für Lazy-Börsen aufgerufen.
         Setzt den Exchange-Status während der Ladezeit auf 'loading',
         nach erfolgreicher Verbindung auf ein ccxt.Exchange-Objekt
         oder bei Fehler auf {'status': 'offline', 'error': '...'}.
+        Ein aus dem Snapshot erzeugter Exchange wird erst nach erfolgreichem
+        ``load_markets`` ersetzt und bleibt bei Fehlern mit alten Markets online.
 
         Args:
             name (str): Name des Exchanges (z.B. 'binance')
@@ -125,20 +308,197 @@ class MarketEngine:
             exchange = exchange_class(config)
             exchange.load_markets()
 
-            # Exchange im Dictionary aktualisieren
+            previous = self.exchanges.get(name)
+            if not isinstance(previous, dict) and previous is not None:
+                diff = diff_markets(previous.markets, exchange.markets)
+                print(f"🔄 {name}: Snapshot aktualisiert "
+                      f"(+{diff['added']} / -{diff['removed']} markets)")
+
+            # Exchange im Dictionary aktualisieren + Routing-Index neu aufbauen
             self.exchanges[name] = exchange
+            self._index_markets(name, exchange.markets)
+            self._last_used[name] = time.time()
+            self._refreshed.add(name)
 
             print(f"✅ {name}: {len(exchange.markets)} markets")
         except Exception as e:
-            # Fehler-Status setzen
-            self.exchanges[name] = {'status': 'offline', 'error': str(e)}
-            print(f"❌ {name} failed: {e}")
+            if not isinstance(self.exchanges.get(name, {}), dict):
+                # Snapshot-Markets weiter nutzen, nächster Start versucht es erneut
+                print(f"⚠️ {name}: Refresh failed, nutze Snapshot-Markets: {e}")
+            else:
+                # Fehler-Status setzen
+                self.exchanges[name] = {'status': 'offline', 'error': str(e)}
+                print(f"❌ {name} failed: {e}")
+
+    def _index_markets(self, name: str, markets: Dict[str, Dict]):
+        """Übernimmt Markets in Symbol-Index (Routing) und Markets-Registry (Listen/Suche)"""
+        self.symbol_index.update_exchange(name, markets)
+        self.markets_registry.update_exchange(name, markets)
+
+    def _on_exchange_loaded(self):
+        """Speichert den Markets-Snapshot, sobald alle Lade-Threads fertig sind"""
+        with self._pending_lock:
+            self._pending_loads -= 1
+            if self._pending_loads > 0:
+                return
+
+        self._save_markets_snapshot()
+
+    def _save_markets_snapshot(self):
+        """Speichert die frisch geladenen Markets (andere Einträge bleiben im Snapshot)"""
+        # Nur frisch geladene Markets speichern, damit veraltete Snapshots nicht "verjüngt" werden
+        refreshed = {name: self.exchanges[name] for name in list(self._refreshed)
+                     if not isinstance(self.exchanges.get(name, {}), dict)}
+        if MARKETS_SNAPSHOT_CONFIG['enabled'] and refreshed:
+            save_snapshot(refreshed)
+
+    # •••••••••••••••••••••••••• 💤 LAZY LOADING •••••••••••••••••••••••••• #
+    def _ensure_exchange(self, name: str):
+        """
+        Liefert das geladene ccxt-Objekt, Lazy-Exchanges werden beim ersten Zugriff geladen
+
+        Parallele Zugriffe auf denselben noch nicht geladenen Exchange teilen
+        sich einen ``load_markets``-Call.
+
+        Raises:
+            ccxt.ExchangeNotAvailable: Exchange offline, nicht bedient oder Laden fehlgeschlagen
+        """
+        exchange = self.exchanges.get(name)
+        if exchange is not None and not isinstance(exchange, dict):
+            if not self._in_background():
+                self._last_used[name] = time.time()
+            return exchange
+
+        status = exchange.get('status') if exchange else None
+        if not self._lazy_loadable(name, status):
+            raise ccxt.ExchangeNotAvailable(f"{name}: {status or 'not configured'}")
+
+        self._inflight.do(('load_exchange', name), self._load_lazy_exchange, name)
+
+        exchange = self.exchanges.get(name)
+        if isinstance(exchange, dict):
+            raise ccxt.ExchangeNotAvailable(f"{name}: {exchange.get('error', exchange.get('status'))}")
+        return exchange
+
+    def _load_in_background(self, name: str):
+        """Lädt einen Lazy-Exchange in einem Daemon-Thread (höchstens einer pro Exchange)"""
+        with self._background_lock:
+            if name in self._background_loads:
+                return
+            self._background_loads.add(name)
+
+        def run():
+            try:
+                self._ensure_exchange(name)
+            except ccxt.ExchangeNotAvailable as e:
+                print(f"⚠️ {name}: Lazy-Load im Hintergrund fehlgeschlagen: {e}")
+            finally:
+                with self._background_lock:
+                    self._background_loads.discard(name)
+
+        threading.Thread(target=run, name=f'exchange-lazy-{name}', daemon=True).start()
+
+    @contextmanager
+    def _background_use(self):
+        """
+        Exchange-Calls in diesem Block (aktueller Thread) zählen nicht als Nutzung
+
+        Prefetcher und Stats-Refresh würden sonst jeden Watchlist-Exchange
+        ewig "benutzt" halten, ``idle_unload_seconds`` griffe nie.
+        """
+        previous = self._in_background()
+        self._usage.background = True
+        try:
+            yield
+        finally:
+            self._usage.background = previous
+
+    def _in_background(self) -> bool:
+        return getattr(self._usage, 'background', False)
+
+    def _run_in_background(self, fn, *args):
+        """``fn(*args)`` mit ``_background_use`` (für Executor-Threads)"""
+        with self._background_use():
+            return fn(*args)
+
+    def _lazy_loadable(self, name: str, status: Optional[str]) -> bool:
+        """True für idle Exchanges und laufende Lazy-Ladevorgänge (denen man beitreten kann)"""
+        return status == 'idle' or (status == 'loading' and
+                                    (name not in self._eager or name in self._lazy_loading))
+
+    def _load_lazy_exchange(self, name: str):
+        """Lädt einen Lazy-Exchange synchron (innerhalb des Single-Flight-Calls)"""
+        current = self.exchanges.get(name)
+        if not isinstance(current, dict) or current.get('status') != 'idle':
+            return  # Bereits von einem vorherigen Flight geladen (oder fehlgeschlagen)
+
+        _, exchange_class, config = next(entry for entry in self._exchange_configs()
+                                         if entry[0] == name)
+
+        self._lazy_loading.add(name)
+        self.exchanges[name] = {'status': 'loading'}
+        try:
+            self._load_exchange(name, exchange_class, config)
+        finally:
+            self._lazy_loading.discard(name)
+
+        if name in self._refreshed:
+            self._save_markets_snapshot()
+
+    def _idle_sweeper(self):
+        """Hintergrund-Loop: entlädt regelmäßig ungenutzte Exchanges"""
+        while True:
+            time.sleep(EXCHANGE_LOADING_CONFIG['idle_check_seconds'])
+            try:
+                self.unload_idle_exchanges()
+            except Exception as e:
+                print(f"❌ Idle-Sweeper error: {e}")
+
+    def unload_idle_exchanges(self, max_idle: float = None) -> List[str]:
+        """
+        💤 Entlädt Exchanges, die länger als ``max_idle`` Sekunden nicht genutzt wurden
+
+        Der Exchange geht zurück in den Status "idle": Markets bleiben im
+        Symbol-Index (Routing findet ihn weiter), das ccxt-Objekt wird
+        freigegeben und beim nächsten Zugriff neu geladen.
+
+        Args:
+            max_idle: Leerlauf-Schwelle in Sekunden
+                (None = EXCHANGE_LOADING_CONFIG['idle_unload_seconds'])
+
+        Returns:
+            List[str]: Namen der entladenen Exchanges
+        """
+        max_idle = EXCHANGE_LOADING_CONFIG['idle_unload_seconds'] if max_idle is None else max_idle
+        now = time.time()
+        unloaded = []
+
+        for name in self._online_exchanges():
+            if name in self._eager and not EXCHANGE_LOADING_CONFIG['unload_eager']:
+                continue
+            idle_for = now - self._last_used.get(name, now)
+            if idle_for < max_idle:
+                continue
+
+            exchange = self.exchanges[name]
+            self.exchanges[name] = {'status': 'idle'}
+            self._refreshed.discard(name)
+            try:
+                exchange.session.close()  # HTTP-Verbindungen freigeben
+            except Exception:
+                pass
+
+            unloaded.append(name)
+            print(f"💤 {name}: nach {idle_for:.0f}s ohne Nutzung entladen")
+
+        return unloaded
 
     # ==============================================================================
     # region               📊 DATEN-ABRUF METHODEN
     # ==============================================================================
     def get_ohlcv(self, symbol: str, timeframe: str = '1d', 
-                  limit: int = 500, exchange: str = None) -> pd.DataFrame:
+                  limit: int = 500, exchange: str = None,
+                  hedge: bool = None, stale_ok: bool = None) -> pd.DataFrame:
         """
         🎯 Ersetzt: Deine ganze api/ Struktur
         
@@ -154,9 +514,14 @@ class MarketEngine:
             timeframe: Candlestick interval ("1m", "5m", "1h", "1d", "1w")
             limit: Number of candlesticks to retrieve (50-1000)
             exchange: Specific exchange name or None for auto-routing
+            hedge: Race a slow primary against the next exchange
+                (None = HEDGE_CONFIG['enabled'], only used with auto-routing)
+            stale_ok: Return an expired frame immediately and refresh it in the
+                background (None = CACHE_CONFIG['stale_while_revalidate'])
 
         Returns:
-            DataFrame with columns: timestamp, open, high, low, close, volume, datetime
+            DataFrame with columns: timestamp, open, high, low, close, volume, datetime.
+            ``df.attrs`` carries ``stale`` (bool) and ``age_seconds`` of the data.
 
         Raises:
             Exception: When no data is available from any exchange
@@ -166,73 +531,503 @@ class MarketEngine:
             >>> print(f"Retrieved {len(df)} candlesticks")
 
         Note:
-            Uses 5-minute caching to optimize API rate limits across exchanges.
+            Cached data stays valid until the next expected candle close of the
+            timeframe (plus a short grace period).
+            Refreshes only fetch candles newer than the last buffered timestamp.
+            One series is kept per symbol/timeframe; smaller limits are served as
+            tail slices of it without touching the network.
+            The frame is built from the cached OHLCVSeries only here (UI edge) and
+            owns writable copies of the columns, so callers may modify it. Use
+            ``get_ohlcv_series`` for the zero-copy, read-only path.
         """
-        cache_key = f"{symbol}_{timeframe}_{limit}"
-        
-        # Cache check
-        if cache_key in self.cache:
-            cached_data, timestamp = self.cache[cache_key]
-            if time.time() - timestamp < 300:  # 5min cache
+        series = self.get_ohlcv_series(symbol, timeframe, limit, exchange, hedge, stale_ok)
+        return series.to_frame(copy=True)
+
+    def get_ohlcv_series(self, symbol: str, timeframe: str = '1d',
+                         limit: int = 500, exchange: str = None,
+                         hedge: bool = None, stale_ok: bool = None) -> OHLCVSeries:
+        """
+        🕯️ Wie ``get_ohlcv``, liefert aber die gepufferte OHLCVSeries (Tail-View, ohne DataFrame)
+
+        ``series.attrs`` trägt ``stale`` und ``age_seconds``; eine leere Serie,
+        wenn kein Exchange Daten liefert.
+        """
+        # Zugriffshäufigkeit → Priorität des Refresh-Ahead-Prefetchers
+        self.prefetcher.record_access(symbol, timeframe, limit, exchange)
+
+        # Routen (Exchange + natives Symbol) aus dem Symbol-Index, nach Antwortzeit sortiert
+        routes = self._resolve_routes(symbol, exchange)
+
+        # Cache check - eine Serie pro Symbol/Timeframe, kleinere Limits als Tail-Slice
+        for ex_name, market_symbol in routes:
+            buffer = self.cache.get(('ohlcv', ex_name, market_symbol, timeframe))
+            if buffer and buffer_covers(buffer, limit):
                 print(f"💾 Cache hit: {symbol}")
-                return cached_data
-        
-        # Exchange priority order
-        if exchange and exchange in self.exchanges:
-            # Prüfen ob Exchange online ist
-            if isinstance(self.exchanges[exchange], dict):
-                if self.exchanges[exchange].get('status') != 'online':
-                    exchange = None  # Fallback, wenn Exchange nicht online
-            exchange_order = [exchange] if exchange else []
-        else:
-            # Nur Online-Exchanges verwenden
-            exchange_order = []
-
-            # Fallback-Liste mit verfügbaren Exchanges
-        if not exchange_order:
-            for ex_name in ['binance', 'coinbase', 'kraken', 'bybit', 'okx']:
-                # Nur Online-Exchanges zur Liste hinzufügen
-                if ex_name in self.exchanges and not isinstance(self.exchanges[ex_name], dict):
-                    exchange_order.append(ex_name)
-                continue
-                
+                return self._with_freshness(tail_view(buffer['data'], limit), buffer)
+
+        # Stale-While-Revalidate: abgelaufene Serie sofort liefern, Refresh im Hintergrund
+        stale_ok = CACHE_CONFIG['stale_while_revalidate'] if stale_ok is None else stale_ok
+        if stale_ok:
+            entry = self.ohlcv_cache_entry(symbol, timeframe, limit, exchange)
+            if entry and time.time() - entry.expires_at <= CACHE_CONFIG['max_stale_seconds']:
+                print(f"♻️ Stale hit: {symbol} (Refresh im Hintergrund)")
+                self._revalidate(symbol, timeframe, limit, exchange)
+                return self._with_freshness(tail_view(entry.value['data'], limit),
+                                            entry.value, stale=True)
+
+        # Gleichzeitige Anfragen derselben Serie teilen sich einen Exchange-Request
+        # (Key ohne limit: geholt wird das größte wartende limit, jeder schneidet selbst zu)
+        hedge = HEDGE_CONFIG['enabled'] if hedge is None else hedge
+        flight_key = (tuple(routes), timeframe, hedge)
+        series = self._inflight.do_sized(
+            flight_key, limit,
+            lambda size: self._fetch_ohlcv_failover(routes, symbol, timeframe, size, hedge))
+        return self._with_freshness(tail_view(series, limit), None) if not series.empty else series
+
+    def _with_freshness(self, series: OHLCVSeries, buffer: Optional[Dict],
+                        stale: bool = False) -> OHLCVSeries:
+        """Markiert einen OHLCV-Slice mit ``attrs['stale']`` und ``attrs['age_seconds']``"""
+        fetched_at = buffer.get('fetched_at') if buffer else None
+        age = time.time() - fetched_at if fetched_at else 0.0
+        series.attrs = {'stale': stale, 'age_seconds': round(age, 1)}
+        return series
+
+    def _revalidate(self, symbol: str, timeframe: str, limit: int, exchange: str = None):
+        """Startet einen Hintergrund-Refresh (höchstens einer pro Chart gleichzeitig)"""
+        key = (symbol, timeframe, exchange)
+        with self._revalidating_lock:
+            if key in self._revalidating:
+                return
+            self._revalidating.add(key)
+
+        def run():
             try:
-                exchange_obj = self.exchanges[ex_name]
-                print(f"🔄 Trying {ex_name} for {symbol}...")
-                
-                # Fetch OHLCV
-                ohlcv = exchange_obj.fetch_ohlcv(symbol, timeframe, limit=limit)
-                
-                if not ohlcv:
-                    return pd.DataFrame()
-                
-                # Convert to DataFrame
-                df = pd.DataFrame(ohlcv, columns=[
-                    'timestamp', 'open', 'high', 'low', 'close', 'volume'
-                ])
+                # Vom Nutzer ausgelöst (veralteter Chart angezeigt) → zählt als Nutzung
+                self.refresh_ohlcv(symbol, timeframe, limit, exchange, background=False)
+            except Exception as e:
+                print(f"❌ Revalidate {symbol} ({timeframe}) failed: {e}")
+            finally:
+                with self._revalidating_lock:
+                    self._revalidating.discard(key)
+
+        self._revalidate_executor.submit(run)
+
+    def ohlcv_cache_entry(self, symbol: str, timeframe: str, limit: int,
+                          exchange: str = None) -> Optional[CacheEntry]:
+        """
+        Cache-Eintrag (auch abgelaufen), der ``limit`` Candles von ``symbol`` abdeckt
+
+        Bei mehreren Routen gewinnt der am längsten gültige Eintrag.
+        Kein Netzwerk-Call (auch kein Lazy-Loading), zählt nicht als Cache-Hit/Miss.
+        """
+        best = None
+        for ex_name, market_symbol in self._resolve_routes(symbol, exchange, loaded_only=True):
+            entry = self.cache.peek(('ohlcv', ex_name, market_symbol, timeframe))
+            if entry and buffer_covers(entry.value, limit) and \
+                    (best is None or entry.expires_at > best.expires_at):
+                best = entry
+        return best
+
+    def refresh_ohlcv(self, symbol: str, timeframe: str = '1d', limit: int = 500,
+                      exchange: str = None, background: bool = True) -> OHLCVSeries:
+        """
+        🔥 Erneuert die gecachte Serie sofort, auch wenn sie noch gültig ist
+
+        Für den Prefetcher: läuft über denselben Single-Flight-Key wie
+        ``get_ohlcv``, gleichzeitige Nutzer-Requests hängen sich also an.
+        Nutzt nur bereits geladene Exchanges – ein Hintergrund-Refresh darf
+        keine Lazy-Exchanges laden.
+
+        Args:
+            background: True = zählt nicht als Nutzung des Exchanges (Idle-Unload
+                bleibt möglich); False für vom Nutzer ausgelöste Refreshs
+
+        Returns:
+            OHLCVSeries: Komplette gepufferte Serie oder leere Serie (keine Route)
+        """
+        routes = self._resolve_routes(symbol, exchange, loaded_only=True)
+        if not routes:
+            return OHLCVSeries.empty_series()
+        flight_key = (tuple(routes), timeframe, False)
+        with self._background_use() if background else nullcontext():
+            return self._inflight.do_sized(
+                flight_key, limit,
+                lambda size: self._fetch_ohlcv_failover(routes, symbol, timeframe, size, False, True))
+
+    def resolve_routes(self, symbol: str, exchange: str = None) -> List[Tuple[str, str]]:
+        """
+        🧭 Routen (exchange, market_symbol) für ``symbol`` in Versuchsreihenfolge
+
+        Öffentliche Variante von ``_resolve_routes`` für Jobs außerhalb der
+        Engine (z.B. ``BackfillJob``); darf Lazy-Exchanges laden.
+        """
+        return self._resolve_routes(symbol, exchange)
+
+    def fetch_ohlcv_page(self, exchange: str, market_symbol: str, timeframe: str,
+                         since: int = None, limit: int = None) -> List[List]:
+        """
+        📄 Eine rohe ``fetch_ohlcv``-Seite am Cache vorbei
+
+        Läuft über Rate-Limit-Scheduler, Circuit-Breaker und Router-Telemetrie
+        wie jeder andere Exchange-Call.
+
+        Returns:
+            List[List]: ccxt-OHLCV ``[timestamp, open, high, low, close, volume]``
+        """
+        return self._call_exchange(exchange, 'fetch_ohlcv', market_symbol, timeframe,
+                                   since=since, limit=limit)
+
+    def _resolve_routes(self, symbol: str, exchange: str = None,
+                        loaded_only: bool = False) -> List[Tuple[str, str]]:
+        """
+        🧭 Ermittelt die Exchanges, die ``symbol`` liefern können
+
+        Nutzt den Symbol-Index statt alle Exchanges blind durchzuprobieren.
+        Exakte Treffer werden nach erwarteter Antwortzeit sortiert; nur wenn
+        kein Online-Exchange das Pair exakt listet, kommen Quote-Aliase
+        (z.B. BTC/USD für BTC/USDT) zum Zug. Lazy-Exchanges ("idle") zählen
+        als verfügbar, solange Snapshot/Index ihre Markets kennen. Exchanges
+        mit unbekannten Markets werden nur geladen, wenn sonst keine Route
+        existiert – beim Auto-Routing im Hintergrund (bis dahin keine Route).
+
+        Args:
+            symbol: Angefragtes Unified Symbol
+            exchange: Spezifischer Exchange oder None für Auto-Routing
+            loaded_only: Nur geladene Exchanges, nie Lazy-Loading auslösen
+                (Hintergrund-Threads wie der Prefetcher)
+
+        Returns:
+            List[(exchange, market_symbol)]: Routen in Versuchsreihenfolge
+        """
+        available = self._online_exchanges() if loaded_only else self._available_exchanges()
+
+        # Gewünschter Exchange nur wenn verfügbar, sonst Auto-Routing
+        if exchange and exchange not in available:
+            exchange = None
+
+        def index_routes():
+            return [(ex_name, market_symbol)
+                    for ex_name, market_symbol, _ in self.symbol_index.routes(
+                        symbol, aliases=SYMBOL_INDEX_CONFIG['use_aliases'])
+                    if ex_name in available and (exchange is None or ex_name == exchange)]
+
+        routes = index_routes()
+
+        # Lazy-Exchanges ohne bekannte Markets (kein Snapshot) nur, wenn sonst nichts passt:
+        # ein explizit gewählter wird sofort geladen, beim Auto-Routing laden sie im
+        # Hintergrund – ein unbekanntes/vertipptes Symbol blockiert den Callback nicht
+        if not routes and not loaded_only:
+            unknown = [ex_name for ex_name in ([exchange] if exchange else available)
+                       if not self.symbol_index.has_exchange(ex_name)]
+            if exchange and unknown:
+                try:
+                    self._ensure_exchange(exchange)
+                    routes = index_routes()
+                except ccxt.ExchangeNotAvailable:
+                    pass
+            else:
+                for ex_name in unknown:
+                    self._load_in_background(ex_name)
+
+        exact = [route for route in routes if route[1] == symbol]
+        routes = exact or routes
+
+        rank = {ex_name: i for i, ex_name in enumerate(self.router.rank({r[0] for r in routes}))}
+        return sorted(routes, key=lambda route: rank[route[0]])
+
+    def _fetch_ohlcv_failover(self, routes: List[Tuple[str, str]], symbol: str,
+                              timeframe: str, limit: int, hedge: bool = False,
+                              force: bool = False) -> OHLCVSeries:
+        """
+        Holt OHLCV von der ersten Route in ``routes``, die Daten liefert
+
+        Wird über ``SingleFlight`` nur vom ersten von mehreren gleichzeitigen
+        Aufrufern ausgeführt. Vorher wird der Cache erneut geprüft, da ein
+        gerade beendeter Abruf ihn bereits gefüllt haben kann (außer mit
+        ``force``). Mit ``hedge`` wird statt seriellem Failover
+        ``_fetch_ohlcv_hedged`` genutzt.
+
+        Returns:
+            OHLCVSeries: Komplette gepufferte Serie oder leere Serie
+        """
+        for ex_name, market_symbol in ([] if force else routes):
+            entry = self.cache.peek(('ohlcv', ex_name, market_symbol, timeframe))
+            if entry and not entry.expired and buffer_covers(entry.value, limit):
+                return entry.value['data']
+
+        routes = [(ex_name, market_symbol) for ex_name, market_symbol in routes
+                  if self._route_allowed(ex_name, market_symbol, timeframe)]
+
+        if hedge and len(routes) > 1:
+            return self._fetch_ohlcv_hedged(routes, symbol, timeframe, limit)
+
+        for ex_name, market_symbol in routes:
+            try:
+                print(f"🔄 Trying {ex_name} for {market_symbol}...")
                 
-                # Convert timestamp to datetime
-                df['datetime'] = pd.to_datetime(df['timestamp'], unit='ms')
-                df = df.sort_values('datetime').reset_index(drop=True)
+                # Fetch OHLCV (inkrementell über Candle-Buffer)
+                series = self._fetch_ohlcv_incremental(ex_name, market_symbol, timeframe, limit)
                 
-                # Cache result
-                self.cache[cache_key] = (df, time.time())
+                if series.empty:
+                    continue
                 
-                print(f"✅ {ex_name}: {len(df)} candles")
-                return df
+                print(f"✅ {ex_name}: {len(series)} candles")
+                return series
                 
             except Exception as e:
                 print(f"❌ {ex_name} error: {e}")
-                return pd.DataFrame()
+                continue
         
         print(f"❌ No data found for {symbol}")
-        return pd.DataFrame()
+        return OHLCVSeries.empty_series()
+
+    # •••••••••••••••••••••••••• 🏁 HEDGED REQUESTS •••••••••••••••••••••••••• #
+    def _fetch_ohlcv_hedged(self, routes: List[Tuple[str, str]], symbol: str,
+                            timeframe: str, limit: int) -> OHLCVSeries:
+        """
+        🏁 Failover mit Hedging gegen langsame Exchanges
+
+        Startet den Request auf der ersten Route. Antwortet deren Exchange
+        nicht innerhalb seines Latenz-Perzentils (``HEDGE_CONFIG``), geht
+        dieselbe Anfrage zusätzlich an die nächste Route (Online-Exchange,
+        der das Symbol listet). Das erste nicht-leere Ergebnis gewinnt, die
+        übrigen Requests werden abgebrochen (falls noch nicht gestartet) bzw.
+        ignoriert. Fehlgeschlagene Requests lösen sofort die nächste Route aus.
+
+        Returns:
+            OHLCVSeries: Komplette gepufferte Serie oder leere Serie
+        """
+        candidates = list(routes)
+        pending = {}
+        # Hintergrund-Markierung in die Hedge-Threads mitnehmen (thread-lokal)
+        fetch = (partial(self._run_in_background, self._fetch_ohlcv_incremental)
+                 if self._in_background() else self._fetch_ohlcv_incremental)
+
+        def launch() -> None:
+            ex_name, market_symbol = candidates.pop(0)
+            print(f"🔄 Trying {ex_name} for {market_symbol}...")
+            future = self._hedge_executor.submit(fetch, ex_name, market_symbol, timeframe, limit)
+            pending[future] = ex_name
+
+        if candidates:
+            launch()
+
+        while pending:
+            # Wartezeit bis zum nächsten Hedge = Latenz-Perzentil des ältesten Requests
+            delay = self._hedge_delay(next(iter(pending.values()))) if candidates else None
+            done, _ = wait(pending, timeout=delay, return_when=FIRST_COMPLETED)
+
+            if not done:
+                print(f"🏁 Hedging {symbol}: {candidates[0][0]} after {delay:.2f}s")
+                launch()
+                continue
+
+            for future in done:
+                ex_name = pending.pop(future)
+                try:
+                    series = future.result()
+                except Exception as e:
+                    print(f"❌ {ex_name} error: {e}")
+                    continue
+
+                if not series.empty:
+                    for other in pending:
+                        other.cancel()
+                    print(f"✅ {ex_name}: {len(series)} candles")
+                    return series
+
+            # Alle fertigen Requests ohne Daten → sofort nächsten Kandidaten
+            if candidates:
+                launch()
+
+        print(f"❌ No data found for {symbol}")
+        return OHLCVSeries.empty_series()
+
+    def _hedge_delay(self, ex_name: str) -> float:
+        """Sekunden bis zum Hedge-Request: Latenz-Perzentil des Exchanges (mit Untergrenze)"""
+        if self.router.sample_count(ex_name) < HEDGE_CONFIG['min_samples']:
+            return HEDGE_CONFIG['default_delay']
+
+        latency = self.router.latency_percentile(ex_name, HEDGE_CONFIG['latency_percentile'])
+        return max(HEDGE_CONFIG['min_delay'], latency)
+
+    def get_ohlcv_many(self, requests: List[Tuple[str, str, int]],
+                       exchange: str = None,
+                       max_workers: int = None) -> Dict[Tuple[str, str, int], pd.DataFrame]:
+        """
+        📚 Holt OHLCV für eine ganze Watchlist parallel
+
+        Jede Anfrage läuft über ``get_ohlcv`` (Cache, Buffer, Failover) in
+        einem Thread-Pool. Die Drosselung übernimmt der Token-Bucket des
+        jeweiligen Exchanges, sodass Requests an verschiedene Exchanges
+        parallel laufen und pro Exchange das ``rateLimit`` eingehalten wird.
+
+        Args:
+            requests: Liste von (symbol, timeframe, limit)
+            exchange: Spezifischer Exchange oder None für Auto-Routing
+            max_workers: Thread-Anzahl (None = RATE_LIMIT_CONFIG['max_workers'])
+
+        Returns:
+            Dict[(symbol, timeframe, limit), pd.DataFrame]: Ergebnis pro Anfrage
+            (leeres DataFrame wenn keine Daten verfügbar)
+
+        Example:
+            >>> frames = market_engine.get_ohlcv_many([("BTC/USDT", "1h", 200),
+            ...                                        ("ETH/USDT", "1d", 500)])
+        """
+        requests = list(dict.fromkeys(requests))  # Duplikate entfernen, Reihenfolge behalten
+        if not requests:
+            return {}
+
+        max_workers = max_workers or RATE_LIMIT_CONFIG['max_workers']
+        results = {}
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(requests)),
+                                thread_name_prefix='ohlcv-many') as executor:
+            futures = {
+                request: executor.submit(self.get_ohlcv, *request, exchange)
+                for request in requests
+            }
+            for request, future in futures.items():
+                try:
+                    results[request] = future.result()
+                except Exception as e:
+                    print(f"❌ {request[0]} ({request[1]}) failed: {e}")
+                    results[request] = pd.DataFrame()
+
+        print(f"📚 Batch: {sum(not df.empty for df in results.values())}/{len(requests)} series loaded")
+        return results
+
+    def _call_exchange(self, ex_name: str, method: str, *args, **kwargs):
+        """
+        Führt einen ccxt-Call aus, nachdem der Rate-Limit-Scheduler einen Slot vergeben hat
+
+        Latenz, Fehler und Rate-Limit-Ablehnungen werden an den Router gemeldet.
+        ``BadSymbol`` zählt nicht als Exchange-Fehler (das Pair ist dort nur nicht gelistet).
+        """
+        exchange = self._ensure_exchange(ex_name)  # Lazy-Exchanges beim ersten Call laden
+
+        if not self.circuit_breaker.allow(ex_name):
+            raise ccxt.ExchangeNotAvailable(f"{ex_name}: circuit open")
+
+        if RATE_LIMIT_CONFIG['enabled']:
+            self.rate_limiter.acquire(ex_name)
+
+        started = time.monotonic()
+        try:
+            result = getattr(exchange, method)(*args, **kwargs)
+        except ccxt.BadSymbol:
+            self.router.record(ex_name, time.monotonic() - started)
+            self.circuit_breaker.record_success(ex_name)
+            raise
+        except Exception as e:
+            rate_limited = isinstance(e, (ccxt.RateLimitExceeded, ccxt.DDoSProtection))
+            self.router.record(ex_name, time.monotonic() - started, ok=False,
+                               rate_limited=rate_limited)
+            self.circuit_breaker.record_failure(ex_name)
+            raise
+
+        self.router.record(ex_name, time.monotonic() - started)
+        self.circuit_breaker.record_success(ex_name)
+        return result
+
+    def _route_allowed(self, ex_name: str, symbol: str, timeframe: str) -> bool:
+        """False wenn der Circuit des Exchanges offen ist oder die Route als tot gemerkt ist"""
+        return (not self.circuit_breaker.is_open(ex_name)
+                and (ex_name, symbol, timeframe) not in self.negative_cache)
+
+    def _online_exchanges(self) -> List[str]:
+        """Geladene Exchanges in statischer Prioritätsreihenfolge"""
+        return [name for name in self.router.priority
+                if name in self.exchanges and not isinstance(self.exchanges[name], dict)]
+
+    def _available_exchanges(self) -> List[str]:
+        """Geladene + bei Bedarf ladbare (idle) Exchanges in Prioritätsreihenfolge"""
+        available = []
+        for name in self.router.priority:
+            exchange = self.exchanges.get(name)
+            if not isinstance(exchange, dict) or self._lazy_loadable(name, exchange.get('status')):
+                available.append(name)
+        return available
+
+    # •••••••••••••••••••••••••• 🕯️ CANDLE-BUFFER •••••••••••••••••••••••••• #
+    def _fetch_ohlcv_incremental(self, ex_name: str, symbol: str,
+                                 timeframe: str, limit: int) -> OHLCVSeries:
+        """
+        🕯️ Holt OHLCV über einen Candle-Buffer pro (Exchange, Symbol, Timeframe)
+
+        Deckt der vorhandene Buffer das ``limit`` ab, werden per
+        ``fetch_ohlcv(..., since=...)`` nur Candles ab dem letzten gespeicherten
+        Timestamp nachgeladen und eingemischt. Die letzte (evtl. noch laufende)
+        Candle wird dabei durch die frische Version ersetzt. Ohne Buffer, bei zu
+        großer Lücke (mehr als eine Exchange-Seite, ``page_limit``) oder wenn
+        ``limit`` über die gepufferte Historie hinausreicht,
+        wird das komplette ``limit``-Fenster geladen.
+
+        Args:
+            ex_name: Name des Exchanges (Buffer-Key)
+            symbol: Trading-Pair (z.B. "BTC/USDT")
+            timeframe: Candlestick-Intervall (z.B. "1h")
+            limit: Anzahl der gewünschten Candles
+
+        Returns:
+            OHLCVSeries: Komplette gepufferte Serie (mindestens ``limit`` Candles,
+            sofern der Exchange so viel Historie liefert)
+        """
+        buffer_key = ('ohlcv', ex_name, symbol, timeframe)
+        # Auch abgelaufene Buffer dienen als Basis für das inkrementelle Update
+        entry = self.cache.peek(buffer_key)
+        buffer = entry.value if entry else None
+
+        # Update = ein Request; explizites limit, da Default-Seiten kleiner sein können (okx 100)
+        page_size = page_limit(ex_name, limit)
+        since = incremental_since(buffer, limit, timeframe, page_size=page_size)
+        try:
+            if since is not None:
+                ohlcv = self._call_exchange(ex_name, 'fetch_ohlcv', symbol, timeframe,
+                                            since=since, limit=page_size)
+                series = merge_candles(buffer['data'], ohlcv_to_series(ohlcv))
+                complete = buffer['complete']
+                print(f"🕯️ {ex_name}: +{len(ohlcv)} candles since {since} for {symbol}")
+            else:
+                ohlcv = self._call_exchange(ex_name, 'fetch_ohlcv', symbol, timeframe, limit=limit)
+                series = ohlcv_to_series(ohlcv)
+                # Weniger Candles als angefragt → Exchange hat keine ältere Historie
+                complete = len(series) < limit
+        except ccxt.BadSymbol:
+            series = OHLCVSeries.empty_series()
+
+        if series.empty:
+            # Pair nicht gelistet / keine Daten → Route merken und künftig überspringen
+            self.negative_cache.set((ex_name, symbol, timeframe), True)
+            print(f"🚫 {ex_name}: no data for {symbol} ({timeframe}), route skipped for now")
+            return series
+
+        # Gültig bis zum nächsten Candle-Close (+ Grace-Period)
+        buffer = build_buffer(series, limit, complete, previous=buffer)
+        self.cache.set(buffer_key, buffer, ttl=candle_close_ttl(timeframe))
+        return buffer['data']
     # endregion
 
     # ==============================================================================
     # region               🎯 PATTERN DETECTION ENGINE
     # ==============================================================================
-    def detect_patterns(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def detect_patterns(self, df: Union[pd.DataFrame, OHLCVSeries]) -> Dict[str, Any]:
+        """
+        Identifiziert Trading-Patterns im OHLCV-DataFrame (Dict-Format).
+
+        Kompatibilitäts-Wrapper um ``detect_signals``: baut aus der
+        SignalTable das bisherige ``{pattern: [signal-dict, ...]}``.
+        Für Scans über viele Symbole besser ``detect_signals`` nutzen und
+        erst nach ``SignalTable.filter`` konvertieren.
+
+        Returns:
+            Dict[str, List[Dict]]: Erkannte Patterns nach Typ gruppiert
+        """
+        return self.detect_signals(df).to_dicts()
+
+    def detect_signals(self, df: Union[pd.DataFrame, OHLCVSeries],
+                       series_key: Optional[Tuple] = None) -> SignalTable:
         """
         Identifiziert Trading-Patterns im OHLCV-DataFrame.
 
@@ -247,10 +1042,13 @@ class MarketEngine:
         - Richtung (bullish, bearish, neutral)
 
         Args:
-            df (pd.DataFrame): DataFrame mit OHLCV-Daten
+            df (pd.DataFrame | OHLCVSeries): OHLCV-Daten (DataFrame oder gepufferte Serie)
+            series_key (tuple, optional): Identität der Serie (z.B. symbol, timeframe,
+                exchange, limit) → bei erneutem Aufruf werden nur die neuen Candles
+                gescannt (siehe ``IncrementalDetector``)
 
         Returns:
-            Dict[str, List[Dict]]: Erkannte Patterns nach Typ gruppiert
+            SignalTable: Alle Signale spaltenweise (``to_dicts()`` für das alte Format)
 
         Notes:
         Startet Exchange-Loading parallel im Hintergrund.
@@ -266,53 +1064,38 @@ class MarketEngine:
         
         Nutzt talib für 150+ professionelle Pattern
         """
-        if df.empty or len(df) < 10:
-            return {}
-        
-        # Prepare data for talib (braucht numpy arrays)
-        open_prices = df['open'].values
-        high_prices = df['high'].values  
-        low_prices = df['low'].values
-        close_prices = df['close'].values
-        volume = df['volume'].values
-        
-        patterns = {}
+        data = ohlcv_arrays(df)
+        if series_key is not None and INCREMENTAL_DETECTION_CONFIG['enabled']:
+            table = self.incremental_detector.run(series_key, data)
+        else:
+            table = self._detect_arrays(data)
+        print(f"🎯 Detected {len(table.groups)} pattern types")
+        return table
+
+    def _detect_arrays(self, data: Dict[str, np.ndarray], use_cache: bool = True) -> SignalTable:
+        """
+        Volle Erkennung über die Arrays aus ``ohlcv_arrays`` (Indizes relativ zu ``data``)
+
+        Indikatoren kommen aus ``self.indicators`` (``use_cache=False``: direkt gerechnet).
+        """
+        indicator = self.indicators.get if use_cache else self.indicators.compute
+        patterns = SignalTableBuilder(data['timestamp'], data['close'])
+        if len(data['timestamp']) < 10:
+            return patterns.build()
+
+        # Prepare data for talib (zusammenhängende float64-Arrays, ohne Kopie aus dem Buffer)
+        open_prices = data['open']
+        high_prices = data['high']
+        low_prices = data['low']
+        close_prices = data['close']
 
         # •••••••••••••••••••••••••• 🔥 Candlestick Patterns ######•••••••••••••••••••••••••• #
-        candlestick_patterns = {
-            'doji': talib.CDLDOJI,
-            'hammer': talib.CDLHAMMER,
-            'hanging_man': talib.CDLHANGINGMAN,
-            'shooting_star': talib.CDLSHOOTINGSTAR,
-            'engulfing_bullish': talib.CDLENGULFING,
-            'engulfing_bearish': talib.CDLENGULFING,
-            'morning_star': talib.CDLMORNINGSTAR,
-            'evening_star': talib.CDLEVENINGSTAR,
-            'three_white_soldiers': talib.CDL3WHITESOLDIERS,
-            'three_black_crows': talib.CDL3BLACKCROWS,
-            'harami': talib.CDLHARAMI,
-            'piercing': talib.CDLPIERCING,
-            'dark_cloud': talib.CDLDARKCLOUDCOVER,
-            # Zusätzliche einzelne Candlestick-Patterns
-            'inverted_hammer': talib.CDLINVERTEDHAMMER,     # Umgedrehter Hammer
-            'marubozu': talib.CDLMARUBOZU,                  # Volle Kerze ohne Schatten
-            'spinning_top': talib.CDLSPINNINGTOP,           # Spinning Top (Unentschlossenheit)
-            'dragonfly_doji': talib.CDLDRAGONFLYDOJI,       # Dragonfly Doji
-            # Mehr Trend-Confirmation Patterns
-            'kicking': talib.CDLKICKING,                    # Kicking Pattern (starker Trend)
-            'tasuki_gap': talib.CDLTASUKIGAP,               # Tasuki Gap (Trendfortsetzung)
-            'breakaway': talib.CDLBREAKAWAY,                # Breakaway (Trendstart)
-            'doji_star': talib.CDLDOJISTAR,                 # Doji Star (potentielle Umkehr)
-        }
-        # (die wichtigsten von 61 verfügbaren)
-
-        for name, func in candlestick_patterns.items():
+
+        for name, func in CANDLESTICK_PATTERNS.items():
             try:
                 result = func(open_prices, high_prices, low_prices, close_prices)
                 # Finde wo Pattern auftreten (non-zero values)
-                signals = self._extract_pattern_signals(result, df, name)
-                if signals:
-                    patterns[name] = signals
+                self._extract_pattern_signals(result, patterns, name)
             except Exception as e:
                 print(f"⚠️ Pattern {name} failed: {e}")
 
@@ -320,34 +1103,46 @@ class MarketEngine:
         # (Moving Averages, Bollinger, etc.)
         try:
             # Bollinger Bands
-            bb_upper, bb_middle, bb_lower = talib.BBANDS(close_prices)
-            patterns['bollinger_squeeze'] = self._detect_bb_squeeze(
-                close_prices, bb_upper, bb_lower, df
-            )
+            bb_upper, bb_middle, bb_lower = indicator(data, 'BBANDS')
+            self._detect_bb_squeeze(close_prices, bb_upper, bb_lower, patterns)
             
             # Moving Average Crossovers
-            ma_fast = talib.SMA(close_prices, PATTERN_CONFIG['ma_crossover_fast'])
-            ma_slow = talib.SMA(close_prices, PATTERN_CONFIG['ma_crossover_slow'])
-            patterns['ma_crossover'] = self._detect_ma_crossover(
-                ma_fast, ma_slow, df
-            )
+            ma_fast = indicator(data, 'SMA', timeperiod=PATTERN_CONFIG['ma_crossover_fast'])
+            ma_slow = indicator(data, 'SMA', timeperiod=PATTERN_CONFIG['ma_crossover_slow'])
+            self._detect_ma_crossover(ma_fast, ma_slow, patterns)
             # Support/Resistance Levels
-            patterns['support_resistance'] = self._detect_support_resistance(df)
+            self._detect_support_resistance(data, patterns)
 
             # RSI hinzufügen
-            rsi = talib.RSI(close_prices, PATTERN_CONFIG['rsi_period'])
-            patterns['rsi_oversold'] = self._detect_rsi_signals(rsi, df, 'oversold')
-            patterns['rsi_overbought'] = self._detect_rsi_signals(rsi, df, 'overbought')
+            rsi = indicator(data, 'RSI', timeperiod=PATTERN_CONFIG['rsi_period'])
+            self._detect_rsi_signals(rsi, patterns, 'oversold')
+            self._detect_rsi_signals(rsi, patterns, 'overbought')
 
             # MACD hinzufügen
-            macd, signal, hist = talib.MACD(close_prices)
-            patterns['macd_crossover'] = self._detect_macd_crossover(macd, signal, df)
+            macd, signal, hist = indicator(data, 'MACD')
+            self._detect_macd_crossover(macd, signal, patterns)
             
         except Exception as e:
             print(f"⚠️ Trend patterns failed: {e}")
-        
-        print(f"🎯 Detected {len(patterns)} pattern types")
-        return patterns
+
+        return patterns.build()
+
+    def get_indicator(self, df: Union[pd.DataFrame, OHLCVSeries], name: str, **params):
+        """
+        TA-Lib-Indikator über den gemeinsamen Indicator-Cache
+
+        Für Analyzer und Chart-Overlays: dieselbe Serie + dieselben Parameter
+        wie in ``detect_signals`` → kein erneutes Rechnen.
+
+        Args:
+            df (pd.DataFrame | OHLCVSeries): OHLCV-Daten
+            name (str): TA-Lib-Funktion ('SMA', 'RSI', 'MACD', 'BBANDS', ...)
+            **params: TA-Lib-Parameter, z.B. ``timeperiod=PATTERN_CONFIG['rsi_period']``
+
+        Returns:
+            np.ndarray oder Tuple von Arrays (read-only, positionsgleich mit ``df``)
+        """
+        return self.indicators.get(ohlcv_arrays(df), name, **params)
 
     # ==============================================================================
     # region               Pattern UI Filter
@@ -413,47 +1208,35 @@ class MarketEngine:
     #                      🔍 Pattern Helper Methods
     # ==============================================================================
     # ••••••••••••••••••••••••••  Extract Pattern Signals •••••••••••••••••••••••••• #
-    def _extract_pattern_signals(self, talib_result, df: pd.DataFrame, pattern_name: str) -> List[Dict]:
+    def _extract_pattern_signals(self, talib_result, patterns: SignalTableBuilder, pattern_name: str):
         """
         Konvertiert TA-Lib Signale in standardisiertes Ausgabeformat.
 
-        Transformiert die numerischen TA-Lib Ergebnisse (0, 100, -100) in
-        strukturierte Signalobjekte mit allen relevanten Metadaten für
-        die weitere Verarbeitung und Visualisierung.
+        Übernimmt die Positionen mit Signalwerten != 0 (TA-Lib: -100, 0, 100)
+        per ``np.nonzero`` in die SignalTable; Stärke = |Wert| / 100,
+        Richtung aus dem Vorzeichen. Patterns ohne Treffer erscheinen nicht.
 
         Args:
             talib_result: Numpy-Array mit TA-Lib Signalwerten
-            df: DataFrame mit OHLCV-Daten
+            patterns: SignalTableBuilder der laufenden Erkennung
             pattern_name: Name des erkannten Pattern-Typs
-
-        Returns:
-            List[Dict]: Liste von strukturierten Signal-Objekten
         """
-        signals = []
-        
-        for i, signal in enumerate(talib_result):
-            if signal != 0:  # talib gibt -100, 0, oder 100 zurück
-                # Wenn pattern_name "engulfing" enthält, Namen modifizieren
-                if pattern_name == "engulfing_bullish" and signal < 0:
-                    continue  # Ignoriere bearish Signale
-                elif pattern_name == "engulfing_bearish" and signal > 0:
-                    continue  # Ignoriere bullish Signale
-
-                final_pattern_name = pattern_name
-
-                signals.append({
-                    'index': i,
-                    'datetime': df['datetime'].iloc[i],
-                    'price': df['close'].iloc[i],
-                    'strength': abs(signal) / 100.0,  # 0.0 bis 1.0
-                    'direction': 'bullish' if signal > 0 else 'bearish',
-                    'pattern': pattern_name
-                })
-        
-        return signals
+        # Engulfing wird in bullish/bearish getrennt
+        if pattern_name == "engulfing_bullish":
+            rows = np.nonzero(talib_result > 0)[0]
+        elif pattern_name == "engulfing_bearish":
+            rows = np.nonzero(talib_result < 0)[0]
+        else:
+            rows = np.nonzero(talib_result)[0]
+
+        values = talib_result[rows]
+        patterns.add(pattern_name, rows,
+                     strength=np.abs(values) / 100.0,  # 0.0 bis 1.0
+                     direction=np.where(values > 0, DIRECTION_CODES['bullish'], DIRECTION_CODES['bearish']),
+                     keep_empty=False)
 
     # •••••••••••••••••••••••••• Detect BB-Squeeze •••••••••••••••••••••••••• #
-    def _detect_bb_squeeze(self, close_prices, bb_upper, bb_lower, df):
+    def _detect_bb_squeeze(self, close_prices, bb_upper, bb_lower, patterns: SignalTableBuilder):
         """
         Custom Bollinger Band Squeeze detection
 
@@ -466,36 +1249,22 @@ class MarketEngine:
             close_prices: Numpy-Array mit Schlusskursen
             bb_upper: Oberes Bollinger Band
             bb_lower: Unteres Bollinger Band
-            df: DataFrame mit OHLCV-Daten
-
-        Returns:
-            List[Dict]: Liste von Squeeze-Signalobjekten
+            patterns: SignalTableBuilder der laufenden Erkennung
         """
-        signals = []
-        
-        if len(bb_upper) < 20:
-            return signals
-            
-        # Squeeze = when bands are tight
-        bb_width = (bb_upper - bb_lower) / close_prices
-        bb_width_ma = talib.SMA(bb_width, PATTERN_CONFIG['bollinger_periods'])
-        
-        for i in range(20, len(bb_width)):
-            if (bb_width[i] < bb_width_ma[i] * 0.8 and      # Tight bands
-                bb_width[i-1] >= bb_width_ma[i-1] * 0.8):   # Was wider before
-                signals.append({
-                    'index': i,
-                    'datetime': df['datetime'].iloc[i],
-                    'price': close_prices[i],
-                    'strength': 0.8,
-                    'direction': 'neutral',
-                    'pattern': 'bollinger_squeeze'
-                })
-        
-        return signals
+        rows = np.empty(0, dtype=np.int64)
+
+        if len(bb_upper) >= 20:
+            # Squeeze = when bands are tight
+            bb_width = (bb_upper - bb_lower) / close_prices
+            bb_width_ma = talib.SMA(bb_width, PATTERN_CONFIG['bollinger_periods'])
+
+            # Tight bands, was wider before = Breite fällt unter 80% ihres Durchschnitts
+            _, rows = crossings(bb_width, bb_width_ma * 0.8, start=20)
+
+        patterns.add('bollinger_squeeze', rows, strength=0.8, direction='neutral')
 
     # •••••••••••••••••••••••••• Detect MA-Crossover •••••••••••••••••••••••••• #
-    def _detect_ma_crossover(self, ma_fast, ma_slow, df):
+    def _detect_ma_crossover(self, ma_fast, ma_slow, patterns: SignalTableBuilder):
         """
         Moving Average Crossover detection
 
@@ -507,162 +1276,74 @@ class MarketEngine:
         Args:
             ma_fast: Schneller gleitender Durchschnitt (Numpy-Array)
             ma_slow: Langsamer gleitender Durchschnitt (Numpy-Array)
-            df: DataFrame mit OHLCV-Daten
-
-        Returns:
-            List[Dict]: Liste von MA-Crossover-Signalobjekten
+            patterns: SignalTableBuilder der laufenden Erkennung
         """
-        signals = []
-        
-        for i in range(1, len(ma_fast)):
-            if pd.isna(ma_fast[i]) or pd.isna(ma_slow[i]):
-                continue
-                
-            # Bullish crossover: fast crosses above slow
-            if ma_fast[i] > ma_slow[i] and ma_fast[i-1] <= ma_slow[i-1]:
-                signals.append({
-                    'index': i,
-                    'datetime': df['datetime'].iloc[i],
-                    'price': df['close'].iloc[i],
-                    'strength': 0.7,
-                    'direction': 'bullish',
-                    'pattern': 'ma_crossover'
-                })
-            
-            # Bearish crossover: fast crosses below slow  
-            elif ma_fast[i] < ma_slow[i] and ma_fast[i-1] >= ma_slow[i-1]:
-                signals.append({
-                    'index': i,
-                    'datetime': df['datetime'].iloc[i], 
-                    'price': df['close'].iloc[i],
-                    'strength': 0.7,
-                    'direction': 'bearish',
-                    'pattern': 'ma_crossover'
-                })
-        
-        return signals
+        # Bullish crossover: fast crosses above slow / Bearish: fast crosses below slow
+        rows, bullish = merge_crossings(*crossings(ma_fast, ma_slow))
+
+        patterns.add('ma_crossover', rows, strength=0.7,
+                     direction=np.where(bullish, DIRECTION_CODES['bullish'], DIRECTION_CODES['bearish']))
 
     # •••••••••••••••••••••••••• Detect RSI-Signals •••••••••••••••••••••••••• #
-    def _detect_rsi_signals(self, rsi_values, df: pd.DataFrame, signal_type: str) -> List[Dict]:
+    def _detect_rsi_signals(self, rsi_values, patterns: SignalTableBuilder, signal_type: str):
         """RSI Überkauft/Überverkauft Detection"""
-        signals = []
-
         # RSI-Schwellwerte definieren
         oversold_threshold = 30
         overbought_threshold = 70
 
-        for i in range(1, len(rsi_values)):
-            if pd.isna(rsi_values[i]):
-                continue
+        if signal_type == 'oversold':
+            # Überverkauft Signal (bullish): RSI erreicht 30 von oben
+            _, rows = crossings(rsi_values, oversold_threshold, inclusive=True)
+            direction = 'bullish'
+        else:
+            # Überkauft Signal (bearish): RSI erreicht 70 von unten
+            rows, _ = crossings(rsi_values, overbought_threshold, inclusive=True)
+            direction = 'bearish'
 
-            # Überverkauft Signal (bullish)
-            if signal_type == 'oversold' and rsi_values[i] <= oversold_threshold and rsi_values[
-                i - 1] > oversold_threshold:
-                signals.append({
-                    'index': i,
-                    'datetime': df['datetime'].iloc[i],
-                    'price': df['close'].iloc[i],
-                    'rsi_value': rsi_values[i],
-                    'strength': 0.8,
-                    'direction': 'bullish',
-                    'pattern': 'rsi_oversold'
-                })
-
-            # Überkauft Signal (bearish)
-            elif signal_type == 'overbought' and rsi_values[i] >= overbought_threshold and rsi_values[
-                i - 1] < overbought_threshold:
-                signals.append({
-                    'index': i,
-                    'datetime': df['datetime'].iloc[i],
-                    'price': df['close'].iloc[i],
-                    'rsi_value': rsi_values[i],
-                    'strength': 0.8,
-                    'direction': 'bearish',
-                    'pattern': 'rsi_overbought'
-                })
-
-        return signals
+        patterns.add(f'rsi_{signal_type}', rows, strength=0.8, direction=direction,
+                     rsi_value=rsi_values[rows])
 
     # •••••••••••••••••••••••••• Detect Support & Resistance •••••••••••••••••••••••••• #
-    def _detect_support_resistance(self, df: pd.DataFrame) -> List[Dict]:
-        """Basic Support/Resistance levels"""
-        signals = []
-
-        if len(df) < 20:
-            return signals
-
-        # Find local highs and lows
-        window = 5
-        for i in range(window, len(df) - window):
-            current_high = df['high'].iloc[i]
-            current_low = df['low'].iloc[i]
-
-            # Local high (resistance)
-            is_high = all(current_high >= df['high'].iloc[j]
-                          for j in range(i - window, i + window + 1) if j != i)
-
-            # Local low (support)
-            is_low = all(current_low <= df['low'].iloc[j]
-                         for j in range(i - window, i + window + 1) if j != i)
-
-            if is_high:
-                signals.append({
-                    'index': i,
-                    'datetime': df['datetime'].iloc[i],
-                    'price': current_high,
-                    'strength': 0.6,
-                    'direction': 'resistance',
-                    'pattern': 'support_resistance'
-                })
-
-            if is_low:
-                signals.append({
-                    'index': i,
-                    'datetime': df['datetime'].iloc[i],
-                    'price': current_low,
-                    'strength': 0.6,
-                    'direction': 'support',
-                    'pattern': 'support_resistance'
-                })
-
-        return signals
+    def _detect_support_resistance(self, data: Dict[str, np.ndarray], patterns: SignalTableBuilder):
+        """
+        Basic Support/Resistance levels
+
+        Pivot = Hoch/Tief, das im Fenster ±``support_resistance_window``
+        Candles nicht über-/unterboten wird. Rollendes Max/Min per
+        ``sliding_window_view`` über die rohen Arrays statt Python-Doppelschleife.
+        """
+        highs, lows = data['high'], data['low']
+        window = PATTERN_CONFIG['support_resistance_window']
+        span = 2 * window + 1
+        rows = prices = directions = np.empty(0)
+
+        # Find local highs and lows (erst ab 20 Candles)
+        if len(highs) >= max(20, span):
+            centers = np.arange(window, len(highs) - window)
+            # Local high (resistance) / Local low (support); NaN im Fenster → kein Pivot
+            resistance = centers[highs[centers] >= sliding_window_view(highs, span).max(axis=1)]
+            support = centers[lows[centers] <= sliding_window_view(lows, span).min(axis=1)]
+
+            # Pro Candle erst Resistance, dann Support (stabile Sortierung)
+            rows = np.concatenate([resistance, support])
+            order = np.argsort(rows, kind='stable')
+            rows = rows[order]
+            prices = np.concatenate([highs[resistance], lows[support]])[order]
+            directions = np.concatenate([
+                np.full(len(resistance), DIRECTION_CODES['resistance'], dtype=np.int8),
+                np.full(len(support), DIRECTION_CODES['support'], dtype=np.int8)])[order]
+
+        patterns.add('support_resistance', rows, strength=0.6, direction=directions, price=prices)
 
     # •••••••••••••••••••••••••• Detect MACD-Crossover •••••••••••••••••••••••••• #
-    def _detect_macd_crossover(self, macd_line, signal_line, df: pd.DataFrame) -> List[Dict]:
+    def _detect_macd_crossover(self, macd_line, signal_line, patterns: SignalTableBuilder):
         """MACD Signal-Line Crossover Detection"""
-        signals = []
-
-        for i in range(1, len(macd_line)):
-            if pd.isna(macd_line[i]) or pd.isna(signal_line[i]):
-                continue
+        # Bullish Crossover: MACD crosses above Signal / Bearish: crosses below
+        rows, bullish = merge_crossings(*crossings(macd_line, signal_line))
 
-            # Bullish Crossover: MACD crosses above Signal
-            if macd_line[i] > signal_line[i] and macd_line[i - 1] <= signal_line[i - 1]:
-                signals.append({
-                    'index': i,
-                    'datetime': df['datetime'].iloc[i],
-                    'price': df['close'].iloc[i],
-                    'macd_value': macd_line[i],
-                    'signal_value': signal_line[i],
-                    'strength': 0.75,
-                    'direction': 'bullish',
-                    'pattern': 'macd_crossover'
-                })
-
-            # Bearish Crossover: MACD crosses below Signal
-            elif macd_line[i] < signal_line[i] and macd_line[i - 1] >= signal_line[i - 1]:
-                signals.append({
-                    'index': i,
-                    'datetime': df['datetime'].iloc[i],
-                    'price': df['close'].iloc[i],
-                    'macd_value': macd_line[i],
-                    'signal_value': signal_line[i],
-                    'strength': 0.75,
-                    'direction': 'bearish',
-                    'pattern': 'macd_crossover'
-                })
-
-        return signals
+        patterns.add('macd_crossover', rows, strength=0.75,
+                     direction=np.where(bullish, DIRECTION_CODES['bullish'], DIRECTION_CODES['bearish']),
+                     macd_value=macd_line[rows], signal_value=signal_line[rows])
 
     # endregion
 
@@ -676,7 +1357,8 @@ class MarketEngine:
 
         Holt die verfügbaren Symbole von der angegebenen Exchange
         oder gibt Standardwerte zurück, wenn die Exchange nicht
-        verfügbar ist.
+        verfügbar ist. Liest aus der kompakten Markets-Registry;
+        Top-Coins stehen vorne, der Rest alphabetisch.
 
         Args:
             exchange (str): Exchange-Name (default: 'binance')
@@ -686,21 +1368,62 @@ class MarketEngine:
         """
         default_symbols = ['BTC/USDT', 'ETH/USDT', 'SOL/USDT']  # Sichere Defaults
 
-        if exchange not in self.exchanges or isinstance(self.exchanges[exchange], dict):
-            return default_symbols  # Wenn Exchange noch nicht geladen, Defaults
-
         try:
-            markets = self.exchanges[exchange].markets
-            symbols = [symbol for symbol in markets.keys() if '/USDT' in symbol]
+            # Lazy-Exchange ohne bekannte Markets wird hier beim ersten Zugriff geladen
+            if not self.markets_registry.has_exchange(exchange):
+                self._ensure_exchange(exchange)
+
+            symbols = self.markets_registry.symbols(exchange, quote='USDT')
+            listed = set(symbols)
+            top = [symbol for symbol in TOP_SYMBOLS if symbol in listed]
+            symbols = top + [symbol for symbol in symbols if symbol not in top]
             return symbols if symbols else default_symbols
         except:
             return default_symbols
 
+    def search_symbols(self, query: str, exchange: str = None, limit: int = None) -> List[str]:
+        """
+        🔎 Server-seitige Symbol-Suche für das Dropdown-Typeahead
+
+        Args:
+            query: Eingegebener Text (z.B. "eth", "SOL/U")
+            exchange: Nur Symbole dieses Exchanges oder None für alle
+            limit: Max. Treffer (None = SYMBOL_INDEX_CONFIG['search_limit'])
+
+        Returns:
+            List[str]: Passende Symbole, bester Treffer zuerst
+        """
+        return self.markets_registry.search(query, exchange=exchange, limit=limit)
+
     def get_market_stats(self) -> Dict[str, Any]:
         """
         Globale Marktdaten für Status-Bar
 
-        Aggregiert globale Marktstatistiken für die Status-Bar.
+        Liefert nur den zuletzt berechneten Snapshot – ohne Netzwerk-Call,
+        damit der Dash-Clock-Callback nie blockiert. Berechnet wird im
+        Hintergrund von ``refresh_market_stats``.
+
+        Returns:
+            Dict[str, Any]: Aggregierte Marktstatistiken
+        """
+        return dict(self._market_stats)
+
+    def _market_stats_loop(self):
+        """Hintergrund-Loop: aktualisiert die Status-Bar-Statistiken im eigenen Takt"""
+        while True:
+            try:
+                with self._background_use():
+                    refreshed = self.refresh_market_stats()
+            except Exception as e:
+                print(f"❌ Error getting market stats: {e}")
+                refreshed = False
+
+            time.sleep(MARKET_STATS_CONFIG['refresh_seconds'] if refreshed
+                       else MARKET_STATS_CONFIG['retry_seconds'])
+
+    def refresh_market_stats(self) -> bool:
+        """
+        Aggregiert globale Marktstatistiken für die Status-Bar
 
         Sammelt Daten wie:
         - Marktkapitalisierung
@@ -709,96 +1432,96 @@ class MarketEngine:
         - BTC-Dominanz
         - Anzahl aktiver Trading-Pairs
 
-        Implementiert Cache-Mechanismus für Performance-Optimierung.
+        Pro Exchange genügt ein ``fetch_tickers``-Bulk-Call für alle Top-Coins;
+        Exchanges ohne fetchTickers fallen auf 1d-Candles zurück.
 
         Returns:
-            Dict[str, Any]: Aggregierte Marktstatistiken
+            bool: True wenn Kursdaten gefunden wurden
         """
-        # Cache check
-        if 'market_stats' in self.cache:
-            cached_data, timestamp = self.cache['market_stats']
-            if time.time() - timestamp < 300:  # 5min cache
-                return cached_data
-
-        # Standardwerte (falls API-Fehler)
-        stats = {
-            'market_cap': "$1.34T",  # Bisheriger Wert als Fallback
-            'volume_24h': "2,847",  # Bisheriger Wert als Fallback
-            'fear_greed': "73",  # Bisheriger Wert als Fallback
-            'btc_dominance': "BTC 52.3%",  # Bisheriger Wert als Fallback
-            'active_pairs': "1,247"  # Bisheriger Wert als Fallback
-        }
+        # 1️⃣ Active Pairs - aus der Markets-Registry, kein Netzwerk-Call
+        exchange_order = self.router.rank(self._online_exchanges())
+        active_pairs = len(self.get_available_symbols(exchange_order[0])) if exchange_order else None
 
-        try:
-            # 1️⃣ Active Pairs - Einfach zu berechnen aus vorhandenen Daten
-            exchange_order = ['binance', 'coinbase', 'kraken', 'bybit', 'okx']
-            for ex_name in exchange_order:
-                if ex_name in self.exchanges and not isinstance(self.exchanges[ex_name], dict):
-                    symbols = self.get_available_symbols(ex_name)
-                    if symbols:
-                        stats['active_pairs'] = f"{len(symbols):,}"
-                    break
-
-            # 2️⃣ Volume & Marktdaten - Aus Top-Coins berechnen
-            top_symbols = ['BTC/USDT', 'ETH/USDT', 'BNB/USDT', 'SOL/USDT', 'XRP/USDT']
-            total_volume = 0
-            total_mcap = 0
-            btc_mcap = 0
-
-            for ex_name in exchange_order:
-                if ex_name not in self.exchanges or isinstance(self.exchanges[ex_name], dict):
-                    continue
+        # 2️⃣ Volume & Marktdaten - Aus Top-Coins berechnen
+        quotes = {}
+        for ex_name in exchange_order:
+            try:
+                quotes = self._fetch_top_quotes(ex_name)
+            except Exception as e:
+                print(f"❌ {ex_name} market stats error: {e}")
+                continue
 
-                try:
-                    # Ticker-Daten für verfügbare Top-Coins abrufen
-                    for symbol in top_symbols:
-                        try:
-                            # OHLCV-Daten nutzen (bereits in der Engine implementiert)
-                            df = self.get_ohlcv(symbol, '1d', 1, ex_name)
-                            if df.empty:
-                                continue
-
-                            # Letzte Schlusskurse & Volumen extrahieren
-                            price = df['close'].iloc[-1]
-                            volume = df['volume'].iloc[-1]
-
-                            # Zum Gesamtvolumen addieren
-                            total_volume += volume * price  # Volume in USDT
-
-                            # Sehr grobe Marktkapitalisierung (vereinfacht)
-                            coin_mcap = price * volume * 10  # Heuristische Schätzung
-                            total_mcap += coin_mcap
-
-                            # BTC Dominance berechnen
-                            if symbol == 'BTC/USDT':
-                                btc_mcap = coin_mcap
-                        except:
-                            continue
-
-                    # Wenn wir Daten haben, Loop verlassen
-                    if total_volume > 0:
-                        break
-                except Exception as e:
-                    print(f"⚠️ Stats error on {ex_name}: {e}")
-                    continue
+            # Wenn wir Daten haben, Loop verlassen
+            if quotes:
+                break
+
+        # 3️⃣ Berechnete Werte formatieren + Snapshot tauschen
+        if quotes or active_pairs:
+            self._market_stats = summarize_market_stats(quotes, active_pairs)
+        return bool(quotes)
 
-            # 3️⃣ Berechnete Werte formatieren
-            if total_mcap > 0:
-                stats['market_cap'] = f"${total_mcap / 1e12:.2f}T"
+    def _fetch_top_quotes(self, ex_name: str) -> Dict[str, Tuple[float, float]]:
+        """(Preis, 24h-Volumen) der Top-Coins eines Exchanges"""
+        symbols = [symbol for symbol in TOP_SYMBOLS
+                   if self.symbol_index.market_id(ex_name, symbol) is not None]
+        if not symbols:
+            return {}
+
+        if self._ensure_exchange(ex_name).has.get('fetchTickers'):
+            # Ein Bulk-Call für alle Top-Coins
+            return quotes_from_tickers(self._call_exchange(ex_name, 'fetch_tickers', symbols))
 
-            if total_volume > 0:
-                stats['volume_24h'] = f"{total_volume / 1e9:.1f}B"
+        quotes = {}
+        for symbol in symbols:
+            # OHLCV-Daten nutzen (bereits in der Engine implementiert)
+            series = self.get_ohlcv_series(symbol, '1d', 1, ex_name)
+            if not series.empty:
+                quotes[symbol] = (series.close[-1], series.volume[-1])
+        return quotes
 
-            if total_mcap > 0 and btc_mcap > 0:
-                btc_dom = (btc_mcap / total_mcap) * 100
-                stats['btc_dominance'] = f"BTC {btc_dom:.1f}%"
+    def backfill(self, symbols: Union[str, List[str]], timeframe: str = '1h', start=None,
+                 end=None, exchange: str = None, store=None) -> List[Dict[str, Any]]:
+        """
+        📥 Lädt lange Historien seitenweise in den SQLite-Cache (CryptoDataCache)
 
-            # 4️⃣ Cache setzen
-            self.cache['market_stats'] = (stats, time.time())
+        Pro Symbol werden die Seiten parallel im Rate-Budget geladen;
+        fertige Seiten werden vermerkt, ein erneuter Aufruf setzt fort.
 
-        except Exception as e:
-            print(f"❌ Error getting market stats: {e}")
+        Args:
+            symbols: Ein Symbol oder eine Liste (z.B. das ganze Universum)
+            timeframe: "1h", "1d", "3d", "1w" oder "1M"
+            start: Beginn (ISO-String, datetime oder ms-Timestamp, Pflicht)
+            end: Ende (None = jetzt)
+            exchange: Spezifischer Exchange oder None für Auto-Routing
+            store: Ziel-Cache (None = CryptoDataCache)
+
+        Returns:
+            List[Dict]: Statistik pro Symbol (pages, skipped, fetched, failed, rows, seconds)
+
+        Raises:
+            ValueError: ``start`` fehlt
+        """
+        if start is None:
+            raise ValueError("Backfill braucht ein Startdatum (start)")
 
+        symbols = [symbols] if isinstance(symbols, str) else list(symbols)
+        results = []
+        for symbol in symbols:
+            try:
+                job = BackfillJob(self, symbol, timeframe, start, end, exchange, store)
+                results.append(job.run())
+            except Exception as e:
+                print(f"❌ Backfill {symbol} failed: {e}")
+                results.append({'symbol': symbol, 'timeframe': timeframe, 'error': str(e)})
+        return results
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Hit/Miss/Eviction-Zähler und Auslastung des Memory-Caches"""
+        stats = self.cache.stats()
+        stats['coalesced_fetches'] = self._inflight.coalesced
+        stats.update(self.prefetcher.stats())
+        stats.update(self.incremental_detector.stats())
+        stats.update(self.indicators.stats())
         return stats
 
     def get_exchange_info(self) -> Dict[str, Any]:
@@ -813,6 +1536,7 @@ class MarketEngine:
         - Anzahl verfügbarer Markets
         - Rate-Limit-Konfiguration
         - Verfügbare Funktionen
+        - Live-Health aus dem Router (Latenz, Fehler-/Rate-Limit-Quote)
 
         Returns:
             Dict[str, Any]: Exchange-Status und -Information
@@ -831,6 +1555,8 @@ class MarketEngine:
                         'markets': len(exchange.markets),
                         'rate_limit': exchange.rateLimit,
                         'has_ohlcv': exchange.has['fetchOHLCV'],
+                        **self.router.health(name),
+                        **self.circuit_breaker.state(name),
                     }
             except Exception as e:
                 info[name] = {'status': 'offline', 'error': str(e)}
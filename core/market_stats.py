@@ -0,0 +1,85 @@
+# core/market_stats.py - Aggregation der Status-Bar Marktstatistiken
+"""
+Market Stats - Gemeinsame Berechnung der Status-Bar-Werte
+
+Wird von MarketEngine und AsyncMarketEngine genutzt, damit beide
+Engines aus denselben Rohdaten (Preis + Volumen der Top-Coins)
+identisch formatierte Statistiken liefern.
+"""
+from typing import Any, Dict, Optional, Tuple
+
+# --- Konstanten ---
+TOP_SYMBOLS = ['BTC/USDT', 'ETH/USDT', 'BNB/USDT', 'SOL/USDT', 'XRP/USDT']
+
+# Standardwerte (falls API-Fehler)
+DEFAULT_MARKET_STATS = {
+    'market_cap': "$1.34T",  # Bisheriger Wert als Fallback
+    'volume_24h': "2,847",  # Bisheriger Wert als Fallback
+    'fear_greed': "73",  # Bisheriger Wert als Fallback
+    'btc_dominance': "BTC 52.3%",  # Bisheriger Wert als Fallback
+    'active_pairs': "1,247"  # Bisheriger Wert als Fallback
+}
+
+
+def quotes_from_tickers(tickers: Dict[str, Dict[str, Any]]) -> Dict[str, Tuple[float, float]]:
+    """
+    Extrahiert (Preis, 24h-Base-Volumen) aus einer ``fetch_tickers``-Antwort
+
+    Ticker ohne Preis oder Volumen werden übersprungen.
+    """
+    quotes = {}
+    for symbol, ticker in tickers.items():
+        price = ticker.get('last') or ticker.get('close')
+        volume = ticker.get('baseVolume')
+        if volume is None and price and ticker.get('quoteVolume'):
+            volume = ticker['quoteVolume'] / price
+        if price and volume:
+            quotes[symbol] = (float(price), float(volume))
+    return quotes
+
+
+def summarize_market_stats(quotes: Dict[str, Tuple[float, float]],
+                           active_pairs: Optional[int] = None) -> Dict[str, str]:
+    """
+    Formatiert Status-Bar-Statistiken aus Preis/Volumen der Top-Coins
+
+    Args:
+        quotes: {symbol: (letzter Preis, 24h-Volumen in Base-Currency)}
+        active_pairs: Anzahl handelbarer Pairs (None = Fallback-Wert)
+
+    Returns:
+        Dict[str, str]: Formatierte Werte, fehlende Daten als Fallback
+    """
+    stats = dict(DEFAULT_MARKET_STATS)
+
+    if active_pairs:
+        stats['active_pairs'] = f"{active_pairs:,}"
+
+    total_volume = 0
+    total_mcap = 0
+    btc_mcap = 0
+
+    for symbol, (price, volume) in quotes.items():
+        # Zum Gesamtvolumen addieren
+        total_volume += volume * price  # Volume in USDT
+
+        # Sehr grobe Marktkapitalisierung (vereinfacht)
+        coin_mcap = price * volume * 10  # Heuristische Schätzung
+        total_mcap += coin_mcap
+
+        # BTC Dominance berechnen
+        if symbol == 'BTC/USDT':
+            btc_mcap = coin_mcap
+
+    # Berechnete Werte formatieren
+    if total_mcap > 0:
+        stats['market_cap'] = f"${total_mcap / 1e12:.2f}T"
+
+    if total_volume > 0:
+        stats['volume_24h'] = f"{total_volume / 1e9:.1f}B"
+
+    if total_mcap > 0 and btc_mcap > 0:
+        btc_dom = (btc_mcap / total_mcap) * 100
+        stats['btc_dominance'] = f"BTC {btc_dom:.1f}%"
+
+    return stats
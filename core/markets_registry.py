@@ -0,0 +1,167 @@
+# core/markets_registry.py - Kompakte, spaltenbasierte Markets-Tabelle pro Exchange
+"""
+Markets Registry - Symbol-Listen und Typeahead-Suche ohne die ccxt-Market-Dicts
+
+``exchange.markets`` hält pro Pair ein verschachteltes Dict (inkl. roher
+Exchange-Antwort). Für Dropdowns und Suche reichen wenige Felder; die
+Registry speichert sie spaltenweise (ein Tupel pro Feld, Zeilen nach Symbol
+sortiert) und baut dazu zwei Indizes:
+
+- Prefix-Suche per ``bisect`` auf der sortierten Symbol-Spalte
+- Quote-Index: Quote-Currency → Zeilennummern
+
+Wiederholte Strings (Base, Quote, Typ) werden per ``sys.intern`` geteilt.
+Tabellen werden beim Laden eines Exchanges neu gebaut und atomar getauscht.
+"""
+import sys
+import threading
+from bisect import bisect_left
+from typing import Dict, List, Optional, Tuple
+
+from config.settings import SYMBOL_INDEX_CONFIG
+
+
+class MarketTable:
+    """📋 Spaltenbasierte Markets eines Exchanges (Zeilen nach Symbol sortiert)"""
+    __slots__ = ('symbols', 'bases', 'quotes', 'types', 'active',
+                 'price_precision', 'amount_precision', 'by_quote')
+
+    def __init__(self, markets: Dict[str, Dict]):
+        rows = sorted((symbol, market) for symbol, market in markets.items()
+                      if market.get('base') and market.get('quote'))
+
+        self.symbols: Tuple[str, ...] = tuple(symbol for symbol, _ in rows)
+        self.bases = tuple(sys.intern(market['base']) for _, market in rows)
+        self.quotes = tuple(sys.intern(market['quote']) for _, market in rows)
+        self.types = tuple(sys.intern(market.get('type') or 'spot') for _, market in rows)
+        # active=None (unbekannt) zählt als aktiv
+        self.active = tuple(market.get('active') is not False for _, market in rows)
+        self.price_precision = tuple((market.get('precision') or {}).get('price') for _, market in rows)
+        self.amount_precision = tuple((market.get('precision') or {}).get('amount') for _, market in rows)
+
+        by_quote: Dict[str, List[int]] = {}
+        for row, quote in enumerate(self.quotes):
+            by_quote.setdefault(quote, []).append(row)
+        self.by_quote = {quote: tuple(rows) for quote, rows in by_quote.items()}
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def prefix_rows(self, prefix: str) -> range:
+        """Zeilen, deren Symbol mit ``prefix`` beginnt (zusammenhängender Bereich)"""
+        start = bisect_left(self.symbols, prefix)
+        end = bisect_left(self.symbols, prefix + '\uffff', lo=start)
+        return range(start, end)
+
+
+class MarketsRegistry:
+    """
+    🗃️ Kompakte Markets aller geladenen Exchanges
+
+    Lesezugriffe arbeiten auf dem aktuellen Tabellen-Dict ohne Lock.
+    """
+
+    def __init__(self, priority: List[str] = None):
+        self.priority = list(priority or [])
+        self._tables: Dict[str, MarketTable] = {}
+        self._lock = threading.Lock()
+
+    # •••••••••••••••••••••••••• Aufbau •••••••••••••••••••••••••• #
+    def update_exchange(self, exchange: str, markets: Dict[str, Dict]) -> None:
+        """Baut die Tabelle eines (neu) geladenen Exchanges aus ``exchange.markets``"""
+        table = MarketTable(markets)
+        with self._lock:
+            self._tables = {**self._tables, exchange: table}
+
+    def remove_exchange(self, exchange: str) -> None:
+        with self._lock:
+            self._tables = {name: table for name, table in self._tables.items() if name != exchange}
+
+    def has_exchange(self, exchange: str) -> bool:
+        return exchange in self._tables
+
+    # •••••••••••••••••••••••••• Lookup •••••••••••••••••••••••••• #
+    def symbols(self, exchange: str, quote: Optional[str] = None,
+                active_only: bool = True) -> List[str]:
+        """
+        Symbole eines Exchanges, optional nur eine Quote-Currency
+
+        Args:
+            exchange: Exchange-Name
+            quote: Quote-Currency (z.B. "USDT") oder None für alle
+            active_only: Inaktive (delistete) Markets auslassen
+
+        Returns:
+            List[str]: Symbole in alphabetischer Reihenfolge
+        """
+        table = self._tables.get(exchange)
+        if table is None:
+            return []
+
+        rows = table.by_quote.get(quote, ()) if quote else range(len(table))
+        return [table.symbols[row] for row in rows if not active_only or table.active[row]]
+
+    def precision(self, exchange: str, symbol: str) -> Optional[Dict[str, float]]:
+        """Preis-/Mengen-Precision eines Symbols (None wenn nicht gelistet)"""
+        table = self._tables.get(exchange)
+        if table is None:
+            return None
+
+        row = bisect_left(table.symbols, symbol)
+        if row == len(table) or table.symbols[row] != symbol:
+            return None
+        return {'price': table.price_precision[row], 'amount': table.amount_precision[row]}
+
+    def search(self, query: str, exchange: Optional[str] = None,
+               quote: Optional[str] = None, limit: int = None) -> List[str]:
+        """
+        🔎 Typeahead-Suche per Symbol-Prefix
+
+        "eth" findet ETH/USDT, ETH/BTC, ETHFI/USDT, ... ; exakte Base-Treffer
+        und die bevorzugte Quote (erste Alias-Gruppe, z.B. USDT) stehen vorne,
+        Derivate (``BTC/USDT:USDT``) hinten.
+
+        Args:
+            query: Eingegebener Text (Groß-/Kleinschreibung egal)
+            exchange: Nur dieser Exchange oder None für alle
+            quote: Nur diese Quote-Currency
+            limit: Max. Treffer (None = SYMBOL_INDEX_CONFIG['search_limit'])
+
+        Returns:
+            List[str]: Eindeutige Symbole, bester Treffer zuerst
+        """
+        limit = limit or SYMBOL_INDEX_CONFIG['search_limit']
+        query = query.strip().upper()
+        tables = self._tables
+        names = [exchange] if exchange else self._ordered(tables)
+        aliases = SYMBOL_INDEX_CONFIG['quote_aliases']
+        quote_rank = {alias: i for i, alias in enumerate(aliases[0] if aliases else [])}
+
+        matches: Dict[str, Tuple] = {}
+        for name in names:
+            table = tables.get(name)
+            if table is None:
+                continue
+            for row in table.prefix_rows(query):
+                symbol = table.symbols[row]
+                if symbol in matches or not table.active[row]:
+                    continue
+                if quote and table.quotes[row] != quote:
+                    continue
+                matches[symbol] = (
+                    symbol != query,
+                    table.bases[row] != query,
+                    ':' in symbol,
+                    quote_rank.get(table.quotes[row], len(quote_rank)),
+                    symbol,
+                )
+
+        return sorted(matches, key=matches.get)[:limit]
+
+    def _ordered(self, exchanges) -> List[str]:
+        """Exchanges in Prioritätsreihenfolge (unbekannte hinten)"""
+        rank = {name: i for i, name in enumerate(self.priority)}
+        return sorted(exchanges, key=lambda name: rank.get(name, len(rank)))
+
+    def __len__(self) -> int:
+        return sum(len(table) for table in self._tables.values())
@@ -0,0 +1,166 @@
+# core/markets_snapshot.py - Persistenter Snapshot der Exchange-Markets
+"""
+Markets Snapshot - Schneller Kaltstart ohne auf ``load_markets()`` zu warten
+
+Die Markets-Metadaten aller geladenen Exchanges werden als gzip-JSON
+mit Version und Zeitstempel gespeichert. Beim Start lädt die MarketEngine
+den Snapshot synchron, sodass Symbole und Routing sofort verfügbar sind;
+die Hintergrund-Threads laden danach frische Markets und tauschen sie ein.
+
+Format:
+    {
+        "version": 1,
+        "created_at": 1718000000.0,
+        "ccxt_version": "4.2.47",
+        "exchanges": {"binance": {"saved_at": ..., "markets": {...}, "currencies": {...}}, ...}
+    }
+
+Exchanges, die beim Speichern nicht geladen sind (z.B. lazy und noch
+nie benutzt), behalten ihren Eintrag aus dem vorhandenen Snapshot.
+"""
+import gzip
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Optional
+
+import ccxt
+
+from config.settings import MARKETS_SNAPSHOT_CONFIG
+
+SNAPSHOT_VERSION = 1
+
+# Loader-Threads und Lazy-Loads speichern parallel: Lesen + Mergen + Ersetzen
+# muss zusammen laufen, sonst überschreibt ein Thread den Eintrag des anderen
+_save_lock = threading.Lock()
+
+
+def _compact_markets(markets: Dict[str, Dict]) -> Dict[str, Dict]:
+    """Entfernt die rohe Exchange-Antwort ('info'), die den Snapshot aufbläht"""
+    if not MARKETS_SNAPSHOT_CONFIG['strip_info']:
+        return markets
+    return {symbol: {**market, 'info': {}} for symbol, market in markets.items()}
+
+
+def _read_payload(path: str) -> Optional[Dict[str, Any]]:
+    """Liest die Snapshot-Datei (None wenn nicht vorhanden, unlesbar oder andere Version)"""
+    if not os.path.exists(path):
+        return None
+
+    try:
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            payload = json.load(f)
+    except Exception as e:
+        print(f"⚠️ Markets-Snapshot unlesbar, wird ignoriert: {e}")
+        return None
+
+    if payload.get('version') != SNAPSHOT_VERSION:
+        print(f"⚠️ Markets-Snapshot Version {payload.get('version')} veraltet, wird ignoriert")
+        return None
+    return payload
+
+
+def save_snapshot(exchanges: Dict[str, Any], path: str = None) -> bool:
+    """
+    💾 Speichert die Markets aller geladenen Exchanges
+
+    Schreibt zuerst in eine eindeutige temporäre Datei und ersetzt dann
+    atomar, damit ein parallel startender Prozess nie eine halbe Datei liest.
+    Parallele Aufrufe im Prozess laufen nacheinander (kein Eintrag geht verloren).
+
+    Args:
+        exchanges: {name: ccxt.Exchange} (Status-Dicts werden übersprungen)
+        path: Zieldatei (None = MARKETS_SNAPSHOT_CONFIG['path'])
+
+    Returns:
+        bool: True bei Erfolg
+    """
+    path = path or MARKETS_SNAPSHOT_CONFIG['path']
+    with _save_lock:
+        return _write_snapshot(exchanges, path)
+
+
+def _write_snapshot(exchanges: Dict[str, Any], path: str) -> bool:
+    now = time.time()
+    previous = _read_payload(path) or {}
+
+    saved = dict(previous.get('exchanges', {}))
+    for name, exchange in exchanges.items():
+        if isinstance(exchange, dict) or not exchange.markets:
+            continue
+        saved[name] = {
+            'saved_at': now,
+            'markets': _compact_markets(exchange.markets),
+            'currencies': exchange.currencies or {},
+        }
+
+    payload = {
+        'version': SNAPSHOT_VERSION,
+        'created_at': now,
+        'ccxt_version': ccxt.__version__,
+        'exchanges': saved,
+    }
+
+    tmp_path = None
+    try:
+        directory = os.path.dirname(path) or '.'
+        os.makedirs(directory, exist_ok=True)
+        # Eindeutige Temp-Datei im Zielverzeichnis (os.replace bleibt atomar,
+        # auch wenn ein zweiter Prozess gleichzeitig speichert)
+        with tempfile.NamedTemporaryFile(dir=directory, prefix=os.path.basename(path) + '.',
+                                         suffix='.tmp', delete=False) as raw:
+            tmp_path = raw.name
+            with gzip.open(raw, 'wt', encoding='utf-8') as f:
+                json.dump(payload, f, separators=(',', ':'), default=str)
+        os.replace(tmp_path, path)
+        print(f"💾 Markets-Snapshot gespeichert: {len(payload['exchanges'])} Exchanges")
+        return True
+    except Exception as e:
+        if tmp_path and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        print(f"⚠️ Markets-Snapshot konnte nicht gespeichert werden: {e}")
+        return False
+
+
+def load_snapshot(path: str = None) -> Optional[Dict[str, Any]]:
+    """
+    📂 Lädt einen Snapshot, falls vorhanden, passend und nicht zu alt
+
+    Args:
+        path: Snapshot-Datei (None = MARKETS_SNAPSHOT_CONFIG['path'])
+
+    Returns:
+        Optional[Dict]: ``{name: {'markets', 'currencies'}}`` oder None
+    """
+    path = path or MARKETS_SNAPSHOT_CONFIG['path']
+    payload = _read_payload(path)
+    if payload is None:
+        return None
+
+    # Alter pro Exchange prüfen (Einträge werden einzeln aktualisiert)
+    now = time.time()
+    max_age = MARKETS_SNAPSHOT_CONFIG['max_age_hours'] * 3600
+    exchanges = {}
+    for name, data in payload.get('exchanges', {}).items():
+        age = now - data.get('saved_at', payload.get('created_at', 0))
+        if age > max_age:
+            print(f"⚠️ Markets-Snapshot für {name} {age / 3600:.0f}h alt, wird ignoriert")
+            continue
+        exchanges[name] = data
+
+    if not exchanges:
+        return None
+
+    print(f"📂 Markets-Snapshot geladen ({len(exchanges)} Exchanges)")
+    return exchanges
+
+
+def diff_markets(old: Dict[str, Dict], new: Dict[str, Dict]) -> Dict[str, int]:
+    """Anzahl hinzugekommener/entfernter Symbole zwischen zwei Markets-Dicts"""
+    old_symbols, new_symbols = set(old), set(new)
+    return {
+        'added': len(new_symbols - old_symbols),
+        'removed': len(old_symbols - new_symbols),
+    }
@@ -0,0 +1,212 @@
+# core/memory_cache.py - Begrenzter LRU+TTL Memory-Cache mit Byte-Accounting
+"""
+Memory Cache - In-Memory-Zwischenspeicher der Market Engine
+
+Ersetzt das frühere ``self.cache = {}`` der MarketEngine, das im
+Dauerbetrieb jede jemals angeklickte Kombination behalten hat.
+
+Funktionale Merkmale:
+- Obergrenzen für Anzahl Einträge und belegte Bytes
+- LRU-Eviction (am längsten nicht genutzte Einträge fliegen zuerst)
+- TTL pro Eintrag, abgelaufene Einträge bleiben per ``peek`` lesbar
+- Byte-Größe von DataFrames via ``memory_usage(deep=True)``
+- Hit/Miss/Eviction-Zähler zur Dimensionierung
+
+Thread-sicher über ein internes RLock (Dash-Callbacks laufen parallel).
+"""
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+import pandas as pd
+
+
+# ==============================================================================
+# region               🧮 GRÖSSEN-BERECHNUNG
+# ==============================================================================
+def estimate_nbytes(value: Any) -> int:
+    """
+    Schätzt den Speicherbedarf eines Cache-Werts in Bytes
+
+    DataFrames/Series werden über ``memory_usage(deep=True)`` gemessen,
+    Objekte mit ``nbytes`` (z.B. NumPy-Arrays) über dieses Attribut,
+    Dicts/Listen/Tupel rekursiv, alles andere über ``sys.getsizeof``.
+    """
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(deep=True))
+    if hasattr(value, 'nbytes'):
+        return int(value.nbytes)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimate_nbytes(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(estimate_nbytes(v) for v in value)
+    return sys.getsizeof(value)
+# endregion
+
+
+# ==============================================================================
+# region               📦 CACHE-EINTRAG
+# ==============================================================================
+class CacheEntry:
+    """Ein Cache-Eintrag mit Wert, Zeitstempeln und Byte-Größe"""
+    __slots__ = ('value', 'stored_at', 'expires_at', 'nbytes')
+
+    def __init__(self, value: Any, stored_at: float, expires_at: float, nbytes: int):
+        self.value = value
+        self.stored_at = stored_at
+        self.expires_at = expires_at
+        self.nbytes = nbytes
+
+    @property
+    def age(self) -> float:
+        """Alter des Eintrags in Sekunden"""
+        return time.time() - self.stored_at
+
+    @property
+    def expired(self) -> bool:
+        """True wenn die TTL abgelaufen ist"""
+        return time.time() >= self.expires_at
+# endregion
+
+
+# ==============================================================================
+# region               💾 MEMORY CACHE
+# ==============================================================================
+class MemoryCache:
+    """
+    💾 Begrenzter LRU-Cache mit TTL pro Eintrag
+
+    ``get`` liefert nur frische Einträge und zählt Hits/Misses.
+    ``peek`` liefert den Eintrag auch nach Ablauf der TTL (z.B. als
+    Basis für inkrementelle Updates) und verändert weder LRU-Reihenfolge
+    noch Statistik. Abgelaufene Einträge bleiben so lange erhalten, bis
+    sie durch die Entry- oder Byte-Grenze verdrängt werden.
+
+    Attribute:
+        max_entries (int): Maximale Anzahl an Einträgen
+        max_bytes (int): Maximal belegte Bytes über alle Einträge
+        default_ttl (float): TTL in Sekunden, wenn bei ``set`` keine angegeben
+    """
+
+    def __init__(self, max_entries: int = 512, max_bytes: int = 256 * 1024 * 1024,
+                 default_ttl: float = 300):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+
+        self._entries: 'OrderedDict[Hashable, CacheEntry]' = OrderedDict()
+        self._lock = threading.RLock()
+        self._bytes = 0
+
+        # Zähler für Dimensionierung
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    # •••••••••••••••••••••••••• Lesen •••••••••••••••••••••••••• #
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Liefert den Wert eines frischen Eintrags oder ``default``"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            if entry.expired:
+                self.misses += 1
+                self.expirations += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.value
+
+    def peek(self, key: Hashable) -> Optional[CacheEntry]:
+        """Liefert den Eintrag unabhängig von der TTL (ohne LRU/Statistik)"""
+        with self._lock:
+            return self._entries.get(key)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and not entry.expired
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # •••••••••••••••••••••••••• Schreiben •••••••••••••••••••••••••• #
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Speichert einen Wert mit TTL und verdrängt bei Bedarf LRU-Einträge
+
+        Args:
+            key: Cache-Key (hashable)
+            value: Zu speichernder Wert
+            ttl: Gültigkeit in Sekunden (None = ``default_ttl``)
+        """
+        now = time.time()
+        ttl = self.default_ttl if ttl is None else ttl
+        entry = CacheEntry(value, now, now + ttl, estimate_nbytes(value))
+
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old.nbytes
+
+            self._entries[key] = entry
+            self._bytes += entry.nbytes
+            self._evict()
+
+    def delete(self, key: Hashable) -> bool:
+        """Entfernt einen Eintrag, gibt True zurück wenn er existierte"""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return False
+            self._bytes -= entry.nbytes
+            return True
+
+    def clear(self) -> None:
+        """Leert den Cache (Statistik bleibt erhalten)"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def purge_expired(self) -> int:
+        """Entfernt alle abgelaufenen Einträge, gibt deren Anzahl zurück"""
+        with self._lock:
+            expired = [key for key, entry in self._entries.items() if entry.expired]
+            for key in expired:
+                self._bytes -= self._entries.pop(key).nbytes
+            return len(expired)
+
+    def _evict(self) -> None:
+        """Verdrängt LRU-Einträge bis beide Grenzen eingehalten sind"""
+        # Der zuletzt geschriebene Eintrag bleibt immer erhalten
+        while len(self._entries) > 1 and (
+                len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+            _, entry = self._entries.popitem(last=False)
+            self._bytes -= entry.nbytes
+            self.evictions += 1
+
+    # •••••••••••••••••••••••••• Statistik •••••••••••••••••••••••••• #
+    def stats(self) -> Dict[str, Any]:
+        """Zähler und aktuelle Auslastung für Monitoring/Sizing"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+            }
+# endregion
@@ -0,0 +1,146 @@
+# core/ohlcv_data.py - OHLCV-Konvertierung und Candle-Buffer-Logik
+"""
+OHLCV Data - Gemeinsame Bausteine für MarketEngine und AsyncMarketEngine
+
+Ein Candle-Buffer ist ein Dict ``{'data': OHLCVSeries, 'complete': bool,
+'fetched_at': float}`` pro (Exchange, Symbol, Timeframe). ``complete``
+markiert, dass der Exchange keine ältere Historie liefert als im Buffer steht.
+
+Die Funktionen hier sind reine Datenlogik ohne Netzwerkzugriff, damit
+synchrone und asynchrone Engine identisch puffern und mergen.
+
+Ingest: Die ccxt-Liste wird einmal in NumPy-Arrays gewandelt
+(``OHLCVSeries``); DataFrames entstehen erst am UI-Rand als Views darauf.
+Mit ``CACHE_CONFIG['ohlcv_float32']`` werden Preise/Volumen als float32
+gepuffert (halber Speicher, ~7 signifikante Stellen).
+"""
+import time
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from config.settings import CACHE_CONFIG, CHART_CONFIG, BACKFILL_CONFIG
+from core.ohlcv_series import OHLCVSeries, PRICE_COLUMNS
+from core.timeframes import timeframe_to_seconds
+
+
+def buffer_dtype():
+    """dtype der gepufferten Preise/Volumen (CACHE_CONFIG['ohlcv_float32'])"""
+    return np.float32 if CACHE_CONFIG['ohlcv_float32'] else np.float64
+
+
+def ohlcv_to_series(ohlcv: List[List]) -> OHLCVSeries:
+    """Konvertiert ccxt OHLCV-Listen in eine sortierte OHLCVSeries (Buffer-dtype)"""
+    return OHLCVSeries.from_ohlcv(ohlcv, buffer_dtype())
+
+
+def ohlcv_to_frame(ohlcv: List[List]) -> pd.DataFrame:
+    """Konvertiert ccxt OHLCV-Listen in ein sortiertes DataFrame"""
+    return OHLCVSeries.from_ohlcv(ohlcv).to_frame()
+
+
+def ohlcv_arrays(data: Union[pd.DataFrame, OHLCVSeries]) -> Dict[str, np.ndarray]:
+    """
+    OHLCV-Spalten als zusammenhängende float64-Arrays (für TA-Lib und Detektoren)
+
+    OHLCVSeries (float64) und Frames aus ``to_frame`` werden ohne Kopie
+    durchgereicht; nur andere dtypes oder nicht zusammenhängende Spalten
+    werden kopiert. Ein leeres Frame (auch ``pd.DataFrame()`` ohne Spalten,
+    z.B. nach einem fehlgeschlagenen Fetch) ergibt leere Arrays.
+    """
+    if isinstance(data, OHLCVSeries):
+        return data.arrays()
+    if data.empty:
+        return OHLCVSeries.empty_series().arrays()
+
+    arrays = {column: np.ascontiguousarray(data[column].to_numpy(dtype=np.float64))
+              for column in PRICE_COLUMNS}
+    arrays['timestamp'] = data['timestamp'].to_numpy(dtype=np.int64)
+    return arrays
+
+
+def merge_candles(buffer: OHLCVSeries, new_candles: OHLCVSeries) -> OHLCVSeries:
+    """
+    Mischt neue Candles in einen bestehenden Buffer ein
+
+    Alle Buffer-Candles ab dem ersten neuen Timestamp werden verworfen,
+    damit eine noch laufende letzte Candle durch ihre aktuelle Version
+    ersetzt wird.
+    """
+    return buffer.merge(new_candles)
+
+
+def buffer_covers(buffer: Dict[str, Any], limit: int) -> bool:
+    """Prüft ob ein Buffer ``limit`` Candles liefern kann (oder die volle Historie hat)"""
+    return len(buffer['data']) >= limit or buffer['complete']
+
+
+def page_limit(exchange: str, limit: Optional[int] = None) -> int:
+    """
+    Max. Candles, die ein einzelner ``fetch_ohlcv``-Request des Exchanges liefert
+
+    Args:
+        exchange: Exchange-Name (Key in ``BACKFILL_CONFIG['page_limits']``)
+        limit: Optionale weitere Obergrenze (z.B. angefragte Candles)
+    """
+    pages = BACKFILL_CONFIG['page_limits'].get(exchange, BACKFILL_CONFIG['default_page_limit'])
+    return pages if limit is None else min(pages, limit)
+
+
+def incremental_since(buffer: Optional[Dict[str, Any]], limit: int, timeframe: str,
+                      now_ms: Optional[int] = None, page_size: Optional[int] = None) -> Optional[int]:
+    """
+    Ermittelt den ``since``-Timestamp für ein inkrementelles Update
+
+    Das Update ist ein einzelner Request mit ``limit=page_size``; er muss die
+    letzte Buffer-Candle plus alle seither begonnenen Candles enthalten,
+    sonst endet die Serie in der Vergangenheit.
+
+    Args:
+        page_size: Candles pro Request (None = ``limit``), siehe ``page_limit``
+
+    Returns:
+        Optional[int]: Timestamp der letzten Buffer-Candle, oder None wenn
+        ein kompletter Abruf nötig ist (kein Buffer, Buffer zu kurz oder
+        Lücke passt nicht in einen Request)
+    """
+    if not buffer or not buffer_covers(buffer, limit):
+        return None
+
+    try:
+        timeframe_ms = timeframe_to_seconds(timeframe) * 1000
+    except ValueError:
+        return None
+
+    now_ms = int(time.time() * 1000) if now_ms is None else now_ms
+    since = buffer['data'].last_timestamp
+
+    # Lücke (+ letzte Buffer-Candle) passt in einen Request → nur neue Candles holen
+    page_size = limit if page_size is None else min(limit, page_size)
+    if (now_ms - since) // timeframe_ms < page_size:
+        return since
+    return None
+
+
+def build_buffer(series: OHLCVSeries, limit: int, complete: bool,
+                 previous: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Erzeugt einen Buffer (inkl. Abrufzeitpunkt)
+
+    Begrenzt auf max(limit, Länge des bisherigen Buffers, CHART_CONFIG['max_candles'])
+    Candles: ein Refresh mit kleinerem ``limit`` (Prefetcher, 1d-Stats) kürzt
+    einen längeren Buffer nicht, sonst lädt die nächste große Anfrage alles neu.
+    """
+    # Buffer begrenzen, damit er bei Dauerbetrieb nicht endlos wächst
+    kept = len(previous['data']) if previous else 0
+    max_rows = max(limit, kept, CHART_CONFIG['max_candles'])
+    if len(series) > max_rows:
+        series = series.tail(max_rows).copy()  # Kopie gibt die längeren Arrays frei
+        complete = False
+    return {'data': series, 'complete': complete, 'fetched_at': time.time()}
+
+
+def tail_view(series: OHLCVSeries, limit: int) -> OHLCVSeries:
+    """Liefert die letzten ``limit`` Candles als View auf die gepufferte Serie (O(1), keine Kopie)"""
+    return series.tail(limit)
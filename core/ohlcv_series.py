@@ -0,0 +1,201 @@
+# core/ohlcv_series.py - Kompakter, NumPy-basierter OHLCV-Container
+"""
+OHLCV Series - Candle-Serien ohne DataFrame-Overhead
+
+Eine ``OHLCVSeries`` hält zwei Arrays fester dtypes:
+
+- ``timestamps``: int64, Unix-Millisekunden (aufsteigend)
+- ``values``: (5, n), open/high/low/close/volume als zusammenhängende Zeilen
+  (float64 oder optional float32)
+
+Serien sind unveränderlich (Arrays read-only): ``tail`` liefert in O(1)
+einen View, ``merge``/``append`` eine neue Serie. Dadurch kann ein Cache-Eintrag ohne
+Lock und ohne Kopie von mehreren Threads gelesen werden. Ein DataFrame
+(inkl. ``datetime``-Spalte) entsteht erst am UI-Rand über ``to_frame``.
+
+Verwendung:
+    >>> series = OHLCVSeries.from_ohlcv(exchange.fetch_ohlcv("BTC/USDT", "1h"))
+    >>> talib.SMA(series.arrays()['close'], 20)
+    >>> df = series.tail(200).to_frame()
+"""
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+OHLCV_COLUMNS = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
+PRICE_COLUMNS = OHLCV_COLUMNS[1:]
+
+
+def ohlcv_to_arrays(ohlcv: List[List], dtype=np.float64) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Konvertiert ccxt OHLCV-Listen in NumPy-Arrays
+
+    Returns:
+        Tuple: (int64-Timestamps in ms, Array der Form (5, n) mit
+        open/high/low/close/volume als zusammenhängende Zeilen)
+    """
+    raw = np.asarray(ohlcv, dtype=np.float64).reshape(-1, len(OHLCV_COLUMNS))
+    timestamps = raw[:, 0].astype(np.int64)
+    values = np.ascontiguousarray(raw[:, 1:].T, dtype=dtype)
+
+    # Exchanges liefern fast immer aufsteigend → nur sortieren, wenn nötig
+    if len(timestamps) > 1 and not (timestamps[1:] >= timestamps[:-1]).all():
+        order = np.argsort(timestamps, kind='stable')
+        timestamps = timestamps[order]
+        values = values[:, order]
+    return timestamps, values
+
+
+class OHLCVSeries:
+    """
+    🕯️ Unveränderliche Candle-Serie auf NumPy-Arrays
+
+    Attribute:
+        timestamps (np.ndarray): int64-Millisekunden, aufsteigend
+        values (np.ndarray): (5, n) open/high/low/close/volume
+        attrs (dict): Metadaten (z.B. ``stale``, ``age_seconds``), wandern in ``to_frame``
+    """
+    __slots__ = ('timestamps', 'values', 'attrs')
+
+    def __init__(self, timestamps: np.ndarray, values: np.ndarray, attrs: Optional[Dict] = None):
+        timestamps.flags.writeable = False
+        values.flags.writeable = False
+        self.timestamps = timestamps
+        self.values = values
+        self.attrs = attrs if attrs is not None else {}
+
+    # •••••••••••••••••••••••••• Erzeugen •••••••••••••••••••••••••• #
+    @classmethod
+    def from_ohlcv(cls, ohlcv: List[List], dtype=np.float64) -> 'OHLCVSeries':
+        """Aus der ccxt-Antwort (Liste von [ts, o, h, l, c, v])"""
+        return cls(*ohlcv_to_arrays(ohlcv, dtype))
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, dtype=np.float64) -> 'OHLCVSeries':
+        """Aus einem DataFrame mit timestamp/open/high/low/close/volume"""
+        timestamps = df['timestamp'].to_numpy(dtype=np.int64, copy=True)
+        values = np.stack([df[column].to_numpy(dtype=dtype) for column in PRICE_COLUMNS])
+        return cls(timestamps, values)
+
+    @classmethod
+    def empty_series(cls, dtype=np.float64) -> 'OHLCVSeries':
+        return cls(np.empty(0, dtype=np.int64), np.empty((len(PRICE_COLUMNS), 0), dtype=dtype))
+
+    # •••••••••••••••••••••••••• Zugriff •••••••••••••••••••••••••• #
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    @property
+    def empty(self) -> bool:
+        return len(self.timestamps) == 0
+
+    @property
+    def open(self) -> np.ndarray:
+        return self.values[0]
+
+    @property
+    def high(self) -> np.ndarray:
+        return self.values[1]
+
+    @property
+    def low(self) -> np.ndarray:
+        return self.values[2]
+
+    @property
+    def close(self) -> np.ndarray:
+        return self.values[3]
+
+    @property
+    def volume(self) -> np.ndarray:
+        return self.values[4]
+
+    @property
+    def last_timestamp(self) -> Optional[int]:
+        return int(self.timestamps[-1]) if len(self.timestamps) else None
+
+    @property
+    def nbytes(self) -> int:
+        """Speicherbedarf der Arrays (Views zählen die sichtbaren Zeilen)"""
+        return self.timestamps.nbytes + self.values.nbytes
+
+    def datetime(self, index: int) -> pd.Timestamp:
+        """Datetime einer einzelnen Candle (erst bei Bedarf, z.B. für Signale)"""
+        return pd.Timestamp(int(self.timestamps[index]), unit='ms')
+
+    def arrays(self) -> Dict[str, np.ndarray]:
+        """
+        Spalten als zusammenhängende float64-Arrays (für TA-Lib und Detektoren)
+
+        Bei float64-Serien ohne Kopie; float32-Serien werden hier hochkonvertiert,
+        da TA-Lib nur double verarbeitet.
+        """
+        values = self.values if self.values.dtype == np.float64 else self.values.astype(np.float64)
+        arrays = dict(zip(PRICE_COLUMNS, values))
+        arrays['timestamp'] = self.timestamps
+        return arrays
+
+    # •••••••••••••••••••••••••• Slicing / Merge •••••••••••••••••••••••••• #
+    def tail(self, limit: int) -> 'OHLCVSeries':
+        """Die letzten ``limit`` Candles als View (O(1), keine Kopie; ``limit <= 0`` → leer)"""
+        if limit <= 0:
+            return OHLCVSeries(self.timestamps[:0], self.values[:, :0])
+        if limit >= len(self):
+            return OHLCVSeries(self.timestamps, self.values)
+        return OHLCVSeries(self.timestamps[-limit:], self.values[:, -limit:])
+
+    def between(self, since: int, until: int) -> 'OHLCVSeries':
+        """Candles mit ``since <= timestamp < until`` als View"""
+        start, end = np.searchsorted(self.timestamps, [since, until])
+        return OHLCVSeries(self.timestamps[start:end], self.values[:, start:end])
+
+    def copy(self) -> 'OHLCVSeries':
+        """Eigene Arrays (z.B. damit ein Tail-View den großen Basis-Buffer freigibt)"""
+        return OHLCVSeries(self.timestamps.copy(), self.values.copy())
+
+    def merge(self, new: 'OHLCVSeries') -> 'OHLCVSeries':
+        """
+        Mischt neue Candles ein (Semantik wie ``merge_candles``)
+
+        Alle Candles ab dem ersten neuen Timestamp werden verworfen, damit eine
+        noch laufende letzte Candle durch ihre aktuelle Version ersetzt wird.
+        Doppelte Timestamps in ``new`` → die letzte Version gewinnt.
+        """
+        if new.empty:
+            return self
+
+        keep = np.searchsorted(self.timestamps, new.timestamps[0])
+        timestamps, values = new.timestamps, new.values
+        unique = np.append(timestamps[1:] != timestamps[:-1], True)
+        if not unique.all():
+            timestamps, values = timestamps[unique], values[:, unique]
+
+        return OHLCVSeries(
+            np.concatenate([self.timestamps[:keep], timestamps]),
+            np.concatenate([self.values[:, :keep], values.astype(self.values.dtype, copy=False)], axis=1),
+        )
+
+    def append(self, new: 'OHLCVSeries') -> 'OHLCVSeries':
+        """Hängt neue Candles an; eine laufende letzte Candle wird ersetzt (= ``merge``)"""
+        return self.merge(new)
+
+    # •••••••••••••••••••••••••• UI-Rand •••••••••••••••••••••••••• #
+    def to_frame(self, copy: bool = False) -> pd.DataFrame:
+        """
+        DataFrame (timestamp, open, high, low, close, volume, datetime)
+
+        Args:
+            copy: False = Views auf die read-only Arrays (Zuweisungen wie
+                ``df.loc[i, 'close'] = x`` schlagen fehl), True = eigene,
+                beschreibbare Spalten
+        """
+        columns = {'timestamp': self.timestamps}
+        columns.update(zip(PRICE_COLUMNS, self.values))
+        # ns wie bisher ``pd.to_datetime(unit='ms')`` (eigene Spalte, nicht nur ein View)
+        columns['datetime'] = self.timestamps.view('datetime64[ms]').astype('datetime64[ns]')
+        df = pd.DataFrame(columns, copy=copy)
+        df.attrs = dict(self.attrs)
+        return df
+
+    def __repr__(self) -> str:
+        return f"OHLCVSeries({len(self)} candles, {self.values.dtype})"
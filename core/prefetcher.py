@@ -0,0 +1,171 @@
+# core/prefetcher.py - Refresh-Ahead Prefetcher für Watchlist-Charts
+"""
+Prefetcher - Hält Watchlist und häufig genutzte Charts im Cache warm
+
+Ein Hintergrund-Thread erneuert gecachte Candle-Serien, bevor der nächste
+Klick auf ANALYZE einen synchronen Exchange-Request auslösen würde:
+
+- Watchlist (``PREFETCH_CONFIG['watchlist']`` × Timeframes) ist immer dabei
+- Charts, die über ``get_ohlcv`` abgefragt werden, kommen mit einer
+  zerfallenden Zugriffshäufigkeit (Halbwertszeit) hinzu
+- Fällige Einträge werden nach Häufigkeit priorisiert, max. N pro Durchlauf
+
+Fälligkeit: Einträge mit fester TTL werden ``refresh_ahead_seconds`` vor
+Ablauf erneuert. Candle-Close-TTLs laufen genau beim Close (+ Grace) ab –
+ein früherer Abruf würde die neue Candle noch nicht enthalten und die
+Gültigkeit nicht verlängern; sie werden daher direkt beim Ablauf erneuert.
+"""
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from config.settings import PREFETCH_CONFIG
+from core.timeframes import is_candle_aligned
+
+# (symbol, timeframe, exchange)
+ChartKey = Tuple[str, str, Optional[str]]
+
+
+class _Access:
+    """Zerfallender Zugriffszähler eines Charts"""
+    __slots__ = ('score', 'last_access', 'limit')
+
+    def __init__(self, limit: int):
+        self.score = 0.0
+        self.last_access = time.time()
+        self.limit = limit
+
+
+class Prefetcher:
+    """
+    🔥 Refresh-Ahead für die OHLCV-Caches der MarketEngine
+
+    Attribute:
+        engine: MarketEngine (liefert Cache-Einträge und ``refresh_ohlcv``)
+        refreshed (int): Anzahl im Hintergrund erneuerter Serien
+    """
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.refreshed = 0
+        self._access: Dict[ChartKey, _Access] = {}
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Startet den Hintergrund-Thread (idempotent)"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='ohlcv-prefetcher', daemon=True)
+            self._thread.start()
+
+    # •••••••••••••••••••••••••• Zugriffe •••••••••••••••••••••••••• #
+    def record_access(self, symbol: str, timeframe: str, limit: int,
+                      exchange: Optional[str] = None) -> None:
+        """Zählt einen Chart-Abruf (von ``MarketEngine.get_ohlcv`` aufgerufen)"""
+        key = (symbol, timeframe, exchange)
+        now = time.time()
+        with self._lock:
+            access = self._access.get(key)
+            if access is None:
+                access = self._access[key] = _Access(limit)
+                self._prune()
+            access.score = self._decayed(access, now) + 1.0
+            access.last_access = now
+            access.limit = max(access.limit, limit)
+
+    def _decayed(self, access: _Access, now: float) -> float:
+        half_life = PREFETCH_CONFIG['access_half_life_seconds']
+        return access.score * 0.5 ** ((now - access.last_access) / half_life)
+
+    def _prune(self) -> None:
+        """Entfernt die seltensten Charts, wenn zu viele getrackt werden (Lock muss gehalten werden)"""
+        overflow = len(self._access) - PREFETCH_CONFIG['max_tracked']
+        if overflow <= 0:
+            return
+        now = time.time()
+        rarest = sorted(self._access, key=lambda key: self._decayed(self._access[key], now))
+        for key in rarest[:overflow]:
+            del self._access[key]
+
+    def candidates(self) -> List[Tuple[float, ChartKey, int]]:
+        """
+        Alle Charts, die warm gehalten werden, mit Priorität
+
+        Returns:
+            List[(score, (symbol, timeframe, exchange), limit)]: höchste Priorität zuerst
+        """
+        now = time.time()
+        charts: Dict[ChartKey, Tuple[float, int]] = {}
+
+        with self._lock:
+            for key, access in self._access.items():
+                score = self._decayed(access, now)
+                if score >= PREFETCH_CONFIG['min_access_score']:
+                    charts[key] = (score, access.limit)
+
+        # Watchlist ist immer dabei (Zugriffe erhöhen nur die Priorität)
+        for symbol in PREFETCH_CONFIG['watchlist']:
+            for timeframe in PREFETCH_CONFIG['timeframes']:
+                key = (symbol, timeframe, None)
+                score, limit = charts.get(key, (0.0, 0))
+                charts[key] = (score + PREFETCH_CONFIG['min_access_score'],
+                               max(limit, PREFETCH_CONFIG['limit']))
+
+        ranked = sorted(charts.items(), key=lambda item: -item[1][0])
+        return [(score, key, limit) for key, (score, limit) in ranked]
+
+    # •••••••••••••••••••••••••• Refresh-Loop •••••••••••••••••••••••••• #
+    def _refresh_at(self, symbol: str, timeframe: str, limit: int,
+                    exchange: Optional[str]) -> float:
+        """Zeitpunkt, ab dem der Chart erneuert werden soll (0 = sofort)"""
+        entry = self.engine.ohlcv_cache_entry(symbol, timeframe, limit, exchange)
+        if entry is None:
+            return 0.0
+        lead = 0.0 if is_candle_aligned(timeframe) else PREFETCH_CONFIG['refresh_ahead_seconds']
+        return entry.expires_at - lead
+
+    def run_once(self) -> float:
+        """
+        Erneuert alle fälligen Charts (max. ``max_per_cycle``, häufigste zuerst)
+
+        Returns:
+            float: Sekunden bis zum nächsten fälligen Chart (gedeckelt auf ``check_seconds``)
+        """
+        now = time.time()
+        next_due = now + PREFETCH_CONFIG['check_seconds']
+        budget = PREFETCH_CONFIG['max_per_cycle']
+
+        for _, (symbol, timeframe, exchange), limit in self.candidates():
+            refresh_at = self._refresh_at(symbol, timeframe, limit, exchange)
+            if refresh_at > now:
+                next_due = min(next_due, refresh_at)
+                continue
+            if budget <= 0:
+                next_due = now  # Rest im nächsten Durchlauf
+                continue
+
+            budget -= 1
+            try:
+                df = self.engine.refresh_ohlcv(symbol, timeframe, limit, exchange)
+                if not df.empty:
+                    self.refreshed += 1
+            except Exception as e:
+                print(f"❌ Prefetch {symbol} ({timeframe}) failed: {e}")
+
+        return max(next_due - time.time(), 1.0)
+
+    def _run(self) -> None:
+        """Hintergrund-Loop: schläft bis zum nächsten fälligen Chart"""
+        while True:
+            try:
+                delay = self.run_once()
+            except Exception as e:
+                print(f"❌ Prefetcher error: {e}")
+                delay = PREFETCH_CONFIG['check_seconds']
+            time.sleep(delay)
+
+    def stats(self) -> Dict[str, int]:
+        """Kennzahlen für Status-Anzeigen"""
+        with self._lock:
+            tracked = len(self._access)
+        return {'prefetch_tracked': tracked, 'prefetch_refreshed': self.refreshed}
@@ -0,0 +1,108 @@
+# core/rate_limiter.py - Token-Bucket Rate-Limiting pro Exchange
+"""
+Rate Limiter - Scheduler für Exchange-Requests
+
+Ersetzt die sleep-basierte Drosselung von ccxt (``enableRateLimit``),
+die pro Exchange-Objekt seriell blockiert. Jeder Exchange bekommt einen
+Token-Bucket, dessen Rate aus ``EXCHANGE_CONFIG[...]['rateLimit']``
+(Millisekunden zwischen zwei Requests) abgeleitet wird. Threads warten
+nur so lange, bis für *ihren* Exchange wieder ein Token frei ist.
+"""
+import threading
+import time
+from typing import Dict, Optional
+
+from config.settings import EXCHANGE_CONFIG, RATE_LIMIT_CONFIG
+
+
+class TokenBucket:
+    """
+    🪣 Thread-sicherer Token-Bucket
+
+    Attribute:
+        rate (float): Nachgefüllte Tokens pro Sekunde
+        capacity (float): Maximale Anzahl Tokens (Burst-Größe)
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        """Füllt Tokens entsprechend der vergangenen Zeit auf"""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self, tokens: float = 1.0) -> float:
+        """
+        Versucht Tokens zu entnehmen, ohne zu blockieren
+
+        Returns:
+            float: 0.0 bei Erfolg, sonst Wartezeit in Sekunden bis genug Tokens da sind
+        """
+        with self._lock:
+            self._refill()
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0.0
+            return (tokens - self._tokens) / self.rate
+
+    def acquire(self, tokens: float = 1.0, timeout: Optional[float] = None) -> bool:
+        """
+        Blockiert bis Tokens verfügbar sind
+
+        Args:
+            tokens: Anzahl benötigter Tokens
+            timeout: Maximale Wartezeit in Sekunden (None = unbegrenzt)
+
+        Returns:
+            bool: True wenn Tokens entnommen wurden, False bei Timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = self.try_acquire(tokens)
+            if wait == 0.0:
+                return True
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                wait = min(wait, remaining)
+            time.sleep(wait)
+
+
+class RateLimitScheduler:
+    """
+    🚦 Verwaltet einen Token-Bucket pro Exchange
+
+    Die Buckets werden aus ``EXCHANGE_CONFIG`` gebaut. Unbekannte
+    Exchanges bekommen einen Bucket mit ``RATE_LIMIT_CONFIG['default_rate_limit']``.
+    """
+
+    def __init__(self, burst: float = None):
+        self.burst = RATE_LIMIT_CONFIG['burst'] if burst is None else burst
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+        for name, config in EXCHANGE_CONFIG.items():
+            self._buckets[name] = self._create_bucket(config.get('rateLimit'))
+
+    def _create_bucket(self, rate_limit_ms: Optional[float]) -> TokenBucket:
+        """Erzeugt einen Bucket aus einem ccxt-rateLimit (ms pro Request)"""
+        rate_limit_ms = rate_limit_ms or RATE_LIMIT_CONFIG['default_rate_limit']
+        return TokenBucket(rate=1000.0 / rate_limit_ms, capacity=self.burst)
+
+    def bucket(self, exchange: str) -> TokenBucket:
+        """Liefert (oder erzeugt) den Bucket eines Exchanges"""
+        with self._lock:
+            if exchange not in self._buckets:
+                self._buckets[exchange] = self._create_bucket(None)
+            return self._buckets[exchange]
+
+    def acquire(self, exchange: str, timeout: Optional[float] = None) -> bool:
+        """Wartet auf einen Request-Slot für ``exchange``"""
+        return self.bucket(exchange).acquire(timeout=timeout)
@@ -0,0 +1,220 @@
+# core/signal_table.py - Spaltenbasierte Pattern-Signale
+"""
+Signal Table - Erkannte Signale als NumPy-Spalten statt Dict pro Treffer
+
+Detektoren liefern Masken/Indizes (``np.nonzero``); die Tabelle hält pro
+Signal eine Zeile in den Spalten index, timestamp, price, strength,
+direction (Code) und pattern (ID). Zusatzwerte einzelner Patterns
+(z.B. ``rsi_value``) liegen als Extra-Spalten mit NaN für andere Zeilen.
+
+Filtern läuft vektorisiert; das alte Format ``{pattern: [signal-dict, ...]}``
+entsteht erst bei Bedarf über ``to_dicts()``.
+
+Verwendung:
+    >>> table = market_engine.detect_signals(df)
+    >>> table.filter(min_strength=0.7, directions=['bullish']).to_dicts()
+"""
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+DIRECTIONS = ('bullish', 'bearish', 'neutral', 'support', 'resistance')
+DIRECTION_CODES = {name: code for code, name in enumerate(DIRECTIONS)}
+
+
+class SignalTable:
+    """
+    📋 Pattern-Signale als Spalten (eine Zeile pro Signal)
+
+    Attribute:
+        index, timestamp (np.ndarray): int64, Candle-Position und ms-Timestamp
+        price, strength (np.ndarray): float64
+        direction (np.ndarray): int8-Code in ``DIRECTIONS``
+        pattern (np.ndarray): int16-ID in ``groups``
+        groups (tuple): Pattern-Namen in Ausgabereihenfolge (auch ohne Signale)
+        extras (dict): Zusatzspalten (float64, NaN = nicht gesetzt)
+    """
+    __slots__ = ('index', 'timestamp', 'price', 'strength', 'direction', 'pattern',
+                 'groups', 'extras')
+
+    def __init__(self, index: np.ndarray, timestamp: np.ndarray, price: np.ndarray,
+                 strength: np.ndarray, direction: np.ndarray, pattern: np.ndarray,
+                 groups: Sequence[str], extras: Optional[Dict[str, np.ndarray]] = None):
+        self.index = index
+        self.timestamp = timestamp
+        self.price = price
+        self.strength = strength
+        self.direction = direction
+        self.pattern = pattern
+        self.groups = tuple(groups)
+        self.extras = extras or {}
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    @property
+    def nbytes(self) -> int:
+        columns = (self.index, self.timestamp, self.price, self.strength, self.direction, self.pattern)
+        return sum(column.nbytes for column in columns) + sum(v.nbytes for v in self.extras.values())
+
+    def counts(self) -> Dict[str, int]:
+        """Anzahl Signale pro Pattern (inkl. Patterns ohne Signal)"""
+        counts = np.bincount(self.pattern, minlength=len(self.groups))
+        return dict(zip(self.groups, counts.tolist()))
+
+    def _take(self, rows: np.ndarray, groups: Sequence[str]) -> 'SignalTable':
+        return SignalTable(self.index[rows], self.timestamp[rows], self.price[rows],
+                           self.strength[rows], self.direction[rows], self.pattern[rows],
+                           groups, {name: values[rows] for name, values in self.extras.items()})
+
+    def slice(self, start: int, stop: Optional[int] = None, offset: int = 0) -> 'SignalTable':
+        """Signale mit ``start <= index < stop``, Indizes um ``offset`` verschoben (Gruppen bleiben)"""
+        mask = self.index >= start
+        if stop is not None:
+            mask &= self.index < stop
+        table = self._take(np.flatnonzero(mask), self.groups)
+        table.index = table.index + offset
+        return table
+
+    @classmethod
+    def concat(cls, tables: Sequence['SignalTable'], group_order: Sequence[str],
+               keep_empty: Iterable[str] = ()) -> 'SignalTable':
+        """
+        Fügt Tabellen mit disjunkten Index-Bereichen zusammen
+
+        Zeilen werden nach (Position in ``group_order``, index) sortiert, bei
+        gleichem Index bleibt die Reihenfolge der Eingabe erhalten. Gruppen
+        ohne Signale bleiben nur, wenn sie in ``keep_empty`` stehen.
+        """
+        rank = {name: i for i, name in enumerate(group_order)}
+        keep_empty = set(keep_empty)
+        listed = {name for table in tables for name in table.groups}
+
+        # Pattern-IDs jeder Tabelle auf den globalen Rang abbilden
+        ranks = np.concatenate([
+            np.array([rank[name] for name in table.groups], dtype=np.int16)[table.pattern]
+            for table in tables]) if tables else np.empty(0, dtype=np.int16)
+        index = np.concatenate([table.index for table in tables]) if tables else np.empty(0, dtype=np.int64)
+        present = set(ranks.tolist())
+        groups = [name for name in group_order
+                  if name in listed and (rank[name] in present or name in keep_empty)]
+
+        remap = np.zeros(len(group_order), dtype=np.int16)
+        remap[[rank[name] for name in groups]] = np.arange(len(groups))
+        order = np.lexsort((index, ranks))  # stabil: gleiche Indizes behalten Eingabereihenfolge
+
+        def column(name):
+            return np.concatenate([getattr(table, name) for table in tables])[order]
+
+        extras = {}
+        for name in dict.fromkeys(name for table in tables for name in table.extras):
+            extras[name] = np.concatenate([
+                table.extras.get(name, np.full(len(table), np.nan)) for table in tables])[order]
+
+        return cls(index[order], column('timestamp'), column('price'), column('strength'),
+                   column('direction'), remap[ranks[order]], groups, extras)
+
+    def filter(self, min_strength: float = 0.0, directions: Iterable[str] = None,
+               pattern_types: Iterable[str] = None) -> 'SignalTable':
+        """
+        Vektorisierte Variante von ``MarketEngine.filter_patterns``
+
+        Patterns ohne verbleibende Signale fallen (wie dort) aus ``groups`` heraus.
+        """
+        mask = self.strength >= min_strength
+        if directions:
+            codes = [DIRECTION_CODES[name] for name in directions if name in DIRECTION_CODES]
+            mask &= np.isin(self.direction, codes)
+        if pattern_types:
+            wanted = set(pattern_types)
+            ids = [pattern_id for pattern_id, name in enumerate(self.groups) if name in wanted]
+            mask &= np.isin(self.pattern, ids)
+
+        rows = np.flatnonzero(mask)
+        # Pattern-IDs auf die verbleibenden Gruppen umnummerieren
+        present = np.unique(self.pattern[rows])
+        remap = np.zeros(len(self.groups), dtype=np.int16)
+        remap[present] = np.arange(len(present))
+        table = self._take(rows, [self.groups[pattern_id] for pattern_id in present])
+        table.pattern = remap[table.pattern]
+        return table
+
+    def to_dicts(self) -> Dict[str, List[Dict]]:
+        """Altes Format ``{pattern: [{'index', 'datetime', 'price', ..., 'pattern'}, ...]}``"""
+        result = {name: [] for name in self.groups}
+        datetimes = pd.DatetimeIndex(self.timestamp.view('datetime64[ms]'))
+        extras = [(name, values.tolist()) for name, values in self.extras.items()]
+
+        for row, (index, price, strength, direction, pattern) in enumerate(zip(
+                self.index.tolist(), self.price.tolist(), self.strength.tolist(),
+                self.direction.tolist(), self.pattern.tolist())):
+            name = self.groups[pattern]
+            signal = {'index': index, 'datetime': datetimes[row], 'price': price}
+            for extra, values in extras:
+                if values[row] == values[row]:  # NaN = Extra gehört zu einem anderen Pattern
+                    signal[extra] = values[row]
+            signal.update(strength=strength, direction=DIRECTIONS[direction], pattern=name)
+            result[name].append(signal)
+        return result
+
+
+class SignalTableBuilder:
+    """Sammelt die Treffer der Detektoren und baut daraus eine SignalTable"""
+
+    def __init__(self, timestamps: np.ndarray, close: np.ndarray):
+        self.timestamps = timestamps
+        self.close = close
+        self._groups: List[str] = []
+        self._chunks: List[Dict[str, np.ndarray]] = []
+
+    def add(self, pattern: str, rows: np.ndarray, strength, direction,
+            price: np.ndarray = None, keep_empty: bool = True, **extras: np.ndarray) -> None:
+        """
+        Fügt die Signale eines Patterns hinzu
+
+        Args:
+            pattern: Pattern-Name (Gruppe im Ergebnis)
+            rows: Candle-Indizes der Signale (aufsteigend)
+            strength: Skalar oder Array je Signal (0.0-1.0)
+            direction: Name, Code oder Code-Array je Signal
+            price: Preis je Signal (None = Schlusskurs)
+            keep_empty: Gruppe auch ohne Signale ausgeben
+            **extras: Zusatzwerte je Signal (z.B. rsi_value=...)
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        if not len(rows) and not keep_empty:
+            return
+
+        if pattern not in self._groups:
+            self._groups.append(pattern)
+        count = len(rows)
+        if isinstance(direction, str):
+            direction = DIRECTION_CODES[direction]
+        self._chunks.append({
+            'index': rows,
+            'price': self.close[rows] if price is None else np.asarray(price, dtype=np.float64),
+            'strength': np.broadcast_to(np.asarray(strength, dtype=np.float64), (count,)),
+            'direction': np.broadcast_to(np.asarray(direction, dtype=np.int8), (count,)),
+            'pattern': np.full(count, self._groups.index(pattern), dtype=np.int16),
+            'extras': {name: np.asarray(values, dtype=np.float64) for name, values in extras.items()},
+        })
+
+    def build(self) -> SignalTable:
+        if not self._chunks:
+            empty = np.empty(0, dtype=np.int64)
+            return SignalTable(empty, empty, np.empty(0), np.empty(0),
+                               np.empty(0, dtype=np.int8), np.empty(0, dtype=np.int16), self._groups)
+
+        def column(name):
+            return np.concatenate([chunk[name] for chunk in self._chunks])
+
+        index = column('index')
+        extras = {}
+        for name in dict.fromkeys(name for chunk in self._chunks for name in chunk['extras']):
+            extras[name] = np.concatenate([
+                chunk['extras'].get(name, np.full(len(chunk['index']), np.nan))
+                for chunk in self._chunks])
+
+        return SignalTable(index, self.timestamps[index], column('price'), column('strength'),
+                           column('direction'), column('pattern'), self._groups, extras)
@@ -0,0 +1,127 @@
+# core/single_flight.py - Request-Coalescing für parallele identische Abrufe
+"""
+Single Flight - Deduplizierung gleichzeitiger identischer Anfragen
+
+Dash bedient Callbacks aus mehreren Threads. Fragen zwei Threads im
+selben Moment dieselben Daten an, führt nur der erste ("Leader") den
+Abruf aus. Alle weiteren Aufrufer mit demselben Key warten auf dessen
+Ergebnis (oder Exception), statt einen zweiten Exchange-Request zu senden.
+
+``do_sized`` für Abrufe mit Größe (z.B. Candle-Limit): eine Anfrage hängt
+sich an jeden laufenden Abruf an, der mindestens so groß ist; kleinere
+Ergebnisse schneidet der Aufrufer selbst zu.
+"""
+import threading
+from typing import Any, Callable, Dict, Hashable
+
+
+class _Call:
+    """Ein laufender Abruf, auf den Follower warten"""
+    __slots__ = ('event', 'result', 'error', 'size')
+
+    def __init__(self, size: int = None):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+        self.size = size
+
+
+class SingleFlight:
+    """
+    🛫 Führt pro Key höchstens einen Abruf gleichzeitig aus
+
+    Attribute:
+        coalesced (int): Anzahl Aufrufe, die sich an einen laufenden Abruf
+            angehängt haben (eingesparte Requests)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._wanted: Dict[Hashable, int] = {}  # Größte Größe, die auf einen zu kleinen Abruf wartet
+        self.coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Führt ``fn(*args, **kwargs)`` aus oder wartet auf den laufenden Abruf
+
+        Args:
+            key: Identität der Anfrage (gleicher Key = gleiches Ergebnis)
+            fn: Abruf-Funktion, wird nur vom Leader ausgeführt
+
+        Returns:
+            Ergebnis von ``fn`` (für Leader und alle Follower identisch)
+
+        Raises:
+            Exception: Die vom Leader ausgelöste Exception, auch bei Followern
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            return self._follow(call)
+        return self._lead(key, call, fn, *args, **kwargs)
+
+    def do_sized(self, key: Hashable, size: int, fn: Callable[[int], Any]) -> Any:
+        """
+        Wie ``do`` für Abrufe mit Größe: ``fn(size)`` liefert mindestens ``size`` Elemente
+
+        Ein laufender Abruf mit mindestens ``size`` wird geteilt. Ist er kleiner,
+        wartet der Aufrufer auf ihn und startet danach einen Abruf mit der größten
+        Größe aller bis dahin Wartenden (die sich wiederum anhängen). Gleichzeitige
+        Anfragen mit 200 und 300 Candles kosten so höchstens zwei Requests, beliebig
+        viele mit ≤ 200 nur einen.
+
+        Returns:
+            Ergebnis eines Abrufs mit Größe ≥ ``size`` (ggf. größer → selbst zuschneiden)
+        """
+        while True:
+            with self._lock:
+                call = self._calls.get(key)
+                leader = call is None
+                if leader:
+                    size = max(size, self._wanted.pop(key, 0))
+                    call = self._calls[key] = _Call(size)
+                joined = not leader and call.size >= size
+                if joined:
+                    self.coalesced += 1
+                elif not leader:
+                    # Zu klein: nach dessen Ende mit der größten wartenden Größe neu abrufen
+                    self._wanted[key] = max(self._wanted.get(key, 0), size)
+
+            if leader:
+                return self._lead(key, call, fn, size)
+            if joined:
+                return self._follow(call)
+            call.event.wait()
+
+    @staticmethod
+    def _follow(call: _Call) -> Any:
+        """Wartet auf den Abruf des Leaders und übernimmt Ergebnis oder Exception"""
+        call.event.wait()
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+    def _lead(self, key: Hashable, call: _Call, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """Führt den Abruf als Leader aus und weckt alle Follower"""
+        try:
+            call.result = fn(*args, **kwargs)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+
+    def in_flight(self) -> int:
+        """Anzahl aktuell laufender Abrufe"""
+        with self._lock:
+            return len(self._calls)
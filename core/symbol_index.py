@@ -0,0 +1,143 @@
+# core/symbol_index.py - Invertierter Index: Symbol → Exchanges, die es listen
+"""
+Symbol Index - Routing-Tabelle aus den geladenen ccxt-Markets
+
+Jeder geladene Exchange hat in ``exchange.markets`` bereits die Info,
+welche Pairs er listet. Der Index dreht das um: Unified Symbol →
+{Exchange: native Market-ID}. Zusätzlich wird nach (Base, Quote)
+indexiert, damit Quote-Aliase wie USD/USDT/USDC als Ausweichroute
+gefunden werden (z.B. BTC/USDT angefragt, Exchange listet nur BTC/USD).
+
+Der Index wird bei jedem fertig geladenen Exchange neu aufgebaut und
+per Copy-on-Write getauscht: Lesezugriffe brauchen keinen Lock.
+"""
+import threading
+from typing import Dict, List, Tuple
+
+from config.settings import SYMBOL_INDEX_CONFIG
+
+
+class SymbolIndex:
+    """
+    🗂️ Symbol → Exchange-Routing per Dict-Lookup
+
+    Attribute:
+        priority (List[str]): Exchange-Reihenfolge für gleichwertige Treffer
+    """
+
+    def __init__(self, priority: List[str] = None):
+        self.priority = list(priority or [])
+        self._markets: Dict[str, Dict[str, Tuple[str, str, str]]] = {}  # exchange → symbol → (base, quote, id)
+        self._by_symbol: Dict[str, Dict[str, str]] = {}
+        self._by_pair: Dict[Tuple[str, str], Dict[str, Tuple[str, str]]] = {}
+        self._lock = threading.Lock()
+
+        # Quote → alle gleichwertigen Quotes (inkl. sich selbst)
+        self._quote_aliases: Dict[str, Tuple[str, ...]] = {}
+        for group in SYMBOL_INDEX_CONFIG['quote_aliases']:
+            for quote in group:
+                self._quote_aliases[quote] = tuple(group)
+
+    # •••••••••••••••••••••••••• Aufbau •••••••••••••••••••••••••• #
+    def update_exchange(self, exchange: str, markets: Dict[str, Dict]) -> None:
+        """
+        Übernimmt die Markets eines (neu) geladenen Exchanges und baut den Index neu
+
+        Args:
+            exchange: Exchange-Name
+            markets: ``exchange.markets`` des geladenen ccxt-Exchanges
+        """
+        compact = {}
+        for symbol, market in markets.items():
+            if market.get('active') is False:
+                continue
+            base, quote = market.get('base'), market.get('quote')
+            if not base or not quote:
+                continue
+            compact[symbol] = (base, quote, market.get('id', symbol))
+
+        with self._lock:
+            self._markets[exchange] = compact
+            self._rebuild()
+
+        print(f"🗂️ Symbol-Index: {exchange} mit {len(compact)} Pairs, "
+              f"{len(self._by_symbol)} Symbole gesamt")
+
+    def remove_exchange(self, exchange: str) -> None:
+        """Entfernt einen Exchange aus dem Index (z.B. wenn er offline geht)"""
+        with self._lock:
+            if self._markets.pop(exchange, None) is not None:
+                self._rebuild()
+
+    def _rebuild(self) -> None:
+        """Baut beide Lookup-Tabellen neu auf und tauscht sie atomar (Lock muss gehalten werden)"""
+        by_symbol: Dict[str, Dict[str, str]] = {}
+        by_pair: Dict[Tuple[str, str], Dict[str, Tuple[str, str]]] = {}
+
+        for exchange in self._ordered(self._markets):
+            for symbol, (base, quote, market_id) in self._markets[exchange].items():
+                by_symbol.setdefault(symbol, {})[exchange] = market_id
+                # Pro (Base, Quote) nur ein Market je Exchange (Spot-Symbol bevorzugt)
+                pair_routes = by_pair.setdefault((base, quote), {})
+                if exchange not in pair_routes or ':' not in symbol:
+                    pair_routes[exchange] = (symbol, market_id)
+
+        self._by_symbol = by_symbol
+        self._by_pair = by_pair
+
+    def _ordered(self, exchanges) -> List[str]:
+        """Exchanges in Prioritätsreihenfolge (unbekannte hinten)"""
+        rank = {name: i for i, name in enumerate(self.priority)}
+        return sorted(exchanges, key=lambda name: rank.get(name, len(rank)))
+
+    # •••••••••••••••••••••••••• Lookup •••••••••••••••••••••••••• #
+    def has_exchange(self, exchange: str) -> bool:
+        """True wenn die Markets des Exchanges im Index sind"""
+        return exchange in self._markets
+
+    def exchanges_for(self, symbol: str) -> List[str]:
+        """Exchanges, die exakt dieses Unified Symbol listen"""
+        return list(self._by_symbol.get(symbol, {}))
+
+    def market_id(self, exchange: str, symbol: str) -> str:
+        """Native Market-ID eines Symbols auf einem Exchange (None wenn nicht gelistet)"""
+        return self._by_symbol.get(symbol, {}).get(exchange)
+
+    def routes(self, symbol: str, aliases: bool = True) -> List[Tuple[str, str, str]]:
+        """
+        🧭 Alle Routen für ein Symbol
+
+        Exakte Treffer kommen zuerst, danach (optional) Treffer mit
+        gleichwertiger Quote-Currency auf Exchanges ohne exakten Treffer.
+
+        Args:
+            symbol: Unified Symbol (z.B. "BTC/USDT")
+            aliases: Quote-Aliase (USD/USDT/USDC) berücksichtigen
+
+        Returns:
+            List[(exchange, market_symbol, market_id)]
+        """
+        by_symbol, by_pair = self._by_symbol, self._by_pair  # Snapshot ohne Lock
+        routes = [(exchange, symbol, market_id)
+                  for exchange, market_id in by_symbol.get(symbol, {}).items()]
+
+        if not aliases or '/' not in symbol:
+            return routes
+
+        base, quote = symbol.split(':')[0].split('/', 1)
+        covered = {exchange for exchange, _, _ in routes}
+        for alias in self._quote_aliases.get(quote, ()):
+            if alias == quote:
+                continue
+            for exchange, (market_symbol, market_id) in by_pair.get((base, alias), {}).items():
+                if exchange not in covered:
+                    routes.append((exchange, market_symbol, market_id))
+                    covered.add(exchange)
+
+        return routes
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._by_symbol
+
+    def __len__(self) -> int:
+        return len(self._by_symbol)
@@ -0,0 +1,94 @@
+# core/timeframes.py - Timeframe-Parsing und Candle-Close-basierte Cache-TTL
+"""
+Timeframes - Hilfsfunktionen rund um Candle-Intervalle
+
+Berechnet für die Timeframes aus ``UI_CONFIG['default_timeframes']``,
+wann die nächste Candle schließt. Daraus ergibt sich die Cache-TTL:
+Daten bleiben bis zum nächsten erwarteten Candle-Close (+ kurze
+Grace-Period) gültig, statt pauschal 5 Minuten.
+
+Ausrichtung der Candles (UTC, wie bei den ccxt-Exchanges):
+- m/h/d/3d: an der Unix-Epoche ausgerichtet
+- 1w: Wochenstart Montag 00:00 UTC
+- 1M: Monatsstart 00:00 UTC
+"""
+import time
+from datetime import datetime, timezone
+from typing import Optional
+
+from config.settings import UI_CONFIG, CACHE_CONFIG
+
+# --- Konstanten ---
+UNIT_SECONDS = {
+    'm': 60,
+    'h': 60 * 60,
+    'd': 24 * 60 * 60,
+    'w': 7 * 24 * 60 * 60,
+    'M': 30 * 24 * 60 * 60,  # Näherung, Close wird kalendarisch berechnet
+}
+
+# Die Epoche (1970-01-01) war ein Donnerstag → Montag liegt 4 Tage später
+WEEK_OFFSET_SECONDS = 4 * UNIT_SECONDS['d']
+
+
+# --- Hilfsfunktionen ---
+def timeframe_to_seconds(timeframe: str) -> int:
+    """
+    Wandelt einen ccxt-Timeframe (z.B. '15m', '4h', '1M') in Sekunden um
+
+    Raises:
+        ValueError: Bei unbekanntem Format
+    """
+    amount, unit = timeframe[:-1], timeframe[-1]
+    if unit not in UNIT_SECONDS or not amount.isdigit():
+        raise ValueError(f"Unbekannter Timeframe: {timeframe}")
+    return int(amount) * UNIT_SECONDS[unit]
+
+
+def next_candle_close(timeframe: str, now: Optional[float] = None) -> float:
+    """
+    Unix-Zeitpunkt (Sekunden), an dem die aktuell laufende Candle schließt
+
+    Args:
+        timeframe: ccxt-Timeframe (z.B. '1h')
+        now: Referenzzeitpunkt (None = jetzt)
+    """
+    now = time.time() if now is None else now
+    unit = timeframe[-1]
+
+    if unit == 'M':
+        months = int(timeframe[:-1])
+        current = datetime.fromtimestamp(now, tz=timezone.utc)
+        month_index = current.year * 12 + current.month - 1
+        next_index = (month_index // months + 1) * months
+        return datetime(next_index // 12, next_index % 12 + 1, 1, tzinfo=timezone.utc).timestamp()
+
+    period = timeframe_to_seconds(timeframe)
+    offset = WEEK_OFFSET_SECONDS if unit == 'w' else 0
+    return (now - offset) // period * period + period + offset
+
+
+def is_candle_aligned(timeframe: str) -> bool:
+    """True wenn Cache-Einträge dieses Timeframes bis zum Candle-Close gültig sind"""
+    return timeframe in UI_CONFIG['default_timeframes']
+
+
+def candle_close_ttl(timeframe: str, now: Optional[float] = None) -> float:
+    """
+    🕯️ Cache-TTL bis zum nächsten Candle-Close plus Grace-Period
+
+    Für Timeframes außerhalb von ``UI_CONFIG['default_timeframes']`` wird
+    die pauschale ``CACHE_CONFIG['ttl_seconds']`` verwendet.
+
+    Args:
+        timeframe: ccxt-Timeframe der gecachten Daten
+        now: Referenzzeitpunkt (None = jetzt)
+
+    Returns:
+        float: Gültigkeit in Sekunden
+    """
+    if not is_candle_aligned(timeframe):
+        return CACHE_CONFIG['ttl_seconds']
+
+    now = time.time() if now is None else now
+    return next_candle_close(timeframe, now) - now + CACHE_CONFIG['ttl_grace_seconds']
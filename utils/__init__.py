@@ -3,14 +3,7 @@
 Utils Module - Hilfsfunktionen und Tools
 """
 
-from .data_validator import DataValidator
-from .timeframe_aggregator import TimeframeAggregator, aggregate_daily_to_timeframe, is_aggregation_needed
+# data_validator / timeframe_aggregator sind (noch) nicht im Repo → nicht hier
+# importieren, sonst scheitert jeder Import eines utils-Submoduls (z.B. utils.logger)
 
-
-__all__ = [
-    'DataValidator',
-    'TimeframeAggregator',
-    'aggregate_daily_to_timeframe',
-    'is_aggregation_needed',
-
-]
\ No newline at end of file
+__all__ = []